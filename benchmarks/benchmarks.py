@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import base64
 import inspect
 import orjson
 import subprocess
@@ -21,13 +22,15 @@ from functools import partial
 from pathlib import Path
 
 import dimod
+import numpy
 import requests
 import requests_mock
 from pydantic import TypeAdapter
 
 from dwave.cloud.client import Client
 from dwave.cloud.api.models import SolverConfiguration
-from dwave.cloud.coders import encode_problem_as_qp
+from dwave.cloud.coders import (
+    encode_problem_as_qp, decode_qp, decode_qp_numpy, _QPEncodingIndex)
 from dwave.cloud.config import ClientConfig
 from dwave.cloud.events import dispatches_events
 from dwave.cloud.solver import StructuredSolver, BQMSolver, CQMSolver, DQMSolver, NLSolver
@@ -170,6 +173,17 @@ class ProblemEncoding:
     def time_encode_qp_from_bqm_to_dict(self, key):
         encode_problem_as_qp(self.solver, dict(self.bqm.linear), dict(self.bqm.quadratic))
 
+    def time_encode_bqm_as_qp(self, key):
+        self.solver._encode_problem_as_qp(
+            self.bqm.linear, self.bqm.quadratic, self.bqm.offset,
+            undirected_biases=True, bqm=self.bqm)
+
+    def time_encode_qp_undirected(self, key):
+        encode_problem_as_qp(self.solver, *self.problem, undirected_biases=True)
+
+    def time_encoding_index(self, key):
+        _QPEncodingIndex(self.solver._encoding_qubits, self.solver._encoding_couplers)
+
     def time_active_qubits(self, key):
         active_qubits(*self.problem)
 
@@ -183,6 +197,45 @@ class ProblemEncoding:
         self.solver.check_problem(self.bqm.linear, self.bqm.quadratic)
 
 
+class AnswerDecoding:
+    version = "2"
+    params = [(100, 1000), (1000, 5000), (10000, 5000)]
+    param_names = ["num_reads, num_qubits"]
+
+    def setup(self, shape):
+        num_reads, num_qubits = shape
+        rng = numpy.random.default_rng(0)
+        active = numpy.arange(num_qubits, dtype='<i4')[rng.random(num_qubits) < 0.95]
+        bits = rng.integers(0, 2, size=(num_reads, len(active)), dtype=numpy.uint8)
+
+        def b64(array):
+            return base64.b64encode(array.tobytes()).decode()
+
+        self.msg = {
+            'type': 'ising',
+            'answer': {
+                'format': 'qp',
+                'num_variables': num_qubits,
+                'energies': b64(rng.random(num_reads)),
+                'num_occurrences': b64(numpy.ones(num_reads, dtype='<i4')),
+                'active_variables': b64(active),
+                'solutions': b64(numpy.packbits(bits, axis=1)),
+            }
+        }
+
+    def time_decode_qp_numpy(self, shape):
+        decode_qp_numpy(deepcopy(self.msg))
+
+    def time_decode_qp_numpy_to_lists(self, shape):
+        decode_qp_numpy(deepcopy(self.msg), return_matrix=False)
+
+    def time_decode_qp(self, shape):
+        decode_qp(deepcopy(self.msg))
+
+    def peakmem_decode_qp_numpy(self, shape):
+        decode_qp_numpy(deepcopy(self.msg))
+
+
 # requires internet access
 class RegionsMetadata:
     version = "1"
@@ -12,11 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import importlib
 import logging
 
 from dwave.cloud.client.base import Client
 from dwave.cloud.package_info import __packagename__, __version__
 
-__all__ = ['Client']
+__all__ = ['Client', 'AsyncClient']
 
 logger = logging.getLogger(__name__)
+
+
+# import asyncio client (and asyncio) only when actually asked for
+def __getattr__(name):
+    if name == 'AsyncClient':
+        return importlib.import_module('dwave.cloud.client.aio').AsyncClient
+
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -0,0 +1,139 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Asyncio interface to D-Wave API clients.
+
+:class:`AsyncClient` wraps a (threaded) :class:`~dwave.cloud.client.Client`
+and exposes its blocking methods as coroutines. Problems are submitted with the
+usual solver methods, and the returned :class:`~dwave.cloud.computation.Future`
+objects are awaitable: resolution is signalled to the event loop directly from
+the client's worker threads, so a pending problem costs only a suspended
+coroutine, and not a thread blocked in an executor.
+
+Examples:
+    This example samples a random Ising problem on a QPU solver from within
+    a coroutine.
+
+    >>> import asyncio
+    >>> from dwave.cloud.client.aio import AsyncClient
+    >>> from dwave.cloud.utils.qubo import generate_random_ising_problem
+    ...
+    >>> async def main():
+    ...     async with AsyncClient.from_config(client='qpu') as client:
+    ...         solver = await client.get_solver()
+    ...         h, J = generate_random_ising_problem(solver)
+    ...         futures = [solver.sample_ising(h, J) for _ in range(10)]
+    ...         return await asyncio.gather(*futures)
+    ...
+    >>> results = asyncio.run(main())     # doctest: +SKIP
+
+"""
+
+import asyncio
+import logging
+from typing import Optional
+
+from dwave.cloud.client.base import Client
+from dwave.cloud.computation import Future
+
+__all__ = ['AsyncClient']
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncClient:
+    """Asyncio interface to a D-Wave API client.
+
+    Args:
+        client (:class:`~dwave.cloud.client.Client`, optional):
+            Client instance to wrap. If omitted, a new
+            :class:`~dwave.cloud.client.Client` is constructed from ``**kwargs``.
+
+        **kwargs:
+            :class:`~dwave.cloud.client.Client` constructor options.
+
+    Note:
+        Network requests are still executed by the wrapped client's worker
+        threads. Methods that block on the API (solver metadata fetch and client
+        shutdown) are offloaded to a thread, so they never block the event loop.
+
+    .. versionadded:: 0.14.0
+    """
+
+    def __init__(self, client: Optional[Client] = None, **kwargs):
+        if client is None:
+            client = Client(**kwargs)
+        elif kwargs:
+            raise ValueError("client options can't be used with a client instance")
+
+        self.client = client
+
+    @classmethod
+    def from_config(cls, config_file=None, profile=None, client=None, **kwargs):
+        """Async client factory method. Arguments are passed through to
+        :meth:`.Client.from_config`.
+
+        Returns:
+            :class:`AsyncClient`
+        """
+        return cls(client=Client.from_config(
+            config_file=config_file, profile=profile, client=client, **kwargs))
+
+    @property
+    def config(self):
+        """Wrapped client's configuration."""
+        return self.client.config
+
+    async def get_solvers(self, refresh=False, order_by='avg_load', **filters):
+        """Coroutine version of :meth:`.Client.get_solvers`."""
+        return await asyncio.to_thread(
+            self.client.get_solvers, refresh=refresh, order_by=order_by, **filters)
+
+    async def get_solver(self, name=None, refresh=False, **filters):
+        """Coroutine version of :meth:`.Client.get_solver`."""
+        return await asyncio.to_thread(
+            self.client.get_solver, name=name, refresh=refresh, **filters)
+
+    def retrieve_answer(self, id_: str) -> Future:
+        """Retrieve a problem by id.
+
+        Non-blocking; await the returned future to get the result.
+
+        Returns:
+            :class:`~dwave.cloud.computation.Future`
+        """
+        return self.client.retrieve_answer(id_)
+
+    def retrieve_answers(self, ids: list[str]) -> list[Future]:
+        """Retrieve multiple problems by id.
+
+        Non-blocking; await the returned futures (e.g. with
+        :func:`asyncio.gather`) to get the results.
+
+        Returns:
+            list[:class:`~dwave.cloud.computation.Future`]
+        """
+        return self.client.retrieve_answers(ids)
+
+    async def close(self, wait: Optional[bool] = None):
+        """Coroutine version of :meth:`.Client.close`."""
+        await asyncio.to_thread(self.client.close, wait=wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close(wait=self.client.DEFAULT_WAIT_ON_CLOSE)
+        return False
@@ -40,8 +40,11 @@ import time
 import copy
 import queue
 import logging
+import multiprocessing
 import operator
 import threading
+import uuid
+import weakref
 
 import base64
 import hashlib
@@ -51,11 +54,12 @@ import zlib
 
 from itertools import chain, zip_longest
 from functools import partial, wraps
-from collections import namedtuple
-from concurrent.futures import ThreadPoolExecutor
-from typing import Optional, Union
+from collections import deque, namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Union
 
 import orjson
+import requests
 from dateutil.parser import parse as parse_datetime
 from plucky import pluck
 
@@ -66,15 +70,23 @@ from dwave.cloud.exceptions import UseAfterCloseError
 from dwave.cloud.computation import Future
 from dwave.cloud.config import load_config, update_config, validate_config_v1
 from dwave.cloud.config import constants as config_constants
-from dwave.cloud.config.models import ClientConfig, PollingStrategy
+from dwave.cloud.config.models import ClientConfig, InFlightPolicy, PollingStrategy
 from dwave.cloud.solver import available_solvers, StructuredSolver, UnstructuredSolver
-from dwave.cloud.concurrency import PriorityThreadPoolExecutor
+from dwave.cloud.concurrency import (
+    AgingPriorityQueue, RateLimiter, SmallestRemainingFirstExecutor, TimerWheel,
+    TokenBucket)
 from dwave.cloud.regions import resolve_endpoints
-from dwave.cloud.upload import ChunkedData
+from dwave.cloud.upload import ChunkedData, ThrottledStream
+from dwave.cloud.download import (
+    MappedSpool, RangedStream, Segment, parse_content_range, spooled_temporary_file)
 from dwave.cloud.events import dispatches_events
+from dwave.cloud.journal import Journal
+from dwave.cloud.upload_cache import UploadCache
 from dwave.cloud.utils.decorators import retried
-from dwave.cloud.utils.http import PretimedHTTPAdapter, BaseUrlSession, default_user_agent
-from dwave.cloud.utils.time import datetime_to_timestamp, utcnow
+from dwave.cloud.utils.http import (
+    PretimedHTTPAdapter, BaseUrlSession, SessionPool, default_user_agent,
+    parse_retry_after)
+from dwave.cloud.utils.time import tictoc, utcnow
 
 __all__ = ['Client']
 
@@ -144,6 +156,120 @@ class Client(object):
             Enable QPU problem data compression on upload to SAPI. Enabled by
             default. Set to ``False`` to disable compression.
 
+        max_in_flight (int, optional):
+            Maximum number of submitted problems not yet resolved. Unlimited by
+            default. When the limit is reached, new problem submissions are
+            handled according to ``in_flight_policy``.
+
+            .. versionadded:: 0.14.0
+
+        max_queued_bytes (int, optional):
+            Maximum total size, in bytes, of encoded problem data held for
+            problems not yet resolved. Unlimited by default. When the limit is
+            reached, new problem submissions are handled according to
+            ``in_flight_policy``.
+
+            .. versionadded:: 0.14.0
+
+        in_flight_policy (str, 'block' | 'raise' | 'defer', default='block'):
+            Problem submit behavior when ``max_in_flight`` or
+            ``max_queued_bytes`` limit is reached. With ``'block'``, sampling
+            methods block until enough in-flight problems are resolved. With
+            ``'raise'``, :exc:`~dwave.cloud.exceptions.InFlightLimitExceeded`
+            is raised. With ``'defer'``, a future is returned immediately, but
+            the problem is submitted only once enough in-flight problems are
+            resolved (note that encoded data of deferred problems is held in
+            memory until then).
+
+            .. versionadded:: 0.14.0
+
+        journal (bool, default=False):
+            Record submitted problems' state transitions (submitted,
+            acknowledged, resolved) in a crash-safe journal on the local disk.
+            Problems left unresolved (e.g. if the process dies) can be
+            retrieved with :meth:`.resume_from_journal`.
+
+            .. versionadded:: 0.14.0
+
+        journal_path (str, optional):
+            Journal database file path. Defaults to a file in the package cache
+            directory (see :func:`~dwave.cloud.config.get_cache_dir`).
+
+            .. versionadded:: 0.14.0
+
+        upload_cache (bool, default=False):
+            Cache IDs of uploaded problem data (e.g. of CQM and NL problems) in
+            a persistent, content-addressed cache on the local disk. Uploading
+            a problem with the same encoded content to the same endpoint then
+            reuses the problem data already uploaded, and the problem is
+            submitted by reference without a new upload.
+
+            .. versionadded:: 0.14.0
+
+        upload_cache_path (str, optional):
+            Upload cache database file path. Defaults to a file in the package
+            cache directory (see :func:`~dwave.cloud.config.get_cache_dir`).
+
+            .. versionadded:: 0.14.0
+
+        upload_cache_maxage (int, default=86400):
+            Time, in seconds, after upload for which cached problem data is
+            reused.
+
+            .. versionadded:: 0.14.0
+
+        upload_concurrency (int, default=4):
+            Maximum number of problems (e.g. CQM and NL models) uploaded
+            concurrently. Part upload slots are shared between problems, with
+            parts of the problem with the least data remaining uploaded first,
+            so a large upload doesn't block smaller ones.
+
+            .. versionadded:: 0.14.0
+
+        upload_bandwidth_limit (int, optional):
+            Aggregate upload bandwidth limit, in bytes per second, shared by
+            all problem uploads. Unlimited by default.
+
+            .. versionadded:: 0.14.0
+
+        encoding_cache_size (int, default=0):
+            Maximum number of encoded QPU problems cached per solver (see
+            :attr:`.StructuredSolver.encoding_cache`). Sampling the same problem
+            repeatedly, e.g. with different parameters, then skips problem
+            encoding. Disabled by default.
+
+            .. versionadded:: 0.14.0
+
+        encoding_processes (int, default=0):
+            Number of worker processes used to check and encode QPU problems
+            given with integer variables (requires NumPy). Problem data is
+            passed to workers in shared memory, so encoding of large problems
+            doesn't hold the GIL of the submitting process. When enabled,
+            problem structure errors are raised by the returned future, and
+            not on submit. Disabled by default (problems are encoded in the
+            calling thread).
+
+            Note: conversion of problem biases to vectors still runs in the
+            calling thread. For a BQM, that's a fast array copy, but for
+            biases given as dicts it takes about as long as the encoding
+            itself, so the speedup for dict problems is limited to about 2x.
+
+            .. versionadded:: 0.14.0
+
+        answer_download_segment_size (int, default=8 MiB):
+            Size, in bytes, of the segments in which binary-ref answers (e.g.
+            of hybrid solvers) are downloaded with HTTP range requests. A failed
+            segment download is retried, resuming from the last byte received.
+
+            .. versionadded:: 0.14.0
+
+        answer_download_parallelism (int, default=4):
+            Number of binary-ref answer segments downloaded concurrently.
+            Segments are written to a memory-mapped temporary file, so large
+            answers are not held in memory.
+
+            .. versionadded:: 0.14.0
+
         headers (dict/str, optional):
             Newline-separated additional HTTP headers to include with each
             API request, or a dictionary of (key, value) pairs.
@@ -319,6 +445,20 @@ class Client(object):
         'polling_timeout': None,
         'connection_close': False,
         'compress_qpu_problem_data': True,
+        'max_in_flight': None,
+        'max_queued_bytes': None,
+        'in_flight_policy': 'block',
+        'journal': False,
+        'journal_path': None,
+        'upload_cache': False,
+        'upload_cache_path': None,
+        'upload_cache_maxage': 86400,
+        'upload_concurrency': 4,
+        'upload_bandwidth_limit': None,
+        'encoding_cache_size': 0,
+        'encoding_processes': 0,
+        'answer_download_segment_size': 8 * 1024 * 1024,
+        'answer_download_parallelism': 4,
         'headers': None,
         'client_cert': None,
         'client_cert_key': None,
@@ -344,18 +484,54 @@ class Client(object):
     _SUBMIT_BATCH_SIZE = 20
     _STATUS_QUERY_SIZE = 100
 
+    # Adaptive submit batching: submit batch size starts at `_SUBMIT_BATCH_SIZE`
+    # and is tuned in [_SUBMIT_BATCH_MIN_SIZE, _SUBMIT_BATCH_MAX_SIZE] to keep
+    # submit request latency close to `_SUBMIT_BATCH_TARGET_LATENCY` [sec].
+    # Batches are filled for up to `_SUBMIT_BATCH_LINGER` seconds, and are
+    # capped at `_SUBMIT_BATCH_MAX_BYTES` of encoded problem data.
+    _SUBMIT_BATCH_MIN_SIZE = 1
+    _SUBMIT_BATCH_MAX_SIZE = 100
+    _SUBMIT_BATCH_TARGET_LATENCY = 1.0
+    _SUBMIT_BATCH_LINGER = 0.005
+    _SUBMIT_BATCH_MAX_BYTES = 10 * 1024 * 1024
+
     # Number of worker threads for each problem processing task
     _SUBMISSION_THREAD_COUNT = 5
-    _UPLOAD_PROBLEM_THREAD_COUNT = 1
     _UPLOAD_PART_THREAD_COUNT = 10
-    _ENCODE_PROBLEM_THREAD_COUNT = _UPLOAD_PROBLEM_THREAD_COUNT
     _CANCEL_THREAD_COUNT = 1
     _POLL_THREAD_COUNT = 5
     _LOAD_THREAD_COUNT = 5
 
+    # Answer load pool scales up to `_LOAD_THREAD_MAX_COUNT` workers with the
+    # load queue backlog. Workers above `_LOAD_THREAD_COUNT` exit after being
+    # idle for `_LOAD_THREAD_IDLE_TIMEOUT` seconds.
+    _LOAD_THREAD_MAX_COUNT = 50
+    _LOAD_THREAD_IDLE_TIMEOUT = 10
+
     # Poll grouping time frame; two scheduled polls are grouped if closer than [sec]:
     _POLL_GROUP_TIMEFRAME = 2
 
+    # Poll scheduler (timer wheel) resolution [sec]
+    _POLL_SCHEDULER_TICK = 0.01
+
+    # Problem priority aging: in submit, poll and load queues, one unit of
+    # problem priority is worth this much queueing time [sec]. Higher-priority
+    # problems are served first, but lower-priority problems that waited long
+    # enough are not starved.
+    _PRIORITY_AGING = 1.0
+
+    # SAPI request rate limits, shared by all worker threads. Maps endpoint
+    # (first path component, e.g. 'problems') to token bucket's
+    # ``(rate [req/sec], capacity)``. Endpoints are not rate limited by default,
+    # but they are paused for the time requested by the server (`Retry-After`)
+    # on 429/503 responses, or for `_THROTTLE_DEFAULT_RETRY_AFTER` seconds if
+    # the server doesn't say. Throttled submit, cancel and load requests are
+    # retried up to `_THROTTLE_MAX_RETRIES` times per problem, after which the
+    # problem's future fails with `SolverThrottledError`.
+    _SAPI_RATE_LIMITS = {}
+    _THROTTLE_DEFAULT_RETRY_AFTER = 1.0
+    _THROTTLE_MAX_RETRIES = 20
+
     # Downloaded solver definition cache config
     _DEFAULT_SOLVERS_STATIC_PART_MAXAGE = 3600  # 1 hour
     _DEFAULT_SOLVERS_DYNAMIC_PART_MAXAGE = 900  # 15 min
@@ -370,12 +546,19 @@ class Client(object):
 
     # Multipart upload parameters
     _UPLOAD_PART_SIZE_BYTES = 5 * 1024 * 1024
+    _UPLOAD_DIGEST_BUFFER_SIZE_BYTES = 64 * 1024
+    # part scheduler aging: bytes of remaining upload size offset per second
+    # a problem waits for a part upload slot
+    _UPLOAD_SCHEDULER_AGING = 1024 * 1024
     _UPLOAD_PART_RETRIES = 2
     _UPLOAD_REQUEST_RETRIES = 2
     _UPLOAD_RETRIES_BACKOFF = lambda retry: 2 ** retry
 
     # Binary-ref answer download parameters
     _DOWNLOAD_ANSWER_THREAD_COUNT = 2
+    _DOWNLOAD_CHUNK_SIZE_BYTES = 64 * 1024
+    _DOWNLOAD_SEGMENT_RETRIES = 2
+    _DOWNLOAD_RETRIES_BACKOFF = lambda retry: 2 ** retry
 
     @classmethod
     def from_config(cls, config_file=None, profile=None, client=None, **kwargs):
@@ -475,6 +658,140 @@ class Client(object):
                 if self._value > 0:
                     self._cond.wait()
 
+    class _AdaptiveBatchSize:
+        """A thread-safe batch size limit, adapted to observed request latency.
+
+        Additive-increase/multiplicative-decrease: the limit grows by one while
+        full batches are processed faster than ``target_latency``, and it's
+        halved when latency exceeds the target.
+        """
+
+        def __init__(self, initial: int, min_size: int, max_size: int,
+                     target_latency: float):
+            self._lock = threading.Lock()
+            self.min_size = min_size
+            self.max_size = max_size
+            self.target_latency = target_latency
+            self._value = max(min_size, min(initial, max_size))
+
+        def __repr__(self):
+            return f"{type(self).__name__}(value={self._value})"
+
+        @property
+        def value(self) -> int:
+            return self._value
+
+        def update(self, batch_size: int, latency: float):
+            with self._lock:
+                if latency > self.target_latency:
+                    self._value = max(self.min_size, self._value // 2)
+                elif batch_size >= self._value:
+                    self._value = min(self.max_size, self._value + 1)
+
+    class _InFlightWindow:
+        """A thread-safe limit on the number, and total encoded size, of
+        problems in flight.
+
+        Problems are admitted with :meth:`.acquire` (blocking or not), or
+        scheduled for admission with :meth:`.defer`. Each admitted problem
+        holds a ticket until it's released with :meth:`.release`. Size of
+        problem data is accounted for (via :meth:`.add_bytes`) only once known,
+        so the size limit is soft.
+        """
+
+        class Ticket:
+            __slots__ = ('nbytes', 'released')
+
+            def __init__(self):
+                self.nbytes = 0
+                self.released = False
+
+        def __init__(self, max_count: Optional[int] = None,
+                     max_bytes: Optional[int] = None):
+            self._cond = threading.Condition()
+            self._deferred = deque()
+            self._closed = False
+            self.max_count = max_count
+            self.max_bytes = max_bytes
+            self.count = 0
+            self.nbytes = 0
+
+        def __repr__(self):
+            return (f"{type(self).__name__}(count={self.count}, "
+                    f"nbytes={self.nbytes}, deferred={len(self._deferred)})")
+
+        def _has_room(self) -> bool:
+            return ((self.max_count is None or self.count < self.max_count)
+                    and (self.max_bytes is None or self.nbytes < self.max_bytes))
+
+        def _admit(self) -> 'Client._InFlightWindow.Ticket':
+            self.count += 1
+            return self.Ticket()
+
+        def acquire(self, blocking: bool = True) -> Optional['Client._InFlightWindow.Ticket']:
+            """Admit a problem, returning its ticket. If the window is full,
+            block until there's room, or return ``None`` if not ``blocking``.
+            """
+            with self._cond:
+                while not self._closed and not self._has_room():
+                    if not blocking:
+                        return None
+                    self._cond.wait()
+
+                if self._closed:
+                    raise UseAfterCloseError("client closed while waiting to submit")
+
+                return self._admit()
+
+        def defer(self, fn: Callable[[Optional['Client._InFlightWindow.Ticket']], None]):
+            """Call ``fn`` with a ticket when the problem is admitted (now, if
+            there's room), in FIFO order, or with ``None`` if the window is
+            closed before that.
+            """
+            with self._cond:
+                if self._closed:
+                    ticket = None
+                elif not self._deferred and self._has_room():
+                    ticket = self._admit()
+                else:
+                    self._deferred.append(fn)
+                    return
+            fn(ticket)
+
+        def add_bytes(self, ticket: 'Client._InFlightWindow.Ticket', nbytes: int):
+            with self._cond:
+                if not ticket.released:
+                    ticket.nbytes += nbytes
+                    self.nbytes += nbytes
+
+        def release(self, ticket: 'Client._InFlightWindow.Ticket'):
+            admitted = []
+            with self._cond:
+                if ticket.released:
+                    return
+                ticket.released = True
+                self.count -= 1
+                self.nbytes -= ticket.nbytes
+
+                while self._deferred and self._has_room():
+                    admitted.append((self._deferred.popleft(), self._admit()))
+
+                self._cond.notify_all()
+
+            for fn, ticket in admitted:
+                fn(ticket)
+
+        def close(self):
+            """Wake up blocked :meth:`.acquire` calls (they raise), and call
+            deferred callbacks with ``None``."""
+            with self._cond:
+                self._closed = True
+                deferred, self._deferred = self._deferred, deque()
+                self._cond.notify_all()
+
+            for fn in deferred:
+                fn(None)
+
     @dispatches_events('client_init')
     def __init__(self, **kwargs):
         logger.debug("Client init called with: %r", kwargs)
@@ -511,8 +828,30 @@ class Client(object):
         if not self.config.token:
             raise ValueError("API token not defined")
 
+        # Limit problems in flight
+        self._in_flight = self._InFlightWindow(
+            max_count=self.config.max_in_flight,
+            max_bytes=self.config.max_queued_bytes)
+
+        # Optional crash-safe journal of problem state transitions
+        self._journal = Journal(self.config.journal_path) if self.config.journal else None
+
+        # Optional persistent cache of uploaded problem data
+        self._upload_cache = None
+        if self.config.upload_cache:
+            self._upload_cache = UploadCache(
+                self.config.upload_cache_path, maxage=self.config.upload_cache_maxage)
+
+        # Per-endpoint SAPI request rate limiter, shared by all workers
+        self._rate_limiter = RateLimiter(self._SAPI_RATE_LIMITS)
+
         # Build the problem submission queue, start its workers
-        self._submission_queue = queue.Queue()
+        self._submission_queue = AgingPriorityQueue(aging=self._PRIORITY_AGING)
+        self._submit_batch_size = self._AdaptiveBatchSize(
+            initial=self._SUBMIT_BATCH_SIZE,
+            min_size=self._SUBMIT_BATCH_MIN_SIZE,
+            max_size=self._SUBMIT_BATCH_MAX_SIZE,
+            target_latency=self._SUBMIT_BATCH_TARGET_LATENCY)
         self._submission_workers = []
         for _ in range(self._SUBMISSION_THREAD_COUNT):
             worker = threading.Thread(target=self._do_submit_problems)
@@ -529,8 +868,9 @@ class Client(object):
             worker.start()
             self._cancel_workers.append(worker)
 
-        # Build the problem status polling queue, start its workers
-        self._poll_queue = queue.PriorityQueue()
+        # Build the problem status polling schedule, start its workers
+        self._poll_queue = TimerWheel(
+            tick=self._POLL_SCHEDULER_TICK, aging=self._PRIORITY_AGING)
         self._poll_workers = []
         for _ in range(self._POLL_THREAD_COUNT):
             worker = threading.Thread(target=self._do_poll_problems)
@@ -539,27 +879,62 @@ class Client(object):
             self._poll_workers.append(worker)
 
         # Build the result loading queue, start its workers
-        self._load_queue = queue.Queue()
+        self._load_queue = AgingPriorityQueue(aging=self._PRIORITY_AGING)
         self._load_workers = []
+        self._load_workers_lock = threading.Lock()
+        self._load_workers_idle = 0
         for _ in range(self._LOAD_THREAD_COUNT):
-            worker = threading.Thread(target=self._do_load_results)
-            worker.daemon = True
-            worker.start()
-            self._load_workers.append(worker)
+            self._start_load_worker(persistent=True)
 
-        # Setup multipart upload executors
+        # Setup multipart upload executors. Part upload slots are shared
+        # between problems uploaded concurrently, smallest remaining first
         self._upload_problem_executor = \
-            ThreadPoolExecutor(self._UPLOAD_PROBLEM_THREAD_COUNT)
+            ThreadPoolExecutor(self.config.upload_concurrency)
 
-        self._upload_part_executor = \
-            PriorityThreadPoolExecutor(self._UPLOAD_PART_THREAD_COUNT)
+        self._upload_part_executor = SmallestRemainingFirstExecutor(
+            self._UPLOAD_PART_THREAD_COUNT, aging=self._UPLOAD_SCHEDULER_AGING)
 
         self._encode_problem_executor = \
-            ThreadPoolExecutor(self._ENCODE_PROBLEM_THREAD_COUNT)
+            ThreadPoolExecutor(self.config.upload_concurrency)
+
+        # Aggregate upload bandwidth limit (one token per byte)
+        self._upload_bandwidth = None
+        if self.config.upload_bandwidth_limit:
+            self._upload_bandwidth = TokenBucket(
+                rate=self.config.upload_bandwidth_limit)
+
+        # Setup (optional) structured problem encoding worker processes
+        self._encode_process_pool = None
+        if self.config.encoding_processes:
+            # avoid forking a multithreaded process
+            start_method = 'spawn'
+            if 'forkserver' in multiprocessing.get_all_start_methods():
+                start_method = 'forkserver'
+            self._encode_process_pool = ProcessPoolExecutor(
+                self.config.encoding_processes,
+                mp_context=multiprocessing.get_context(start_method))
 
         # Setup binary-ref answer download executors
         self._download_answer_executor = \
             ThreadPoolExecutor(self._DOWNLOAD_ANSWER_THREAD_COUNT)
+        self._download_segment_executor = \
+            ThreadPoolExecutor(self.config.answer_download_parallelism)
+
+        # Lazy binary-ref answer streams open (see `_open_answer_binary_ref`)
+        self._answer_streams = weakref.WeakSet()
+        self._answer_streams_lock = threading.Lock()
+
+        # Sessions (and their keep-alive connections) shared by upload and
+        # download executor workers. Note: worker threads above each use
+        # a dedicated session for the thread's lifetime.
+        # (weakref avoids the client <-> pool reference cycle)
+        client_ref = weakref.ref(self)
+        self._session_pool = SessionPool(
+            factory=lambda: client_ref().create_session(),
+            maxsize=(self.config.upload_concurrency
+                     + self._UPLOAD_PART_THREAD_COUNT
+                     + self._DOWNLOAD_ANSWER_THREAD_COUNT
+                     + self.config.answer_download_parallelism))
 
     class _Session(api.client.VersionedAPISessionMixin,
                    api.client.LoggingSessionMixin,
@@ -606,6 +981,21 @@ class Client(object):
         return session
 
     def _shutdown_threads(self, wait: bool = True):
+        # Fail problems still waiting for admission
+        self._in_flight.close()
+
+        # Problems are enqueued for submission once their upload/encoding
+        # is done, so finish that work first
+        logger.debug("Shutting down problem upload executor")
+        self._upload_problem_executor.shutdown(wait=True)
+        logger.debug("Shutting down problem part upload executor")
+        self._upload_part_executor.shutdown(wait=True)
+        logger.debug("Shutting down problem encoder executor")
+        self._encode_problem_executor.shutdown(wait=True)
+        if self._encode_process_pool is not None:
+            logger.debug("Shutting down problem encoder process pool")
+            self._encode_process_pool.shutdown(wait=True)
+
         # Finish all the work that requires the connection
         logger.debug("Joining submission queue")
         self._submission_queue.join()
@@ -616,14 +1006,24 @@ class Client(object):
         logger.debug("Joining load queue")
         self._load_queue.join()
 
-        logger.debug("Shutting down problem upload executor")
-        self._upload_problem_executor.shutdown(wait=True)
-        logger.debug("Shutting down problem part upload executor")
-        self._upload_part_executor.shutdown(wait=True)
-        logger.debug("Shutting down problem encoder executor")
-        self._encode_problem_executor.shutdown(wait=True)
+        # Answer data streams are readable after close, so download what's
+        # left of the streams still open (unless closing without waiting)
+        if wait:
+            with self._answer_streams_lock:
+                streams = list(self._answer_streams)
+            for stream in streams:
+                try:
+                    if not stream.closed:
+                        stream.load_all()
+                except Exception as exc:
+                    logger.debug("Failed to load answer stream on close: %r", exc)
+
         logger.debug("Shutting down answer download executor")
         self._download_answer_executor.shutdown(wait=True)
+        self._download_segment_executor.shutdown(wait=True)
+
+        logger.debug("Closing session pool: %r", self._session_pool)
+        self._session_pool.close()
 
         # Send kill-task to all worker threads
         # Note: threads can't be 'killed' in Python, they have to die by
@@ -632,17 +1032,23 @@ class Client(object):
             self._submission_queue.put(None)
         for _ in self._cancel_workers:
             self._cancel_queue.put(None)
-        for _ in self._poll_workers:
-            self._poll_queue.put((-1, None))
-        for _ in self._load_workers:
+        self._poll_queue.close()
+        with self._load_workers_lock:
+            load_workers = list(self._load_workers)
+        for _ in load_workers:
             self._load_queue.put(None)
 
         # Wait for threads to die
         if wait:
             for worker in chain(self._submission_workers, self._cancel_workers,
-                                self._poll_workers, self._load_workers):
+                                self._poll_workers, load_workers):
                 worker.join()
 
+        if self._journal is not None:
+            self._journal.close()
+        if self._upload_cache is not None:
+            self._upload_cache.close()
+
     def close(self, wait: Optional[bool] = None):
         """Perform a clean shutdown.
 
@@ -734,6 +1140,35 @@ class Client(object):
         """
         return True
 
+    @property
+    def journal(self) -> Optional[Journal]:
+        """Problem journal, if enabled with the ``journal`` config option.
+
+        .. versionadded:: 0.14.0
+        """
+        return self._journal
+
+    @property
+    def upload_cache(self) -> Optional[UploadCache]:
+        """Uploaded problem data cache, if enabled with the ``upload_cache``
+        config option.
+
+        .. versionadded:: 0.14.0
+        """
+        return self._upload_cache
+
+    @property
+    def rate_limiter(self) -> RateLimiter:
+        """SAPI request rate limiter shared by all client worker threads.
+
+        Use :attr:`~dwave.cloud.concurrency.RateLimiter.stats` to inspect
+        per-endpoint limiter state, e.g. to see if (and for how long) requests
+        are being throttled by the server.
+
+        .. versionadded:: 0.14.0
+        """
+        return self._rate_limiter
+
     @property
     @_ensure_active(allow_while_closing=False)
     def solvers_session(self) -> api.resources.Solvers:
@@ -832,6 +1267,81 @@ class Client(object):
         self._load(future)
         return future
 
+    def retrieve_answers(self, ids):
+        """Retrieve multiple problems by id.
+
+        Answers are loaded concurrently, by a pool of workers that scales
+        with the number of problems waiting to be loaded.
+
+        Args:
+            ids (list[str]):
+                Problem IDs, as returned by :attr:`Future.id`.
+
+        Returns:
+            list[:class:`Future`]:
+                Futures in the order of ``ids``. Repeated IDs share a future.
+
+        .. versionadded:: 0.14.0
+        """
+        futures = {}
+        for id_ in ids:
+            if id_ not in futures:
+                futures[id_] = self.retrieve_answer(id_)
+        return [futures[id_] for id_ in ids]
+
+    def resume_from_journal(self):
+        """Retrieve problems acknowledged by the server, but not resolved,
+        according to the client's journal.
+
+        Use it after a crash (or an unclean shutdown) to get the results of
+        problems submitted, with the ``journal`` option enabled, by an earlier
+        client (in this or another process). Only problems submitted to this
+        client's endpoint are resumed. Problems still in progress are polled.
+
+        Problems handled by a live client (one with the journal open) are not
+        resumed. Resumed problems are claimed by this client's journal, so
+        they are not resumed again by other clients while this one is alive.
+
+        Returns:
+            list[:class:`Future`]:
+                Futures of resumed problems, in order of submission.
+
+        Raises:
+            ValueError:
+                Journal is not enabled.
+
+        .. versionadded:: 0.14.0
+        """
+        if self._journal is None:
+            raise ValueError("journal not enabled; see the 'journal' config option")
+
+        entries = self._journal.claim(endpoint=self.config.endpoint)
+        logger.debug("Resuming %d problem(s) from %r", len(entries), self._journal)
+
+        futures = self.retrieve_answers([entry.problem_id for entry in entries])
+        for future in futures:
+            future._journal_key = future.id
+            future.add_done_callback(self._journal_resolved)
+        return futures
+
+    def _journal_record(self, event, future, **fields):
+        self._journal.record(
+            event, future._journal_key, problem_id=future.id,
+            endpoint=self.config.endpoint,
+            solver=getattr(future.solver, 'name', None), **fields)
+
+    def _journal_resolved(self, future):
+        """Record problem resolve in the journal, unless it failed locally
+        (e.g. answer download failed), so it can be resumed later."""
+        if future._exception is not None and \
+                future.remote_status not in self.ANY_STATUS_NO_RESULT:
+            logger.debug("Problem %s failed locally, not marked resolved in "
+                         "journal", future.id)
+            return
+        self._journal_record(
+            Journal.RESOLVED, future,
+            status=future.remote_status or self.STATUS_COMPLETE)
+
     @dispatches_events('get_solvers')
     def get_solvers(self, refresh=False, order_by='avg_load', **filters):
         """Return a filtered list of solvers handled by this client.
@@ -1269,17 +1779,74 @@ class Client(object):
         except IndexError:
             raise SolverNotFoundError("Solver with the requested features not available")
 
-    @_ensure_active(allow_while_closing=False)
     def _submit(self, body, future):
         """Enqueue a problem for submission to the server.
 
+        The problem is put on the submission queue only once its ``body``
+        (a :class:`concurrent.futures.Future`) is resolved, i.e. when
+        encoding (and, for unstructured solvers, upload) is done, so
+        submission workers never see problems that are not ready.
+
+        Problem admission is limited by ``max_in_flight`` and
+        ``max_queued_bytes``, as configured, and handled according to
+        ``in_flight_policy``.
+
         This method is thread safe.
         """
-        self._jobs.inc()
-        self._submission_queue.put(self._submit.Message(body, future))
+        if self._journal is not None:
+            future._journal_key = uuid.uuid4().hex
+            self._journal_record(Journal.SUBMITTED, future)
+            future.add_done_callback(self._journal_resolved)
+
+        policy = self.config.in_flight_policy
+        if policy == InFlightPolicy.DEFER:
+            # admitted later, see `_enqueue_submission`
+            ticket = None
+        else:
+            # note: we might block here, so do it before locking in `_ensure_active`
+            ticket = self._in_flight.acquire(blocking=(policy == InFlightPolicy.BLOCK))
+            if ticket is None:
+                raise InFlightLimitExceeded(
+                    f"in-flight problems limit reached: {self._in_flight!r}")
+
+        try:
+            self._enqueue_submission(self._submit.Message(body, future), ticket)
+        except BaseException:
+            if ticket is not None:
+                self._in_flight.release(ticket)
+            raise
 
     _submit.Message = namedtuple('Message', ['body', 'future'])
 
+    @_ensure_active(allow_while_closing=False)
+    def _enqueue_submission(self, message, ticket=None):
+        """Register submission job, and enqueue ``message`` once its body is
+        resolved. If in-flight window ``ticket`` is not given, the problem
+        waits in the window for admission.
+        """
+        body, future = message
+
+        def enqueue(ticket):
+            if ticket is None:
+                future._set_exception(
+                    UseAfterCloseError("client closed before problem was submitted"))
+                self._jobs.dec()
+                return
+
+            def on_encoded(body):
+                if not body.cancelled() and body.exception() is None:
+                    self._in_flight.add_bytes(ticket, len(body.result()))
+                self._submission_queue.put(message, priority=future._priority)
+
+            future.add_done_callback(lambda _: self._in_flight.release(ticket))
+            body.add_done_callback(on_encoded)
+
+        self._jobs.inc()
+        if ticket is None:
+            self._in_flight.defer(enqueue)
+        else:
+            enqueue(ticket)
+
     def _do_submit_problems(self):
         """Pull problems from the submission queue and submit them.
 
@@ -1291,58 +1858,87 @@ class Client(object):
             self._submission_queue.task_done()
 
         def filter_ready(item):
-            """Pass-through ready (encoded) problems, re-enqueue ones for which
-            the encoding is in progress, and fail the ones for which encoding
-            failed.
-            """
-
-            # body is a `concurrent.futures.Future`, so make sure
-            # it's ready for submitting
-            if item.body.done():
-                exc = item.body.exception()
-                if exc:
-                    # encoding failed, submit should fail as well
-                    logger.info("Problem encoding prior to submit "
-                                "failed with: %r", exc)
-                    item.future._set_exception(exc)
-                    self._jobs.dec()
-                    task_done()
-
-                else:
-                    # problem ready for submit
-                    return [item]
+            """Pass-through encoded problems, and fail the ones for which
+            encoding failed.
 
+            Note: only problems with resolved ``body`` are enqueued for
+            submission (see :meth:`._submit`).
+            """
+            if item.body.cancelled():
+                exc = concurrent.futures.CancelledError()
             else:
-                # body not ready, return the item to queue
-                self._submission_queue.put(item)
+                exc = item.body.exception()
+            if exc:
+                # encoding failed, submit should fail as well
+                logger.info("Problem encoding prior to submit "
+                            "failed with: %r", exc)
+                item.future._set_exception(exc)
+                self._jobs.dec()
                 task_done()
+                return []
+
+            # problem ready for submit
+            return [item]
 
-            return []
+        def size_of(item):
+            return len(item.body.result())
 
         session = self.create_session()
         session.set_accept(media_type='application/vnd.dwave.sapi.problems+json',
                            accept_version='~=3.0', ask_version='3.0.0')
+
+        # problem that didn't fit in the previous batch (due to size limit)
+        carry_over = None
+        stopping = False
+
         try:
-            while True:
-                # Pull as many problems as we can, block on the first one,
-                # but once we have one problem, switch to non-blocking then
-                # submit without blocking again.
+            while not stopping:
+                # Block on the first problem, then linger for up to
+                # `_SUBMIT_BATCH_LINGER` seconds to fill the batch, limited
+                # both by problem count and total size of encoded problems.
 
-                # `None` task is used to signal thread termination
-                item = self._submission_queue.get()
+                if carry_over is not None:
+                    item, carry_over = carry_over, None
+                else:
+                    # `None` task is used to signal thread termination
+                    item = self._submission_queue.get()
 
-                if item is None:
-                    task_done()
-                    break
+                    if item is None:
+                        task_done()
+                        break
 
                 ready_problems = filter_ready(item)
-                while len(ready_problems) < self._SUBMIT_BATCH_SIZE:
+                batch_bytes = sum(map(size_of, ready_problems))
+                max_size = self._submit_batch_size.value
+                deadline = time.monotonic() + self._SUBMIT_BATCH_LINGER
+
+                while len(ready_problems) < max_size:
+                    timeout = deadline - time.monotonic()
                     try:
-                        item = self._submission_queue.get_nowait()
+                        if timeout > 0:
+                            item = self._submission_queue.get(timeout=timeout)
+                        else:
+                            item = self._submission_queue.get_nowait()
                     except queue.Empty:
                         break
 
-                    ready_problems.extend(filter_ready(item))
+                    if item is None:
+                        # submit what we have, then terminate
+                        task_done()
+                        stopping = True
+                        break
+
+                    for problem in filter_ready(item):
+                        problem_bytes = size_of(problem)
+                        if ready_problems and \
+                                batch_bytes + problem_bytes > self._SUBMIT_BATCH_MAX_BYTES:
+                            carry_over = problem
+                        else:
+                            ready_problems.append(problem)
+                            batch_bytes += problem_bytes
+
+                    if carry_over is not None:
+                        break
 
                 if not ready_problems:
                     continue
@@ -1361,9 +1957,29 @@ class Client(object):
                         headers['Content-Encoding'] = 'deflate'
                         logger.debug("Compressed with 'deflate', new size = %d", len(data))
 
-                    message = Client._sapi_request(
-                        session.post, 'problems/', data=data, headers=headers)
-                    logger.debug("Finished submitting %d problems", len(ready_problems))
+                    with tictoc() as timer:
+                        message = Client._sapi_request(
+                            session.post, 'problems/', data=data, headers=headers,
+                            limiter=self._rate_limiter,
+                            default_retry_after=self._THROTTLE_DEFAULT_RETRY_AFTER)
+                    logger.debug("Finished submitting %d problems in %.3f sec",
+                                 len(ready_problems), timer.dt)
+
+                    self._submit_batch_size.update(len(ready_problems), timer.dt)
+
+                except SolverThrottledError as exc:
+                    # endpoint is paused by the rate limiter, so just requeue
+                    logger.debug("Submit throttled for %d problems (retry after "
+                                 "%.2f sec), requeueing", len(ready_problems),
+                                 exc.retry_after)
+                    for msg in ready_problems:
+                        if self._throttle_retry(msg.future):
+                            self._submission_queue.put(msg, priority=msg.future._priority)
+                        else:
+                            msg.future._set_exception(exc)
+                            self._jobs.dec()
+                        task_done()
+                    continue
 
                 except Exception as exc:
                     logger.debug("Submit failed for %d problems with %r",
@@ -1390,6 +2006,15 @@ class Client(object):
         finally:
             session.close()
 
+    def _throttle_retry(self, future):
+        """Count a throttled request retry for ``future``, and return ``True``
+        if the request can be retried (at most `_THROTTLE_MAX_RETRIES` times).
+        """
+        if future is None:
+            return True
+        future._throttle_retries += 1
+        return future._throttle_retries <= self._THROTTLE_MAX_RETRIES
+
     def _handle_problem_status(self, message, future):
         """Handle the results of a problem submission or results request.
 
@@ -1422,6 +2047,10 @@ class Client(object):
             if 'id' not in message:
                 raise InvalidAPIResponseError("'id' missing in problem description response")
 
+            if future.id is None and self._journal is not None:
+                future.id = message['id']
+                self._journal_record(Journal.ACKNOWLEDGED, future)
+
             future.id = message['id']
             future.label = message.get('label')
             future.remote_status = status = message['status']
@@ -1530,7 +2159,19 @@ class Client(object):
                 # body of the delete query.
                 try:
                     ids = orjson.dumps([item[0] for item in item_list])
-                    Client._sapi_request(session.delete, 'problems/', data=ids)
+                    Client._sapi_request(
+                        session.delete, 'problems/', data=ids,
+                        limiter=self._rate_limiter,
+                        default_retry_after=self._THROTTLE_DEFAULT_RETRY_AFTER)
+
+                except SolverThrottledError as exc:
+                    for item in item_list:
+                        _, future = item
+                        if self._throttle_retry(future):
+                            self._cancel_queue.put(item)
+                        else:
+                            future._set_exception(exc)
+                            self._jobs.dec()
 
                 except Exception as exc:
                     for _, future in item_list:
@@ -1571,36 +2212,32 @@ class Client(object):
                     min(future._poll_backoff * self.config.polling_schedule.backoff_base,
                         self.config.polling_schedule.backoff_max))
 
-        # for poll priority we use timestamp of next scheduled poll
-        at = time.time() + future._poll_backoff
+        # schedule next poll on the monotonic clock
+        at = time.monotonic() + future._poll_backoff
 
-        now = utcnow()
-        future_age = (now - future.time_created).total_seconds()
-        logger.debug("Polling scheduled at %.2f with %.2f sec new back-off for: %s (future's age: %.2f sec)",
-                     at, future._poll_backoff, future.id, future_age)
+        future_age = (utcnow() - future.time_created).total_seconds()
+        logger.debug("Polling scheduled in %.2f sec for: %s (future's age: %.2f sec)",
+                     future._poll_backoff, future.id, future_age)
 
         # don't enqueue for next poll if polling_timeout is exceeded by then
-        future_age_on_next_poll = future_age + (at - datetime_to_timestamp(now))
+        future_age_on_next_poll = future_age + future._poll_backoff
         if self.config.polling_timeout is not None and future_age_on_next_poll > self.config.polling_timeout:
             logger.debug("Polling timeout exceeded before next poll: %.2f sec > %.2f sec, aborting polling!",
                          future_age_on_next_poll, self.config.polling_timeout)
             raise PollingTimeout
 
-        self._poll_queue.put((at, future))
+        self._poll_queue.put(future, at=at, priority=future._priority)
 
     def _poll_using_long_polling(self, future: Future) -> None:
-        # we use problem submit time to prioritize polling of jobs submitted earlier
-        created_at = datetime_to_timestamp(future.time_created)
-
         # don't enqueue for next poll if polling_timeout is exceeded by then
-        future_age = time.time() - created_at
+        future_age = (utcnow() - future.time_created).total_seconds()
         if self.config.polling_timeout is not None and future_age > self.config.polling_timeout:
             logger.debug("Polling timeout exceeded before next poll: %.2f sec > %.2f sec, aborting polling!",
                          future_age, self.config.polling_timeout)
             raise PollingTimeout
 
-        # use the same priority queue as for backoff polling
-        self._poll_queue.put((created_at, future))
+        # long poll is due immediately
+        self._poll_queue.put(future, priority=future._priority)
 
     def _do_poll_problems(self):
         """Poll the server for the status of a set of problems.
@@ -1624,44 +2261,31 @@ class Client(object):
 
             def add(future):
                 # add future to query frame_futures
-                # returns: worker lives on?
-
-                # `None` task signifies thread termination
-                if future is None:
-                    task_done()
-                    return False
-
                 if future.id not in frame_futures and not future.done():
                     frame_futures[future.id] = future
                 else:
                     task_done()
 
-                return True
+            # group polls scheduled within the grouping timeframe
+            # (in the long polling case, all polls are due immediately)
+            lookahead = 0 if use_long_polling else self._POLL_GROUP_TIMEFRAME
 
             while True:
                 frame_futures.clear()
 
-                # blocking add first scheduled
-                frame_earliest, future = self._poll_queue.get()
-                if not add(future):
+                # block until the next frame of polls is due;
+                # `None` signifies thread termination
+                frame = self._poll_queue.get(
+                    max_items=self._STATUS_QUERY_SIZE, lookahead=lookahead)
+                if frame is None:
                     return
 
-                # try grouping if scheduled within grouping timeframe
-                # (or in the long polling case, add up to _STATUS_QUERY_SIZE available futures)
-                while len(frame_futures) < self._STATUS_QUERY_SIZE:
-                    try:
-                        task = self._poll_queue.get_nowait()
-                    except queue.Empty:
-                        break
+                for future in frame:
+                    add(future)
 
-                    at, future = task
-                    if use_long_polling or (at - frame_earliest <= self._POLL_GROUP_TIMEFRAME):
-                        if not add(future):
-                            return
-                    else:
-                        self._poll_queue.put(task)
-                        task_done()
-                        break
+                # if futures were cancelled while `add`ing, skip empty frame
+                if not frame_futures:
+                    continue
 
                 # build a query string with ids of all futures in this frame
                 ids = [future.id for future in frame_futures.values()]
@@ -1670,25 +2294,22 @@ class Client(object):
                 if use_long_polling:
                     query_string += f'&timeout={self.config.polling_schedule.wait_time}'
 
-                # if futures were cancelled while `add`ing, skip empty frame
-                if not ids:
-                    continue
-
-                if not use_long_polling:
-                    # wait until `frame_earliest` before polling
-                    delay = frame_earliest - time.time()
-                    if delay > 0:
-                        logger.debug("Pausing polling %.2f sec for futures: %s", delay, ids)
-                        time.sleep(delay)
-                    else:
-                        logger.trace("Skipping non-positive delay of %.2f sec", delay)
-
                 # execute and handle the polling request
                 try:
                     logger.trace("Executing poll API request")
 
                     try:
-                        statuses = Client._sapi_request(session.get, query_string)
+                        statuses = Client._sapi_request(
+                            session.get, query_string, limiter=self._rate_limiter,
+                            default_retry_after=self._THROTTLE_DEFAULT_RETRY_AFTER)
+
+                    except SolverThrottledError as exc:
+                        # reschedule polls; rate limiter holds the next
+                        # request until the server allows it
+                        logger.debug("Polling throttled, retrying in %.2f sec",
+                                     exc.retry_after)
+                        for future in frame_futures.values():
+                            self._poll(future)
 
                     except SAPIError as exc:
                         # assume 5xx errors are transient, and don't abort polling
@@ -1738,9 +2359,27 @@ class Client(object):
 
         This method is thread-safe.
         """
-        self._load_queue.put(future)
+        self._load_queue.put(future, priority=future._priority)
 
-    def _do_load_results(self):
+        # scale the load pool with the backlog
+        with self._load_workers_lock:
+            if (self._load_queue.qsize() > self._load_workers_idle
+                    and len(self._load_workers) < self._LOAD_THREAD_MAX_COUNT):
+                self._start_load_worker(persistent=False)
+
+    def _start_load_worker(self, persistent: bool):
+        """Start an answer load worker. Non-persistent workers exit when idle.
+
+        Note: callers (except the constructor) must hold `_load_workers_lock`.
+        """
+        worker = threading.Thread(
+            target=self._do_load_results, kwargs=dict(persistent=persistent))
+        worker.daemon = True
+        self._load_workers.append(worker)
+        self._load_workers_idle += 1
+        worker.start()
+
+    def _do_load_results(self, persistent: bool = True):
         """Submit a query asking for the results for a particular problem.
 
         To request the results of a problem: ``GET /problems/{problem_id}/``
@@ -1748,34 +2387,68 @@ class Client(object):
         Note:
             This method is always run inside of a daemon thread.
         """
+        timeout = None if persistent else self._LOAD_THREAD_IDLE_TIMEOUT
+
+        def load(future):
+            logger.debug("Loading results of: %s", future.id)
+
+            # Submit the query
+            query_string = 'problems/{}/'.format(future.id)
+
+            try:
+                message = Client._sapi_request(
+                    session.get, query_string, limiter=self._rate_limiter,
+                    default_retry_after=self._THROTTLE_DEFAULT_RETRY_AFTER)
+
+            except SolverThrottledError as exc:
+                if not self._throttle_retry(future):
+                    logger.debug("Answer load throttled too many times: %s", future.id)
+                    future._set_exception(exc)
+                    self._jobs.dec()
+                    return
+
+                logger.debug("Answer load throttled, requeueing: %s", future.id)
+                self._load_queue.put(future, priority=future._priority)
+                return
+
+            except Exception as exc:
+                logger.debug("Answer load request failed with %r", exc)
+                future._set_exception(exc)
+                self._jobs.dec()
+                return
+
+            # Dispatch the results
+            self._handle_problem_status(message, future)
+
         session = self.create_session()
         session.set_accept(media_type='application/vnd.dwave.sapi.problem+json',
                            accept_version='~=3.0', ask_version='3.0.0')
         try:
             while True:
                 # Select a problem
-                future = self._load_queue.get()
+                try:
+                    future = self._load_queue.get(timeout=timeout)
+                except queue.Empty:
+                    # idle for too long, scale down
+                    with self._load_workers_lock:
+                        self._load_workers_idle -= 1
+                        self._load_workers.remove(threading.current_thread())
+                    break
+
+                with self._load_workers_lock:
+                    self._load_workers_idle -= 1
+
                 # `None` task signifies thread termination
                 if future is None:
                     break
-                logger.debug("Loading results of: %s", future.id)
-
-                # Submit the query
-                query_string = 'problems/{}/'.format(future.id)
 
                 try:
-                    message = Client._sapi_request(session.get, query_string)
-
-                except Exception as exc:
-                    logger.debug("Answer load request failed with %r", exc)
-                    future._set_exception(exc)
-                    self._jobs.dec()
+                    load(future)
+                finally:
+                    # mark the task complete
                     self._load_queue.task_done()
-                    continue
-
-                # Dispatch the results, mark the task complete
-                self._handle_problem_status(message, future)
-                self._load_queue.task_done()
+                    with self._load_workers_lock:
+                        self._load_workers_idle += 1
 
         except Exception as err:
             logger.error('Load result error: ' + str(err))
@@ -1803,26 +2476,266 @@ class Client(object):
         return self._download_answer_executor.submit(
             self._download_answer_worker, auth_method=auth_method, url=url, output=output)
 
+    def _open_answer_binary_ref(self, *, auth_method: str, url: str) -> io.IOBase:
+        """Open binary-ref answer data as a lazy, seekable stream.
+
+        Only the first answer segment is downloaded on open, other segments are
+        downloaded as they are read (see :class:`~dwave.cloud.download.RangedStream`).
+        If the server does not support range requests, the complete answer is
+        downloaded on open.
+
+        Args:
+            auth_method:
+                Authentication method used to access data at ``url``.
+
+            url:
+                Answer binary data.
+
+        Returns:
+            :class:`io.IOBase`:
+                Answer data, readable until the stream is closed. On client
+                close (with wait), segments not yet downloaded are downloaded.
+                Otherwise, reading them after client close raises
+                :exc:`~dwave.cloud.exceptions.UseAfterCloseError`.
+        """
+        # note: unlike `_ensure_active`, don't hold the close lock for the
+        # duration of the (first segment) download
+        with self._close_lock:
+            if self._closed:
+                raise UseAfterCloseError(
+                    "_open_answer_binary_ref cannot be called after client has been closed")
+
+        if auth_method != api.constants.BinaryRefAuthMethod.SAPI_TOKEN:
+            raise ValueError(f"Authentication method {auth_method!r} not supported.")
+
+        logger.debug("Opening binary-ref answer at %r using %r method.",
+                     url, auth_method)
+
+        segment_size = self.config.answer_download_segment_size
+
+        with self._session_pool.session() as session:
+            response, content_range = self._request_answer_range(
+                session, url, Segment(0, segment_size))
+
+            if content_range is None:
+                return self._read_answer_stream(response, spooled_temporary_file())
+
+            total_size = content_range[2]
+            stream = RangedStream(
+                size=total_size, segment_size=segment_size,
+                fetch=partial(self._fetch_answer_stream_segment, url),
+                executor=self._download_segment_executor)
+
+            # first segment is read from the response already open
+            try:
+                if total_size:
+                    stream.load(0, fetch=partial(
+                        self._complete_answer_segment, session, url, response))
+                else:
+                    response.close()
+            except:
+                stream.close()
+                raise
+
+        with self._answer_streams_lock:
+            self._answer_streams.add(stream)
+
+        return stream
+
+    def _fetch_answer_stream_segment(self, url: str, segment: Segment,
+                                     write_at: Callable[[int, bytes], int]) -> None:
+        if self._closed:
+            raise UseAfterCloseError(
+                "answer data cannot be downloaded after client has been closed")
+        return self._download_answer_segment_worker(url, segment, write_at)
+
     def _download_answer_worker(self, *, auth_method: str, url: str,
                                 output: Optional[io.IOBase] = None) -> io.IOBase:
         if auth_method != api.constants.BinaryRefAuthMethod.SAPI_TOKEN:
             raise ValueError(f"Authentication method {auth_method!r} not supported.")
-        if output is None:
-            output = io.BytesIO()
 
         logger.debug("Downloading binary-ref answer from %r using %r method.",
                      url, auth_method)
 
-        with self.create_session() as session:
-            size = 0
-            for chunk in session.get(url, stream=True).iter_content(chunk_size=8192):
-                size += output.write(chunk)
-            output.seek(0)
+        segment_size = self.config.answer_download_segment_size
+
+        with self._session_pool.session() as session:
+            # request the first segment; answer size and range support are
+            # learned from the response
+            first = Segment(0, segment_size)
+            response, content_range = self._request_answer_range(session, url, first)
+
+            if content_range is None:
+                # range requests not supported, stream the complete answer
+                if output is None:
+                    output = spooled_temporary_file()
+                return self._read_answer_stream(response, output)
+
+            total_size = content_range[2]
+            first.end = min(first.end, total_size)
+
+            spool = None
+            if output is None:
+                output = spool = MappedSpool(total_size)
+                write_at = output.write_at
+            else:
+                write_at = self._positional_writer(output)
 
-        logger.debug("Answer data downloaded from %r. Written %r bytes.", url, size)
+            # fetch the remaining segments in parallel, while the first one is
+            # read from the response already open
+            futures = [
+                self._download_segment_executor.submit(
+                    self._download_answer_segment_worker, url, segment, write_at)
+                for segment in Segment.split(total_size, segment_size, start=first.end)]
+
+            try:
+                self._complete_answer_segment(session, url, response, first, write_at)
+
+                for future in futures:
+                    future.result()
+
+            except:
+                for future in futures:
+                    future.cancel()
+                concurrent.futures.wait(futures)
+                if spool is not None:
+                    spool.close()
+                raise
+
+        output.seek(0)
+
+        logger.debug("Answer data downloaded from %r in %r segment(s). "
+                     "Written %r bytes.", url, len(futures) + 1, total_size)
 
         return output
 
+    def _download_answer_segment_worker(self, url: str, segment: Segment,
+                                        write_at: Callable[[int, bytes], int]) -> None:
+        with self._session_pool.session() as session:
+            return self._download_answer_segment(session, url, segment, write_at)
+
+    @staticmethod
+    def _positional_writer(output: io.IOBase) -> Callable[[int, bytes], int]:
+        """Make a thread-safe ``write_at(offset, data)`` function for a seekable
+        file-like ``output``."""
+        lock = threading.Lock()
+
+        def write_at(offset, data):
+            with lock:
+                output.seek(offset)
+                return output.write(data)
+
+        return write_at
+
+    @staticmethod
+    def _request_answer_range(session: requests.Session, url: str,
+                              segment: Segment
+                              ) -> tuple[requests.Response, Optional[tuple[int, int, int]]]:
+        """Request answer data in ``segment`` range.
+
+        Returns:
+            Tuple of streamed response and its parsed content range (see
+            :func:`~dwave.cloud.download.parse_content_range`). Content range is
+            ``None`` if the server ignored the range request, and the response
+            contains the complete answer.
+        """
+        response = session.get(url, stream=True,
+                               headers={'Range': segment.range_header})
+
+        content_range = None
+        if response.status_code == 206:
+            content_range = parse_content_range(
+                response.headers.get('Content-Range'))
+        if content_range is None or content_range[0] != segment.offset:
+            return response, None
+
+        return response, content_range
+
+    @staticmethod
+    def _read_answer_stream(response: requests.Response,
+                            output: io.IOBase) -> io.IOBase:
+        """Write the complete ``response`` body to ``output``."""
+        size = 0
+        try:
+            for chunk in response.iter_content(
+                    chunk_size=Client._DOWNLOAD_CHUNK_SIZE_BYTES):
+                size += output.write(chunk)
+        finally:
+            response.close()
+        output.seek(0)
+
+        logger.debug("Answer data downloaded from %r. Written %r bytes.",
+                     response.url, size)
+        return output
+
+    @staticmethod
+    def _read_answer_segment(response: requests.Response, segment: Segment,
+                             write_at: Callable[[int, bytes], int]) -> None:
+        """Write ``response`` body to the answer ``segment``, advancing segment
+        offset as data is received."""
+        try:
+            for chunk in response.iter_content(
+                    chunk_size=Client._DOWNLOAD_CHUNK_SIZE_BYTES):
+                if len(chunk) > segment.remaining:
+                    raise InvalidAPIResponseError(
+                        f"Answer segment {segment!r} data overflow")
+                segment.offset += write_at(segment.offset, chunk)
+        finally:
+            response.close()
+
+        if segment.remaining:
+            raise InvalidAPIResponseError(
+                f"Answer segment {segment!r} incomplete")
+
+    @staticmethod
+    def _complete_answer_segment(session: requests.Session, url: str,
+                                 response: requests.Response, segment: Segment,
+                                 write_at: Callable[[int, bytes], int]) -> None:
+        """Read answer ``segment`` from a ``response`` already open, resuming
+        with range requests if the response is interrupted."""
+        try:
+            Client._read_answer_segment(response, segment, write_at)
+        except Exception as exc:
+            logger.debug("Reading of answer segment failed with %r; "
+                         "resuming from %r.", exc, segment)
+
+        if segment.remaining:
+            Client._download_answer_segment(session, url, segment, write_at)
+
+    @staticmethod
+    @retried(_DOWNLOAD_SEGMENT_RETRIES, backoff=_DOWNLOAD_RETRIES_BACKOFF)
+    def _download_answer_segment(session: requests.Session, url: str,
+                                 segment: Segment,
+                                 write_at: Callable[[int, bytes], int]) -> None:
+        """Download one answer segment with an HTTP range request. Sync http
+        request.
+
+        On retry, download is resumed from the last byte received, as tracked
+        in ``segment.offset``.
+
+        Args:
+            session (:class:`requests.Session`):
+                Session used for the download.
+            url (str):
+                Answer data URL.
+            segment (:class:`~dwave.cloud.download.Segment`):
+                Answer byte range.
+            write_at (callable):
+                Positional writer, called with offset and data received.
+        """
+        if not segment.remaining:
+            return
+
+        logger.debug("Downloading answer segment %r", segment)
+
+        response, content_range = Client._request_answer_range(session, url, segment)
+        if content_range is None or content_range[1] != segment.end - 1:
+            response.close()
+            raise InvalidAPIResponseError(
+                f"Unexpected response to range request for {segment!r}")
+
+        Client._read_answer_segment(response, segment, write_at)
+
     @_ensure_active(allow_while_closing=False)
     def upload_problem_encoded(self, problem, problem_id=None, **kwargs):
         """Initiate multipart problem upload, returning the Problem ID in a
@@ -1848,7 +2761,7 @@ class Client(object):
             self._upload_problem_worker, problem=problem, problem_id=problem_id)
 
     @staticmethod
-    def _sapi_request(meth, *args, **kwargs):
+    def _sapi_request(meth, *args, limiter=None, default_retry_after=None, **kwargs):
         """Execute an HTTP request defined with the ``meth`` callable and
         parse the response and interpret errors in compliance with SAPI REST
         interface.
@@ -1865,6 +2778,15 @@ class Client(object):
             *args, **kwargs (list, dict):
                 Arguments to the ``meth`` callable.
 
+            limiter (:class:`~dwave.cloud.concurrency.RateLimiter`, optional):
+                Rate limiter to acquire the request's endpoint token from before
+                the request, and to pause the endpoint on throttled response.
+
+            default_retry_after (float, optional):
+                Time, in seconds, to pause the endpoint for on throttled
+                response without the `Retry-After` header. Defaults to
+                :attr:`Client._THROTTLE_DEFAULT_RETRY_AFTER`.
+
         Returns:
             dict: JSON decoded body.
 
@@ -1873,6 +2795,12 @@ class Client(object):
             :class:`~dwave.cloud.exceptions.RequestTimeout`.
         """
 
+        # rate limit per endpoint, i.e. path's first component
+        endpoint = None
+        if limiter is not None:
+            endpoint = re.split('[/?]', args[0], maxsplit=1)[0]
+            limiter.acquire(endpoint)
+
         # execute request
         try:
             response = meth(*args, **kwargs)
@@ -1904,6 +2832,19 @@ class Client(object):
             if response.status_code == 401:
                 raise SolverAuthenticationError(error_code=401)
 
+            if response.status_code in (429, 503):
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                if retry_after is None:
+                    retry_after = default_retry_after
+                if retry_after is None:
+                    retry_after = Client._THROTTLE_DEFAULT_RETRY_AFTER
+                if limiter is not None:
+                    limiter.pause(endpoint, retry_after)
+                raise SolverThrottledError(
+                    error_msg=response.text or None,
+                    error_code=response.status_code,
+                    retry_after=retry_after)
+
             try:
                 msg = orjson.loads(response.content)
                 error_msg = msg['error_msg']
@@ -1959,9 +2900,43 @@ class Client(object):
         return Client._checksum_hex(Client._digest(digest))
 
     @staticmethod
-    @retried(_UPLOAD_PART_RETRIES, backoff=_UPLOAD_RETRIES_BACKOFF)
+    def _stream_digest(stream, buffer_size=None):
+        # binary stream => md5(stream data): bytes
+        # note: data is read through a fixed-size buffer, and not copied whole
+        if buffer_size is None:
+            buffer_size = Client._UPLOAD_DIGEST_BUFFER_SIZE_BYTES
+
+        md5 = hashlib.md5()
+        readinto = getattr(stream, 'readinto', None)
+        if readinto is None:
+            for block in iter(partial(stream.read, buffer_size), b''):
+                md5.update(block)
+            return md5.digest()
+
+        buf = bytearray(buffer_size)
+        view = memoryview(buf)
+        while n := readinto(buf):
+            md5.update(view[:n])
+        return md5.digest()
+
+    @staticmethod
+    def _part_digests(chunks):
+        # ChunkedData => {part_no: md5(part data): bytes}
+        return {part_no: Client._stream_digest(chunk)
+                for part_no, chunk in enumerate(chunks, start=1)}
+
+    @staticmethod
+    def _upload_cache_key(size, part_digests):
+        # content hash of problem data: data size and the multipart checksum
+        # (md5 of part digests), as verified by SAPI on parts combine
+        checksums = {part_no: Client._checksum_hex(digest)
+                     for part_no, digest in part_digests.items()}
+        return '{}-{}'.format(size, Client._combined_checksum(checksums))
+
+    @staticmethod
     def _upload_multipart_part(session, problem_id, part_id, part_generator,
-                               uploaded_part_checksum=None):
+                               uploaded_part_checksum=None, part_digest=None,
+                               bandwidth=None):
         """Upload one problem part. Sync http request.
 
         Args:
@@ -1978,6 +2953,11 @@ class Client(object):
                 Checksum of previously uploaded part. Optional, but if specified
                 checksum is verified, and part is uploaded only if checksums
                 don't match.
+            part_digest (bytes/None):
+                Precomputed MD5 digest of part data. If omitted, digest is
+                computed in a streaming pass over part data.
+            bandwidth (:class:`~dwave.cloud.concurrency.TokenBucket`/None):
+                Upload bandwidth limiter, one token per byte. Optional.
 
         Returns:
             Hex digest of part data MD5 checksum.
@@ -1985,15 +2965,11 @@ class Client(object):
 
         logger.debug("Uploading part_id=%r of problem_id=%r", part_id, problem_id)
 
-        # generate the mutable part stream from immutable stream generator
-        part_stream = part_generator()
-
-        # TODO: work-around to get a checksum of a binary stream (avoid 2x read)
-        data = part_stream.read()
-        digest = Client._digest(data)
-        b64digest = Client._checksum_b64(digest)
-        hexdigest = Client._checksum_hex(digest)
-        del data
+        # digest is computed once, through a small fixed-size buffer, and
+        # reused for the checksum check and all upload attempts
+        if part_digest is None:
+            part_digest = Client._stream_digest(part_generator())
+        hexdigest = Client._checksum_hex(part_digest)
 
         if uploaded_part_checksum is not None:
             if hexdigest == uploaded_part_checksum:
@@ -2004,21 +2980,31 @@ class Client(object):
                 logger.debug("Uploaded part checksum does not match. "
                              "Re-uploading part_id=%r.", part_id)
 
-        # rewind the stream after read
-        part_stream.seek(0)
+        Client._put_multipart_part(session, problem_id, part_id, part_generator,
+                                   part_digest, bandwidth=bandwidth)
+
+        logger.debug("Uploaded part_id=%r of problem_id=%r", part_id, problem_id)
+
+        return hexdigest
+
+    @staticmethod
+    @retried(_UPLOAD_PART_RETRIES, backoff=_UPLOAD_RETRIES_BACKOFF)
+    def _put_multipart_part(session, problem_id, part_id, part_generator,
+                            part_digest, bandwidth=None):
+        # generate the mutable part stream from immutable stream generator;
+        # part data is streamed (not loaded in memory) by the http client
+        part_stream = part_generator()
+        if bandwidth is not None:
+            part_stream = ThrottledStream(part_stream, bandwidth)
 
         path = 'bqm/multipart/{problem_id}/part/{part_id}'.format(
             problem_id=problem_id, part_id=part_id)
         headers = {
-            'Content-MD5': b64digest,
+            'Content-MD5': Client._checksum_b64(part_digest),
             'Content-Type': 'application/octet-stream',
         }
 
-        msg = Client._sapi_request(session.put, path, data=part_stream, headers=headers)
-
-        logger.debug("Uploaded part_id=%r of problem_id=%r", part_id, problem_id)
-
-        return hexdigest
+        Client._sapi_request(session.put, path, data=part_stream, headers=headers)
 
     @staticmethod
     @retried(_UPLOAD_REQUEST_RETRIES, backoff=_UPLOAD_RETRIES_BACKOFF)
@@ -2072,12 +3058,13 @@ class Client(object):
         return uploaded_parts
 
     def _upload_part_worker(self, problem_id, part_no, chunk_generator,
-                            uploaded_part_checksum=None):
+                            uploaded_part_checksum=None, part_digest=None):
 
-        with self.create_session() as session:
+        with self._session_pool.session() as session:
             part_checksum = self._upload_multipart_part(
                 session, problem_id, part_id=part_no, part_generator=chunk_generator,
-                uploaded_part_checksum=uploaded_part_checksum)
+                uploaded_part_checksum=uploaded_part_checksum,
+                part_digest=part_digest, bandwidth=self._upload_bandwidth)
 
             return part_no, part_checksum
 
@@ -2094,12 +3081,30 @@ class Client(object):
 
         """
 
-        # in python 3.7+ we could create the session once, on thread init,
-        # via executor initializer
-        with self.create_session() as session:
+        with self._session_pool.session() as session:
             chunks = ChunkedData(problem, chunk_size=self._UPLOAD_PART_SIZE_BYTES)
             size = chunks.total_size
 
+            # look up problem data already uploaded with the same content
+            part_digests = {}
+            cache_key = None
+            if self._upload_cache is not None and problem_id is None:
+                part_digests = self._part_digests(chunks)
+                cache_key = self._upload_cache_key(size, part_digests)
+
+                cached_id = self._upload_cache.get(self.config.endpoint, cache_key)
+                if cached_id is not None:
+                    cached_status = self._failsafe_get_multipart_upload_status(
+                        session, cached_id)
+                    if cached_status.get('status') == 'UPLOAD_COMPLETED':
+                        logger.debug("Problem data found in upload cache "
+                                     "(problem_id=%r), skipping upload.", cached_id)
+                        return cached_id
+
+                    logger.debug("Cached problem data (problem_id=%r) not "
+                                 "available, uploading.", cached_id)
+                    self._upload_cache.discard(self.config.endpoint, cache_key)
+
             if problem_id is None:
                 try:
                     problem_id = self._initiate_multipart_upload(session, size)
@@ -2120,14 +3125,19 @@ class Client(object):
             uploaded_parts = \
                 self._uploaded_parts_from_problem_status(problem_status)
 
-            # enqueue all parts, worker skips if checksum matches
+            # enqueue all parts, worker skips if checksum matches. Parts of
+            # all problems share the upload slots, scheduled by problem's
+            # remaining upload size
             parts = {}
             for chunk_no, chunk_generator in enumerate(chunks.generators()):
                 part_no = chunk_no + 1
+                part_size = min(chunks.chunk_size, size - chunk_no * chunks.chunk_size)
                 part_future = self._upload_part_executor.submit(
                     self._upload_part_worker,
                     problem_id, part_no, chunk_generator,
-                    uploaded_part_checksum=uploaded_parts.get(part_no))
+                    uploaded_part_checksum=uploaded_parts.get(part_no),
+                    part_digest=part_digests.get(part_no),
+                    group=problem_id, size=part_size)
 
                 parts[part_no] = part_future
 
@@ -2179,4 +3189,7 @@ class Client(object):
                 logger.error(errmsg)
                 raise ProblemUploadError(errmsg) from e
 
+            if cache_key is not None:
+                self._upload_cache.put(self.config.endpoint, cache_key, problem_id)
+
             return problem_id
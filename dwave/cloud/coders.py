@@ -14,9 +14,13 @@
 
 import struct
 import base64
+import functools
+import hashlib
+import operator
 import warnings
-from collections import abc
-from typing import Union
+from collections import OrderedDict, abc
+from itertools import chain
+from typing import Optional, Union
 
 try:
     # note: TypedDict is available in py38+, but NotRequired only in py311+
@@ -24,10 +28,22 @@ try:
 except ImportError:
     from typing_extensions import NotRequired, TypedDict
 
+import orjson
+
+from dwave.cloud.concurrency import SharedArrays
+from dwave.cloud.exceptions import ProblemStructureError
 from dwave.cloud.utils.qubo import uniform_get, active_qubits
 
+# Use numpy if available for fast encoding
+try:
+    import numpy
+    _numpy = True
+except ImportError:
+    _numpy = False
+
 __all__ = [
-    'encode_problem_as_qp', 'decode_qp', 'decode_qp_numpy', 'decode_qp_problem',
+    'encode_problem_as_qp', 'decode_qp', 'decode_qp_numpy', 'decode_qp_field',
+    'decode_qp_problem',
     'encode_problem_as_bq', 'decode_bq',
     'encode_problem_as_ref', 'decode_binary_ref',
     'bqm_as_file',
@@ -47,6 +63,284 @@ class QuadraticProblem(TypedDict):
     offset: NotRequired[float]
 
 
+class _QPEncodingIndex:
+    """Maps from qubits and couplers to their positions in the ``qp`` problem
+    encoding of a structured solver, used for vectorized encoding.
+
+    Qubit positions are looked up in a dense table indexed by qubit. Couplers
+    (in both directions) are keyed with ``u * size + v``, and looked up with
+    binary search in the sorted keys array. Coupler position is stored for the
+    direction listed by the solver, and its bitwise complement for the
+    reverse direction.
+
+    Note: requires numpy.
+    """
+
+    def __init__(self, qubits: list[int], couplers: list[tuple[int, int]]):
+        qubits = numpy.asarray(qubits, dtype=numpy.int64)
+        couplers = numpy.asarray(couplers, dtype=numpy.int64).reshape(-1, 2)
+
+        self.num_qubits = len(qubits)
+        self.num_couplers = len(couplers)
+        self.size = int(max(qubits.max(initial=-1), couplers.max(initial=-1))) + 1
+
+        self.qubit_lut = numpy.full(self.size, -1, dtype=numpy.intp)
+        self.qubit_lut[qubits] = numpy.arange(self.num_qubits)
+
+        # couplers' endpoints positions
+        self.coupler_u = self.qubit_lut[couplers[:, 0]]
+        self.coupler_v = self.qubit_lut[couplers[:, 1]]
+
+        positions = numpy.arange(self.num_couplers, dtype=numpy.intp)
+        keys = numpy.concatenate((couplers[:, 0] * self.size + couplers[:, 1],
+                                  couplers[:, 1] * self.size + couplers[:, 0]))
+        positions = numpy.concatenate((positions, ~positions))
+        order = numpy.argsort(keys, kind='stable')
+        self.coupler_keys = keys[order]
+        self.coupler_positions = positions[order]
+
+    _SHARED_FIELDS = ('qubit_lut', 'coupler_u', 'coupler_v',
+                      'coupler_keys', 'coupler_positions')
+
+    def share(self) -> SharedArrays:
+        """Copy the index to shared memory, for use in worker processes (see
+        :meth:`.from_shared`)."""
+        sizes = numpy.array([self.num_qubits, self.num_couplers, self.size])
+        return SharedArrays([sizes, *(getattr(self, f) for f in self._SHARED_FIELDS)])
+
+    @classmethod
+    def from_shared(cls, shared: SharedArrays) -> '_QPEncodingIndex':
+        """Construct the index from its shared memory copy (see :meth:`.share`),
+        without copying."""
+        index = cls.__new__(cls)
+        # keep the block attached for as long as the views are in use
+        index._shared = shared
+        sizes, *arrays = shared.arrays
+        index.num_qubits, index.num_couplers, index.size = map(int, sizes)
+        for field, array in zip(cls._SHARED_FIELDS, arrays):
+            setattr(index, field, array)
+        return index
+
+    def close(self) -> None:
+        """Release views of the shared memory copy, and detach from it (for
+        index constructed with :meth:`.from_shared`)."""
+        shared = getattr(self, '_shared', None)
+        if shared is None:
+            return
+        for field in self._SHARED_FIELDS:
+            setattr(self, field, None)
+        self._shared = None
+        shared.close()
+
+    def qubit_positions(self, qubits: 'numpy.ndarray') -> 'numpy.ndarray':
+        """Encoding positions of ``qubits``, -1 for qubits not on solver."""
+        valid = (qubits >= 0) & (qubits < self.size)
+        positions = numpy.full(len(qubits), -1, dtype=numpy.intp)
+        positions[valid] = self.qubit_lut[qubits[valid]]
+        return positions
+
+    @staticmethod
+    def _as_labels(labels: abc.Iterable) -> 'numpy.ndarray':
+        # integer variable labels as int64 array (floats are accepted only if
+        # integral, to match dict lookup semantics); strings, bools and other
+        # objects are rejected, as they never match integer qubit labels
+        values = numpy.asarray(list(labels))
+        if values.dtype.kind in 'iu':
+            return values.astype(numpy.int64)
+        if values.dtype.kind != 'f':
+            raise TypeError("non-integer variable labels")
+        ints = values.astype(numpy.int64)
+        if not numpy.array_equal(ints, values):
+            raise ValueError("non-integer variable labels")
+        return ints
+
+    @staticmethod
+    def _as_biases(biases: abc.Iterable) -> 'numpy.ndarray':
+        # real-valued biases as float64 array
+        values = numpy.asarray(list(biases))
+        if values.dtype.kind not in 'iuf':
+            raise TypeError("non-numeric biases")
+        values = values.astype(numpy.float64)
+        if numpy.isnan(values).any():
+            raise ValueError("NaN biases")
+        return values
+
+    def problem_vectors(self, linear: dict, quadratic: dict) -> tuple['numpy.ndarray', ...]:
+        """Return problem in vector form, ``(lin_qubits, lin_biases, u, v,
+        quad_biases)``, as accepted by :meth:`.encode_vectors`.
+
+        Raises:
+            TypeError/ValueError:
+                Variables are not integers or biases are not real numbers.
+        """
+        lin_qubits = self._as_labels(linear.keys())
+        lin_biases = self._as_biases(linear.values())
+        edges = self._as_labels(chain.from_iterable(quadratic.keys())).reshape(-1, 2)
+        quad_biases = self._as_biases(quadratic.values())
+        return lin_qubits, lin_biases, edges[:, 0], edges[:, 1], quad_biases
+
+    def bqm_vectors(self, bqm: 'dimod.BinaryQuadraticModel') -> tuple['numpy.ndarray', ...]:
+        """Return ``bqm`` in vector form, ``(lin_qubits, lin_biases, u, v,
+        quad_biases)``, as accepted by :meth:`.encode_vectors`.
+
+        Vectors are read from the bqm directly, without expansion to dicts.
+        Each interaction is listed once, so quadratic biases are undirected.
+
+        Raises:
+            TypeError/ValueError:
+                Variables are not integers.
+        """
+        ldata, (irow, icol, qdata), _, labels = bqm.to_numpy_vectors(
+            sort_indices=False, sort_labels=False, return_labels=True)
+        labels = self._as_labels(labels)
+        return (labels, ldata.astype(numpy.float64, copy=False),
+                labels[irow], labels[icol], qdata.astype(numpy.float64, copy=False))
+
+    @staticmethod
+    def digest(vectors: tuple['numpy.ndarray', ...]) -> bytes:
+        """Content hash of a problem in vector form."""
+        h = hashlib.blake2b(digest_size=16)
+        for vector in vectors:
+            vector = numpy.ascontiguousarray(vector)
+            h.update(struct.pack('<Q', vector.size))
+            h.update(vector.dtype.str.encode('ascii'))
+            h.update(vector)
+        return h.digest()
+
+    def encode(self, linear: dict, quadratic: dict, undirected_biases: bool = False
+               ) -> tuple['numpy.ndarray', 'numpy.ndarray']:
+        """Return ``qp``-encoded linear and quadratic biases as float64 arrays.
+
+        Raises:
+            TypeError/ValueError:
+                Variables are not integers or biases are not real numbers.
+        """
+        lin, quad, _ = self.encode_vectors(
+            *self.problem_vectors(linear, quadratic),
+            undirected_biases=undirected_biases)
+        return lin, quad
+
+    def encode_vectors(self,
+                       lin_qubits: 'numpy.ndarray',
+                       lin_biases: 'numpy.ndarray',
+                       u: 'numpy.ndarray',
+                       v: 'numpy.ndarray',
+                       quad_biases: 'numpy.ndarray',
+                       undirected_biases: bool = False,
+                       ) -> tuple['numpy.ndarray', 'numpy.ndarray', bool]:
+        """Encode problem given in vector form: linear biases ``lin_biases``
+        on ``lin_qubits``, and quadratic biases ``quad_biases`` on ``(u, v)``
+        edges.
+
+        Returns ``qp``-encoded linear and quadratic biases as float64 arrays,
+        and a flag indicating whether all problem variables and interactions
+        are supported by the solver graph. Unsupported terms are not encoded.
+        """
+        lin_pos = self.qubit_positions(lin_qubits)
+        u_pos = self.qubit_positions(u)
+        v_pos = self.qubit_positions(v)
+
+        # active qubits: with bias or coupling attached
+        active = numpy.zeros(self.num_qubits, dtype=bool)
+        for pos in (lin_pos, u_pos, v_pos):
+            active[pos[pos >= 0]] = True
+
+        # inactive qubits are encoded with NaN, active with bias (0 default)
+        lin = numpy.full(self.num_qubits, numpy.nan)
+        lin[active] = 0
+        lin_on_solver = lin_pos >= 0
+        lin[lin_pos[lin_on_solver]] = lin_biases[lin_on_solver]
+
+        # couplers lookup
+        found = (u_pos >= 0) & (v_pos >= 0)
+        if len(self.coupler_keys):
+            keys = numpy.where(found, u * self.size + v, -1)
+            idx = numpy.searchsorted(self.coupler_keys, keys)
+            idx[idx >= len(self.coupler_keys)] = 0
+            found &= self.coupler_keys[idx] == keys
+            pos = self.coupler_positions[idx[found]]
+        else:
+            found[:] = False
+            pos = numpy.empty(0, dtype=numpy.intp)
+        biases = numpy.asarray(quad_biases, dtype=numpy.float64)[found]
+
+        forward = pos >= 0
+        if undirected_biases:
+            # quadratic biases are given in a triangular or symmetric matrix;
+            # bias on the solver-listed direction takes precedence
+            quad = numpy.zeros(self.num_couplers)
+            quad[~pos[~forward]] = biases[~forward]
+            quad[pos[forward]] = biases[forward]
+        else:
+            # quadratic biases are defined on directed edges, conflate with sum
+            quad = numpy.bincount(numpy.where(forward, pos, ~pos), weights=biases,
+                                  minlength=self.num_couplers)
+
+        # only couplers between active qubits are encoded
+        quad = quad[active[self.coupler_u] & active[self.coupler_v]]
+
+        fits = bool(lin_on_solver.all() and found.all())
+
+        return lin, quad, fits
+
+
+def _encode_doubles(values) -> str:
+    """Encode a float64 numpy array as base64 of little endian doubles."""
+    return base64.b64encode(values.astype('<f8', copy=False).tobytes()).decode('utf-8')
+
+
+# encoding indices attached in a worker process, by shared memory block name,
+# in least recently used order. Only a few are kept attached, so that blocks
+# of solvers no longer used (and unlinked by the parent) are released.
+_WORKER_ENCODING_INDICES_MAXSIZE = 4
+_worker_encoding_indices = OrderedDict()
+
+def _encode_qp_body(index: SharedArrays, problem: SharedArrays,
+                    undirected_biases: bool, offset: float, body: dict,
+                    solver_repr: str, return_encoded: bool = False):
+    """Encode problem given in vector form in shared memory (see
+    :meth:`_QPEncodingIndex.encode_vectors`) in ``qp`` format, and return
+    JSON-serialized submit ``body`` with the encoded problem data.
+
+    Runs in a worker process. Solver's encoding ``index`` is attached once per
+    process, and kept attached while among the most recently used few. If
+    ``return_encoded`` is set, a tuple of the body and the encoded linear and
+    quadratic biases is returned.
+    """
+    encoding_index = _worker_encoding_indices.get(index.name)
+    if encoding_index is None:
+        encoding_index = _worker_encoding_indices[index.name] = \
+            _QPEncodingIndex.from_shared(index)
+        while len(_worker_encoding_indices) > _WORKER_ENCODING_INDICES_MAXSIZE:
+            _, evicted = _worker_encoding_indices.popitem(last=False)
+            evicted.close()
+    else:
+        _worker_encoding_indices.move_to_end(index.name)
+        index.close()
+
+    try:
+        lin, quad, fits = encoding_index.encode_vectors(
+            *problem.arrays, undirected_biases=undirected_biases)
+    finally:
+        problem.close()
+
+    if not fits:
+        raise ProblemStructureError(f"Problem graph incompatible with {solver_repr}")
+
+    encoded = (_encode_doubles(lin), _encode_doubles(quad))
+    body['data'] = {
+        'format': 'qp',
+        'lin': encoded[0],
+        'quad': encoded[1],
+        'offset': offset
+    }
+    body = orjson.dumps(body, option=orjson.OPT_SERIALIZE_NUMPY)
+
+    if return_encoded:
+        return body, *encoded
+    return body
+
+
 def encode_problem_as_qp(solver: 'dwave.cloud.solver.StructuredSolver',
                          linear: Union[list[float], dict[int, float]],
                          quadratic: dict[tuple[int, int], float],
@@ -79,6 +373,22 @@ def encode_problem_as_qp(solver: 'dwave.cloud.solver.StructuredSolver',
     if isinstance(linear, abc.Sequence):
         linear = dict(enumerate(linear))
 
+    # Vectorized encoding, using solver's precomputed index maps
+    if _numpy:
+        try:
+            lin, quad = solver._encoding_index.encode(
+                linear, quadratic, undirected_biases=undirected_biases)
+        except (TypeError, ValueError, OverflowError):
+            # non-integer variables or non-real biases; use generic encoder
+            pass
+        else:
+            return {
+                'format': 'qp',
+                'lin': _encode_doubles(lin),
+                'quad': _encode_doubles(quad),
+                'offset': offset
+            }
+
     active = active_qubits(linear, quadratic)
 
     # Encode linear terms. The coefficients of the linear terms of the objective
@@ -147,63 +457,37 @@ def decode_qp_problem(solver: 'dwave.cloud.solver.StructuredSolver',
     return QuadraticProblem(linear=linear, quadratic=quadratic, offset=offset)
 
 
-def decode_qp(msg):
+# base64-encoded array fields of a `qp` answer
+_QP_ANSWER_FIELDS = ('energies', 'num_occurrences', 'active_variables', 'solutions')
+
+
+def _decode_qp_fields(msg, decoded, **kwargs):
+    # decode array fields of a `qp` answer (from the raw answer, before it's
+    # updated), reusing fields in `decoded`
+    answer = msg['answer']
+    fields = {field: value for field, value in (decoded or {}).items()
+              if field in _QP_ANSWER_FIELDS}
+    for field in _QP_ANSWER_FIELDS:
+        if field not in fields and (field != 'num_occurrences' or field in answer):
+            fields[field] = decode_qp_field(
+                msg, field, active_variables=fields.get('active_variables'), **kwargs)
+    return fields
+
+
+def decode_qp(msg, decoded=None):
     """Decode SAPI response that uses `qp` format, without numpy.
 
     The 'qp' format is the current encoding used for problems and samples.
     In this encoding the reply is generally json, but the samples, energy,
     and histogram data (the occurrence count of each solution), are all
     base64 encoded arrays.
+
+    Fields already decoded with :func:`decode_qp_field` (using the same
+    options) can be given in ``decoded``, to be reused.
     """
-    # Decode the simple buffers
     result = msg['answer']
-    result['active_variables'] = _decode_ints(result['active_variables'])
-    active_variables = result['active_variables']
-    if 'num_occurrences' in result:
-        result['num_occurrences'] = _decode_ints(result['num_occurrences'])
-    result['energies'] = _decode_doubles(result['energies'])
-
-    # adjust energies by offset (in future this might be handled by SAPI)
-    offset = result.setdefault('offset', 0)
-    if offset:
-        result['energies'] = [en + offset for en in result['energies']]
-
-    # Measure out the size of the binary solution data
-    num_solutions = len(result['energies'])
-    num_variables = len(result['active_variables'])
-    solution_bytes = -(-num_variables // 8)  # equivalent to int(math.ceil(num_variables / 8.))
-    total_variables = result['num_variables']
-
-    # Figure out the null value for output
-    default = 3 if msg['type'] == 'qubo' else 0
-
-    # Decode the solutions, which will be byte aligned in binary format
-    binary = base64.b64decode(result['solutions'])
-    solutions = []
-    for solution_index in range(num_solutions):
-        # Grab the section of the buffer related to the current
-        buffer_index = solution_index * solution_bytes
-        solution_buffer = binary[buffer_index:buffer_index + solution_bytes]
-        bytes = struct.unpack('B' * solution_bytes, solution_buffer)
-
-        # Assume None values
-        solution = [default] * total_variables
-        index = 0
-        for byte in bytes:
-            # Parse each byte and read how ever many bits can be
-            values = _decode_byte(byte)
-            for _ in range(min(8, len(active_variables) - index)):
-                i = active_variables[index]
-                index += 1
-                solution[i] = values.pop()
-
-        # Switch to the right variable space
-        if msg['type'] == 'ising':
-            values = {0: -1, 1: 1}
-            solution = [values.get(v, default) for v in solution]
-        solutions.append(solution)
-
-    result['solutions'] = solutions
+    result.update(_decode_qp_fields(msg, decoded, use_numpy=False))
+    result.setdefault('offset', 0)
 
     # include problem type
     if 'type' in msg:
@@ -212,21 +496,155 @@ def decode_qp(msg):
     return result
 
 
-def _decode_byte(byte):
-    """Helper for decode_qp, turns a single byte into a list of bits.
+def decode_qp_field(msg: dict, field: str, use_numpy: bool = True,
+                    return_matrix: bool = True,
+                    active_variables: Optional[abc.Sequence[int]] = None):
+    """Decode a single array field of SAPI response that uses `qp` format,
+    without decoding (or modifying) the rest of the response.
 
     Args:
-        byte (int):
-            Byte to be decoded.
+        msg:
+            SAPI response with answer in `qp` format.
+        field:
+            One of ``energies``, ``num_occurrences``, ``active_variables`` or
+            ``solutions``.
+        use_numpy:
+            Decode using numpy (see :func:`decode_qp_numpy`), or in pure Python
+            (see :func:`decode_qp`).
+        return_matrix:
+            When decoding with numpy, return a numpy array (instead of a list).
+        active_variables:
+            Already decoded ``active_variables`` field, used when decoding
+            ``solutions``. Decoded from ``msg`` if not given.
 
     Returns:
-        List of bits corresponding to byte.
+        Decoded field, same as the one in the full answer decoded with
+        :func:`decode_qp_numpy` or :func:`decode_qp`.
+
+    .. versionadded:: 0.14.0
     """
-    bits = []
-    for _ in range(8):
-        bits.append(byte & 1)
-        byte >>= 1
-    return bits
+    if field not in _QP_ANSWER_FIELDS:
+        raise ValueError(f"unknown qp answer field: {field!r}")
+
+    answer = msg['answer']
+    offset = answer.get('offset', 0)
+
+    if not use_numpy:
+        if field == 'energies':
+            energies = _decode_doubles(answer['energies'])
+            # adjust energies by offset (in future this might be handled by SAPI)
+            if offset:
+                energies = [en + offset for en in energies]
+            return energies
+
+        elif field in ('num_occurrences', 'active_variables'):
+            return _decode_ints(answer[field])
+
+        # Measure out the size of the binary solution data
+        num_solutions = len(base64.b64decode(answer['energies'])) // 8
+        if active_variables is None:
+            active_variables = _decode_ints(answer['active_variables'])
+        total_variables = answer['num_variables']
+
+        # Decode the solutions, which will be byte aligned in binary format
+        binary = base64.b64decode(answer['solutions'])
+        return _decode_qp_solutions_generic(
+            binary, num_solutions, active_variables, total_variables, msg['type'])
+
+    import numpy as np
+
+    # Build some little endian type encodings
+    double_type = np.dtype(np.double).newbyteorder('<')
+    int_type = np.dtype(np.int32).newbyteorder('<')
+
+    if field == 'energies':
+        value = np.frombuffer(base64.b64decode(answer['energies']),
+                              dtype=double_type)
+        # adjust energies by offset (in future this might be handled by SAPI)
+        if offset:
+            # we need to make a copy because frombuffer returns read-only array
+            value = value + offset
+
+    elif field in ('num_occurrences', 'active_variables'):
+        value = np.frombuffer(base64.b64decode(answer[field]), dtype=int_type)
+
+    else:
+        if active_variables is None:
+            active_variables = np.frombuffer(
+                base64.b64decode(answer['active_variables']), dtype=int_type)
+
+        # Decode the solutions, which will be a continuous run of bits
+        value = _decode_qp_solutions(
+            answer['solutions'],
+            num_solutions=len(base64.b64decode(answer['energies'])) // 8,
+            active_variables=np.asarray(active_variables),
+            total_variables=answer['num_variables'],
+            problem_type=msg['type'])
+
+    # If the final result shouldn't be numpy formats switch back to python objects
+    if not return_matrix:
+        value = value.tolist()
+
+    return value
+
+
+@functools.cache
+def _qp_bits_table(problem_type: str) -> tuple[tuple[int, ...], ...]:
+    """Byte to values of its bits (most significant bit first) lookup table,
+    with values as spins for ``ising``, or as bits otherwise. Pure-Python
+    version of :func:`_qp_unpack_table`."""
+    values = (-1, 1) if problem_type == 'ising' else (0, 1)
+    return tuple(tuple(values[(byte >> shift) & 1] for shift in range(7, -1, -1))
+                 for byte in range(256))
+
+
+def _decode_qp_solutions_generic(binary: bytes, num_solutions: int,
+                                 active_variables: tuple[int, ...],
+                                 total_variables: int,
+                                 problem_type: str) -> list[list[int]]:
+    """Decode bit-packed ``binary`` solutions (byte-aligned rows of
+    ``active_variables`` values) into a list of ``num_solutions`` lists of
+    ``total_variables`` values, without numpy.
+
+    Each row's bytes are expanded via a lookup table, and then gathered (with
+    inactive variables filled in) into a solution in one C-level call.
+    """
+    num_variables = len(active_variables)
+    row_bytes = -(-num_variables // 8)
+
+    # Figure out the null value for output
+    # note: for ising problems, inactive variables are set to -1 (unlike in
+    # `decode_qp_numpy`), as they always have been by this decoder
+    default = {'qubo': 3, 'ising': -1}.get(problem_type, 0)
+
+    # gather index for each output variable: its position in the unpacked row,
+    # or the position of `default` appended to the row
+    missing = row_bytes * 8
+    gather = [missing] * total_variables
+    for position, variable in enumerate(active_variables):
+        if 0 <= variable < total_variables:
+            gather[variable] = position
+
+    if total_variables == 0:
+        return [[] for _ in range(num_solutions)]
+    elif total_variables == 1:
+        position = gather[0]
+        getter = lambda row: (row[position], )
+    else:
+        getter = operator.itemgetter(*gather)
+
+    table = _qp_bits_table(problem_type)
+    lookup = table.__getitem__
+    buffer = memoryview(binary)
+
+    solutions = []
+    for index in range(num_solutions):
+        start = index * row_bytes
+        row = list(chain.from_iterable(map(lookup, buffer[start:start + row_bytes])))
+        row.append(default)
+        solutions.append(list(getter(row)))
+
+    return solutions
 
 
 def _decode_ints(message):
@@ -265,79 +683,105 @@ def _decode_doubles(message):
     return struct.unpack('<' + ('d' * (len(binary) // 8)), binary)
 
 
-def decode_qp_numpy(msg, return_matrix=True):
-    """Decode SAPI response, results in a `qp` format, explicitly using numpy.
-    If numpy is not installed, the method will fail.
+# packed solutions size decoded at once by `_decode_qp_solutions` [bytes]
+_QP_DECODE_BLOCK_BYTES = 1 << 18
 
-    To use numpy for decoding, but return the results as lists (instead of
-    numpy matrices), set `return_matrix=False`.
+
+@functools.cache
+def _qp_unpack_table(problem_type: str) -> 'numpy.ndarray':
+    """Byte to values of its bits (most significant bit first) lookup table,
+    with values as spins for ``ising``, or as bits otherwise."""
+    import numpy as np
+
+    table = np.unpackbits(np.arange(256, dtype=np.uint8)[:, np.newaxis], axis=1)
+    table = table.astype(np.int8)
+    if problem_type == 'ising':
+        table *= 2
+        table -= 1
+    table.flags.writeable = False
+    return table
+
+
+def _unpack_qp_rows(packed: 'numpy.ndarray', num_variables: int,
+                    table: 'numpy.ndarray', out: 'numpy.ndarray' = None
+                    ) -> 'numpy.ndarray':
+    """Unpack byte-aligned rows of ``num_variables`` bit-packed values into a
+    ``len(packed) x num_variables`` int8 view of ``out`` (a buffer of shape
+    ``packed.shape + (8, )``), using a lookup ``table`` (see
+    :func:`_qp_unpack_table`).
     """
     import numpy as np
 
-    result = msg['answer']
+    rows, row_bytes = packed.shape
+    values = np.take(table, packed, axis=0, out=out, mode='clip')
+    return values.reshape(rows, row_bytes * 8)[:, :num_variables]
 
-    # Build some little endian type encodings
-    double_type = np.dtype(np.double)
-    double_type = double_type.newbyteorder('<')
-    int_type = np.dtype(np.int32)
-    int_type = int_type.newbyteorder('<')
-
-    # Decode the simple buffers
-    result['energies'] = np.frombuffer(base64.b64decode(result['energies']),
-                                       dtype=double_type)
-
-    # adjust energies by offset (in future this might be handled by SAPI)
-    offset = result.setdefault('offset', 0)
-    if offset:
-        # we need to make a copy because frombuffer returns read-only array
-        result['energies'] = result['energies'] + offset
-
-    if 'num_occurrences' in result:
-        result['num_occurrences'] = \
-            np.frombuffer(base64.b64decode(result['num_occurrences']),
-                        dtype=int_type)
-
-    result['active_variables'] = \
-        np.frombuffer(base64.b64decode(result['active_variables']),
-                      dtype=int_type)
-
-    # Measure out the binary data size
-    num_solutions = len(result['energies'])
-    active_variables = result['active_variables']
+
+def _decode_qp_solutions(solutions, num_solutions, active_variables,
+                         total_variables, problem_type, out=None):
+    """Decode base64-encoded, bit-packed ``solutions`` (byte-aligned rows of
+    ``active_variables`` values) into a ``num_solutions x total_variables``
+    numpy matrix of spins (``ising``) or bits (``qubo``), with inactive
+    variables set to 0 or 3, respectively.
+
+    Solutions are decoded in blocks of rows through a fixed-size buffer, and
+    unpacked values are written directly to the result matrix (``out``, if
+    given), so peak memory use stays close to the size of the result.
+    """
+    import numpy as np
+
+    ising = problem_type == 'ising'
     num_variables = len(active_variables)
-    total_variables = result['num_variables']
-
-    # Decode the solutions, which will be a continuous run of bits
-    byte_type = np.dtype(np.uint8)
-    byte_type = byte_type.newbyteorder('<')
-    bits = np.unpackbits(np.frombuffer(base64.b64decode(result['solutions']),
-                         dtype=byte_type))
-
-    # Clip off the extra bits from encoding
-    if num_solutions:
-        bits = np.reshape(bits, (num_solutions, bits.size // num_solutions))
-        bits = np.delete(bits, range(num_variables, bits.shape[1]), 1)
-
-    # Switch from bits to spins
-    default = 3
-    if msg['type'] == 'ising':
-        bits = bits.astype(np.int8)
-        bits *= 2
-        bits -= 1
-        default = 0
-
-    # Fill in the missing variables
-    solutions = np.full((num_solutions, total_variables), default, dtype=np.int8)
-    solutions[:, active_variables] = bits
-    result['solutions'] = solutions
+    row_bytes = -(-num_variables // 8)
 
-    # If the final result shouldn't be numpy formats switch back to python objects
-    if not return_matrix:
-        result['energies'] = result['energies'].tolist()
-        if 'num_occurrences' in result:
-            result['num_occurrences'] = result['num_occurrences'].tolist()
-        result['active_variables'] = result['active_variables'].tolist()
-        result['solutions'] = result['solutions'].tolist()
+    if out is None:
+        decoded = np.empty((num_solutions, total_variables), dtype=np.int8)
+    elif out.shape == (num_solutions, total_variables):
+        decoded = out
+    else:
+        raise ValueError("output array shape doesn't match the solutions")
+
+    decoded.fill(0 if ising else 3)
+    if not num_solutions or not num_variables:
+        return decoded
+
+    table = _qp_unpack_table(problem_type)
+    all_active = np.array_equal(active_variables, np.arange(total_variables))
+
+    # blocks of rows are a multiple of 3 bytes long (except for the last one),
+    # so each block starts on a base64 quantum boundary
+    block_rows = max(3, _QP_DECODE_BLOCK_BYTES // row_bytes // 3 * 3)
+    buffer = np.empty((block_rows, row_bytes, 8), dtype=np.int8)
+
+    for start in range(0, num_solutions, block_rows):
+        rows = min(block_rows, num_solutions - start)
+        begin, end = start * row_bytes, (start + rows) * row_bytes
+        chunk = base64.b64decode(solutions[begin // 3 * 4:-(-end // 3) * 4])
+        packed = np.frombuffer(chunk, dtype=np.uint8, count=end - begin)
+        values = _unpack_qp_rows(packed.reshape(rows, row_bytes), num_variables,
+                                 table, out=buffer[:rows])
+
+        if all_active:
+            decoded[start:start + rows] = values
+        else:
+            decoded[start:start + rows, active_variables] = values
+
+    return decoded
+
+
+def decode_qp_numpy(msg, return_matrix=True, decoded=None):
+    """Decode SAPI response, results in a `qp` format, explicitly using numpy.
+    If numpy is not installed, the method will fail.
+
+    To use numpy for decoding, but return the results as lists (instead of
+    numpy matrices), set `return_matrix=False`.
+
+    Fields already decoded with :func:`decode_qp_field` (using the same
+    options) can be given in ``decoded``, to be reused.
+    """
+    result = msg['answer']
+    result.update(_decode_qp_fields(msg, decoded, return_matrix=return_matrix))
+    result.setdefault('offset', 0)
 
     # include problem type
     if 'type' in msg:
@@ -28,6 +28,8 @@ Some :class:`Future` methods are blocking.
 
 import io
 import time
+import base64
+import logging
 import threading
 import typing
 import functools
@@ -46,7 +48,9 @@ try:
 except ImportError:
     _numpy = False
 
-__all__ = ['Future']
+__all__ = ['Future', 'PackedSamples', 'ResultBatch']
+
+logger = logging.getLogger(__name__)
 
 
 @functools.total_ordering
@@ -150,6 +154,9 @@ class Future(object):
         self._result = None
         self._exception = None
 
+        # result fields decoded individually (see `_result_field`)
+        self._result_fields = {}
+
         # make writes to self._result thread-safe
         self._result_write_lock = threading.Lock()
 
@@ -157,20 +164,31 @@ class Future(object):
         self._results_ready_event = threading.Event()
         self._other_events = []
 
+        # callbacks to call (once) when the future is resolved
+        self._done_callbacks = []
+        self._done_callbacks_lock = threading.Lock()
+
         # set when answer data is downloaded
         self._answer_data_ready_event = threading.Event()
 
         # current poll back-off interval, in seconds
         self._poll_backoff = None
 
+        # number of throttled (429/503) submit, cancel and load requests retried
+        self._throttle_retries = 0
+
         # XXX: energy offset carried via Future, until implemented in SAPI
         self._offset = 0
 
+        # scheduling priority in client's submit, poll and load queues
+        self._priority = 0
+
         # weakref to resolved (already constructed) sampleset
         self._sampleset = None
 
-        # file buffer for binary-ref answer data
-        self._answer_data = io.BytesIO()
+        # file buffer for binary-ref answer data (allocated on download, unless
+        # set before the answer is decoded)
+        self._answer_data = None
 
     # make Future ordered
 
@@ -212,6 +230,76 @@ class Future(object):
         self._results_ready_event.set()
         [ev.set() for ev in self._other_events]
 
+        with self._done_callbacks_lock:
+            callbacks, self._done_callbacks = self._done_callbacks, []
+        for fn in callbacks:
+            self._invoke_callback(fn)
+
+    def _invoke_callback(self, fn):
+        try:
+            fn(self)
+        except Exception as exc:
+            logger.exception("Exception in callback %r for %r: %r", fn, self, exc)
+
+    def add_done_callback(self, fn):
+        """Attach a callable to be called when the future is resolved.
+
+        The callable is called with the future as its only argument, from the
+        thread that resolves the future (typically one of the client's worker
+        threads). If the future is already resolved, the callable is called
+        immediately, from the caller's thread.
+
+        Args:
+            fn (callable):
+                Callable that accepts a :class:`Future` object.
+
+        .. versionadded:: 0.14.0
+        """
+        with self._done_callbacks_lock:
+            if not self.done():
+                self._done_callbacks.append(fn)
+                return
+
+        self._invoke_callback(fn)
+
+    def __await__(self):
+        """Wait for the future to resolve without blocking the event loop.
+
+        Resolution is signalled to the awaiting event loop from the client's
+        worker thread, so no thread is blocked while the future is pending.
+        Awaiting a future returns :meth:`.result`.
+
+        Examples:
+            >>> async def sample(solver, bqm):     # doctest: +SKIP
+            ...     future = solver.sample_bqm(bqm, num_reads=100)
+            ...     await future
+            ...     return future.sampleset
+
+        .. versionadded:: 0.14.0
+        """
+        if not self.done():
+            # import on first use only; asyncio import is relatively slow
+            import asyncio
+
+            loop = asyncio.get_running_loop()
+            waiter = loop.create_future()
+
+            def wakeup(waiter):
+                if not waiter.done():
+                    waiter.set_result(None)
+
+            def on_done(future):
+                try:
+                    loop.call_soon_threadsafe(wakeup, waiter)
+                except RuntimeError:
+                    # event loop closed before the future resolved
+                    pass
+
+            self.add_done_callback(on_done)
+            yield from waiter.__await__()
+
+        return self.result()
+
     def _add_event(self, event):
         """Add an event to be signaled after this event completes."""
         self._other_events.append(event)
@@ -406,6 +494,108 @@ class Future(object):
             for f in done:
                 yield f
 
+    @staticmethod
+    def gather(futures, dedup=False, timeout=None):
+        """Wait for multiple :class:`Future` objects to complete, and collect
+        their samples, energies and occurrences into a single
+        :class:`ResultBatch`.
+
+        Results are stacked into preallocated arrays: each problem's samples
+        are decoded (``qp`` answers) or copied directly to their rows of the
+        batch, without constructing intermediate sample sets.
+
+        Args:
+            futures (list of Futures):
+                :class:`Future` objects to gather, all with samples on the same
+                variables (e.g. QPU problems submitted to the same solver).
+
+            dedup (bool, optional, default=False):
+                Merge rows of the same problem with identical samples and
+                energies, summing up their number of occurrences. Rows of
+                different problems are not merged.
+
+            timeout (float, optional, default=None):
+                Maximum number of seconds to await completion of all futures.
+                If None, waits indefinitely.
+
+        Returns:
+            :class:`ResultBatch`
+
+        Raises:
+            `concurrent.futures.TimeoutError` is raised if not all futures
+            complete within ``timeout``. If any of the problems failed, its
+            exception is raised.
+
+        Note:
+            Requires NumPy.
+
+        Examples:
+            >>> from dwave.cloud import Client, Future
+            >>> with Client.from_config() as client:      # doctest: +SKIP
+            ...     solver = client.get_solver(qpu=True)
+            ...     u, v = next(iter(solver.edges))
+            ...     futures = [solver.sample_ising({u: h, v: -h}, {}, num_reads=100)
+            ...                for h in (-1, 1)]
+            ...     batch = Future.gather(futures, dedup=True)
+            ...     print(batch.num_occurrences.sum())
+            200
+
+        .. versionadded:: 0.14.0
+        """
+        if not _numpy:
+            raise RuntimeError("Can't gather results without numpy.")
+
+        futures = list(futures)
+        _, not_done = Future.wait_multiple(futures, timeout=timeout)
+        if not_done:
+            raise TimeoutError
+
+        energies = [np.asarray(f.energies, dtype=np.float64) for f in futures]
+        num_occurrences = [np.asarray(f.num_occurrences, dtype=np.int64) for f in futures]
+        sizes = [len(e) for e in energies]
+
+        # samples are dense qubit-indexed matrices for qp answers, and on
+        # (sampleset) variables otherwise
+        variables = None
+        num_variables = None
+        dtype = np.dtype(np.int8)
+        for future in futures:
+            if future._has_qp_samples():
+                n = future._result_field('num_variables')
+            else:
+                labels = list(future.variables)
+                if variables is None:
+                    variables = labels
+                elif labels != variables:
+                    raise ValueError("futures have samples on different variables")
+                n = len(labels)
+                dtype = np.result_type(dtype, np.asarray(future.samples).dtype)
+
+            if num_variables is None:
+                num_variables = n
+            elif n != num_variables:
+                raise ValueError("futures have samples on different number of variables")
+
+        samples = np.empty((sum(sizes), num_variables or 0), dtype=dtype)
+        start = 0
+        for future, size in zip(futures, sizes):
+            future._samples_into(samples[start:start + size])
+            start += size
+
+        batch = ResultBatch(
+            samples=samples,
+            energies=np.concatenate(energies) if energies else np.empty(0),
+            num_occurrences=(np.concatenate(num_occurrences) if num_occurrences
+                             else np.empty(0, dtype=np.int64)),
+            problem_index=np.repeat(np.arange(len(futures)), sizes),
+            problem_ids=[f.id for f in futures],
+            variables=variables)
+
+        if dedup:
+            batch = batch.deduplicated()
+
+        return batch
+
     def wait(self, timeout=None):
         """Wait for the solver to receive a response for a submitted problem.
 
@@ -664,8 +854,7 @@ class Future(object):
             return sampleset.record.energy
 
         # fallback to energies from response
-        result = self.result()
-        return result['energies']
+        return self._result_field('energies')
 
     @property
     def samples(self):
@@ -706,8 +895,39 @@ class Future(object):
             return sampleset.record.sample
 
         # fallback to samples from response
+        return self._result_field('solutions')
+
+    @property
+    def packed_samples(self):
+        """Bit-packed samples for the submitted job, for answers in ``qp``
+        format (i.e. QPU problems).
+
+        Samples are not unpacked (see :class:`PackedSamples`), so this is a
+        compact alternative to :attr:`.samples` for answers with many samples.
+
+        Returns:
+            :class:`PackedSamples`
+
+        Note:
+            Requires NumPy.
+
+        .. versionadded:: 0.14.0
+        """
+        if not _numpy:
+            raise RuntimeError("Can't construct PackedSamples without numpy.")
+
+        try:
+            return self._result_field('packed_samples')
+        except KeyError:
+            pass
+
+        # answer already decoded in full
         result = self.result()
-        return result['solutions']
+        if 'solutions' not in result or 'active_variables' not in result:
+            raise ValueError("Packed samples are available only for answers in 'qp' format")
+
+        return PackedSamples.from_dense(
+            result['solutions'], result['active_variables'], result['problem_type'])
 
     @property
     def variables(self):
@@ -719,11 +939,10 @@ class Future(object):
             return sampleset.variables
 
         # fallback to variables from SAPI response
-        result = self.result()
-        if 'active_variables' in result:
-            return result['active_variables']
-
-        raise InvalidAPIResponseError("Active variables not present in the response")
+        try:
+            return self._result_field('active_variables')
+        except KeyError:
+            raise InvalidAPIResponseError("Active variables not present in the response")
 
     @property
     def num_occurrences(self):
@@ -773,13 +992,16 @@ class Future(object):
 
         # fallback to num_occurrences from response
         # (but `occurrences` data is not present if `answer_mode` was set to "raw")
-        result = self.result()
-        if 'num_occurrences' in result:
-            return result['num_occurrences']
-        elif self.return_matrix:
-            return np.ones((len(result['solutions']),))
+        try:
+            return self._result_field('num_occurrences')
+        except KeyError:
+            pass
+
+        num_samples = len(self._result_field('energies'))
+        if self.return_matrix:
+            return np.ones((num_samples,))
         else:
-            return [1] * len(result['solutions'])
+            return [1] * num_samples
 
     def wait_sampleset(self):
         """Blocking sampleset getter."""
@@ -894,17 +1116,35 @@ class Future(object):
             {'qpu_sampling_time': 378.2, 'qpu_anneal_time_per_sample': 20.0, ...}
 
         """
-        return self.result().get('timing', {})
+        try:
+            return self._result_field('timing')
+        except KeyError:
+            return {}
 
     @property
     def problem_type(self):
         """Submitted problem type for this computation, as returned by the
         solver API. Typical values are 'ising' and 'qubo'.
         """
-        return self.result()['problem_type']
+        return self._result_field('problem_type')
 
     @property
     def answer_data(self):
+        """Binary answer data (of problems answered in the ``binary-ref``
+        format, e.g. by hybrid solvers) as a seekable binary stream.
+
+        Answer data is downloaded lazily, in segments, as the stream is read
+        (see :class:`~dwave.cloud.download.RangedStream`), and it's released
+        when the stream is closed, or when the future is garbage collected.
+        Data not yet read is downloaded when the client is closed, so the
+        stream remains readable after close (unless the client is closed
+        without waiting, in which case reading data not yet downloaded raises
+        :exc:`~dwave.cloud.exceptions.UseAfterCloseError`).
+
+        .. versionchanged:: 0.14.0
+            Answer data is downloaded on read, and not when the result is
+            decoded.
+        """
         return self.result().get('answer')
 
     def __getitem__(self, key):
@@ -953,6 +1193,96 @@ class Future(object):
 
         return self._result
 
+    def _result_field(self, field):
+        """Get a single ``field`` of the result, waiting as needed.
+
+        For answers in ``qp`` format, only the requested field is decoded (and
+        cached) if the full result hasn't been decoded yet, so that e.g.
+        energies or timing can be read without unpacking the samples.
+
+        Raises:
+            KeyError: ``field`` not in result.
+        """
+        if self._result is None:
+            # Wait for the query response
+            self.wait(timeout=None)
+
+            # Check for other error conditions
+            if self._exception is not None:
+                raise self._exception
+
+            with self._result_write_lock:
+                # note: full decode mutates `self._message`, so we read raw
+                # fields only while the full result is not decoded
+                if self._result is None and self._is_lazily_decodable():
+                    if field not in self._result_fields:
+                        self._result_fields[field] = self._decode_field(field)
+                    return self._result_fields[field]
+
+        return self.result()[field]
+
+    def _has_qp_samples(self):
+        """Are samples dense, qubit-indexed, as decoded from a ``qp`` answer?"""
+        if self._result is None:
+            return self._message.get('answer', {}).get('format') == 'qp'
+        return 'solutions' in self._result and 'sampleset' not in self._result
+
+    def _samples_into(self, out):
+        """Write samples to preallocated ``out`` array, decoding them directly
+        from a (not yet fully decoded) ``qp`` answer."""
+        with self._result_write_lock:
+            if (self._result is None and self._is_lazily_decodable()
+                    and 'solutions' not in self._result_fields):
+                from dwave.cloud.coders import _decode_qp_solutions
+
+                msg = self._message
+                answer = msg['answer']
+                active_variables = self._result_fields.get('active_variables')
+                if active_variables is None:
+                    active_variables = self.solver._decode_qp_field(msg, 'active_variables')
+                _decode_qp_solutions(
+                    answer['solutions'], num_solutions=len(out),
+                    active_variables=np.asarray(active_variables),
+                    total_variables=answer['num_variables'],
+                    problem_type=msg['type'], out=out)
+                return
+
+        if self._has_qp_samples():
+            out[...] = self._result_field('solutions')
+        else:
+            out[...] = self.samples
+
+    def _is_lazily_decodable(self):
+        """Can answer fields be decoded individually?"""
+        msg = self._message
+        solver = self.solver
+        return (msg.get('answer', {}).get('format') == 'qp'
+                and hasattr(solver, '_decode_qp_field')
+                and 'qp' in solver._handled_encoding_formats
+                and msg.get('type') in solver._handled_problem_types)
+
+    def _decode_field(self, field):
+        """Decode a single result field from the (``qp``) response."""
+        start = time.time()
+        self._patch_offset()
+
+        msg = self._message
+        answer = msg['answer']
+        if field == 'problem_type':
+            value = msg['type']
+        elif field == 'packed_samples':
+            value = PackedSamples.from_qp_answer(msg)
+        elif field in ('energies', 'num_occurrences', 'active_variables', 'solutions'):
+            if field not in answer:
+                raise KeyError(field)
+            value = self.solver._decode_qp_field(
+                msg, field, active_variables=self._result_fields.get('active_variables'))
+        else:
+            value = answer[field]
+
+        self.parse_time = (self.parse_time or 0) + time.time() - start
+        return value
+
     def _get_problem_info(self):
         """Return problem metadata (id, label) to be included in `sampleset.info`."""
         problem_info = {}
@@ -979,14 +1309,328 @@ class Future(object):
         """Decode answer data from the response."""
         start = time.time()
         self._patch_offset()
-        self._result = self.solver.decode_response(self._message, answer_data=self._answer_data)
+        if self._result_fields and self._is_lazily_decodable():
+            # reuse fields already decoded individually
+            self._result = self.solver._decode_qp(
+                self._message, decoded=self._result_fields)
+        else:
+            self._result = self.solver.decode_response(
+                self._message, answer_data=self._answer_data)
+        if isinstance(self._result.get('answer'), io.IOBase):
+            self._answer_data = self._result['answer']
+        # fields decoded individually are superseded by the full result
+        self._result_fields.clear()
         self.parse_time = time.time() - start
         return self._result
 
     def __del__(self):
         # note: here we close the answer buffer (typically a file on disk)
         # even though it's closed by a file destructor anyway just for explicitness sake.
-        # TODO: consider lazy answer data download, so that the buffer/file can be released
-        # immediately after use.
+        # (consumers done with the answer early can close `answer_data` directly)
         if self._answer_data is not None:
             self._answer_data.close()
+
+
+class PackedSamples:
+    """Samples of a QPU answer, kept bit-packed as transmitted in the ``qp``
+    answer format.
+
+    Only values of active variables are stored, one bit per value (8x less
+    memory than a dense matrix of ``int8`` values, which also includes the
+    inactive variables). Samples are unpacked on demand: indexing with a slice
+    (or an index array) selects samples without unpacking, a single sample or
+    the dense samples matrix (see :meth:`to_array`) are unpacked when
+    requested, and energies are evaluated in blocks of samples (see
+    :meth:`energies`).
+
+    Args:
+        packed:
+            ``uint8`` array of shape ``(num_samples, ceil(len(active_variables) / 8))``,
+            with rows of packed active variable values, most significant bit
+            first.
+        active_variables:
+            Indices of active variables (in samples of ``num_variables``
+            variables).
+        num_variables:
+            Total number of variables (e.g. solver qubits).
+        problem_type:
+            ``'ising'`` (values are spins, inactive variables set to 0) or
+            ``'qubo'`` (values are bits, inactive variables set to 3).
+
+    Note:
+        Requires NumPy.
+
+    Examples:
+        >>> from dwave.cloud import Client
+        >>> with Client.from_config() as client:    # doctest: +SKIP
+        ...     solver = client.get_solver(qpu=True)
+        ...     u, v = next(iter(solver.edges))
+        ...     future = solver.sample_ising({u: -1, v: 1}, {(u, v): 1}, num_reads=1000)
+        ...     samples = future.packed_samples
+        ...     energies = samples.energies({u: -1, v: 1}, {(u, v): 1})
+        ...     best = samples[energies.argmin()]
+
+    .. versionadded:: 0.14.0
+    """
+
+    # max number of values unpacked at once in block-wise operations
+    _BLOCK_SIZE = 1 << 20
+
+    def __init__(self, packed: 'np.ndarray', active_variables: 'np.ndarray',
+                 num_variables: int, problem_type: str):
+        self.packed = np.asarray(packed, dtype=np.uint8)
+        self.active_variables = np.asarray(active_variables, dtype=np.intp)
+        self.num_variables = num_variables
+        self.problem_type = problem_type
+
+        if self.packed.ndim != 2 or self.packed.shape[1] != -(-len(self.active_variables) // 8):
+            raise ValueError("packed samples shape doesn't match active variables")
+
+    @classmethod
+    def from_qp_answer(cls, msg: dict) -> 'PackedSamples':
+        """Construct from SAPI response with answer in ``qp`` format, without
+        unpacking the samples (or modifying the response)."""
+        from dwave.cloud.coders import decode_qp_field
+
+        answer = msg['answer']
+        active_variables = decode_qp_field(msg, 'active_variables')
+        num_samples = len(decode_qp_field(msg, 'energies'))
+        row_bytes = -(-len(active_variables) // 8)
+
+        packed = np.frombuffer(base64.b64decode(answer['solutions']),
+                               dtype=np.uint8, count=num_samples * row_bytes)
+        return cls(packed.reshape(num_samples, row_bytes), active_variables,
+                   num_variables=answer['num_variables'], problem_type=msg['type'])
+
+    @classmethod
+    def from_dense(cls, samples: 'np.typing.ArrayLike',
+                   active_variables: 'np.typing.ArrayLike',
+                   problem_type: str) -> 'PackedSamples':
+        """Pack a dense ``num_samples x num_variables`` samples matrix (as
+        decoded from a ``qp`` answer)."""
+        samples = np.asarray(samples, dtype=np.int8)
+        if samples.ndim != 2:
+            samples = samples.reshape(len(samples), -1)
+
+        values = samples[:, np.asarray(active_variables, dtype=np.intp)]
+        bits = values > 0 if problem_type == 'ising' else values == 1
+        return cls(np.packbits(bits, axis=1), active_variables,
+                   num_variables=samples.shape[1], problem_type=problem_type)
+
+    def __len__(self):
+        return len(self.packed)
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        """Shape of the dense samples matrix."""
+        return (len(self.packed), self.num_variables)
+
+    @property
+    def nbytes(self) -> int:
+        """Size of packed samples, in bytes."""
+        return self.packed.nbytes
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(num_samples={len(self)}, "
+                f"num_variables={self.num_variables}, "
+                f"num_active_variables={len(self.active_variables)}, "
+                f"problem_type={self.problem_type!r})")
+
+    def __getitem__(self, key):
+        """Unpacked sample for an integer ``key``, packed samples subset for
+        a slice or an index array."""
+        if isinstance(key, (int, np.integer)):
+            return self._unpack(self.packed[key][np.newaxis])[0]
+
+        return type(self)(self.packed[key], self.active_variables,
+                          num_variables=self.num_variables,
+                          problem_type=self.problem_type)
+
+    def __iter__(self):
+        for block in self._blocks(self.num_variables):
+            yield from self._unpack(block)
+
+    def __array__(self, dtype=None, copy=None):
+        array = self.to_array()
+        return array if dtype is None else array.astype(dtype, copy=False)
+
+    def to_array(self, active_only: bool = False) -> 'np.ndarray':
+        """Unpack samples into a dense ``int8`` matrix, same as decoded from
+        the ``qp`` answer (see :attr:`Future.samples`).
+
+        Args:
+            active_only:
+                Return values of active variables only, in order of
+                ``active_variables``.
+        """
+        num_columns = len(self.active_variables) if active_only else self.num_variables
+        array = np.empty((len(self), num_columns), dtype=np.int8)
+        start = 0
+        for block in self._blocks(num_columns):
+            array[start:start + len(block)] = self._unpack(block, active_only=active_only)
+            start += len(block)
+        return array
+
+    def energies(self, linear: typing.Union[typing.Mapping, typing.Sequence],
+                 quadratic: typing.Mapping, offset: float = 0) -> 'np.ndarray':
+        """Evaluate energies of all samples, unpacking them in blocks.
+
+        Args:
+            linear:
+                Linear biases, as a mapping of variable (qubit) to bias, or a
+                sequence of biases indexed by variable.
+            quadratic:
+                Quadratic biases, as a mapping of variable pairs to bias.
+            offset:
+                Energy offset.
+
+        Returns:
+            Array of ``float64`` energies.
+
+        Raises:
+            ValueError:
+                Non-zero bias on an inactive variable.
+        """
+        if not isinstance(linear, typing.Mapping):
+            linear = dict(enumerate(linear))
+
+        # variable -> column in active-only samples
+        columns = np.full(self.num_variables, -1, dtype=np.intp)
+        columns[self.active_variables] = np.arange(len(self.active_variables))
+
+        def to_columns(variables, biases):
+            variables = np.fromiter(variables, dtype=np.intp, count=len(biases))
+            valid = (variables >= 0) & (variables < self.num_variables)
+            cols = np.full(len(variables), -1, dtype=np.intp)
+            cols[valid] = columns[variables[valid]]
+            if np.any(biases[cols < 0] != 0):
+                raise ValueError("biases on inactive variables")
+            return cols
+
+        lin_biases = np.fromiter(linear.values(), dtype=np.float64, count=len(linear))
+        lin_cols = to_columns(linear.keys(), lin_biases)
+        quad_biases = np.fromiter(quadratic.values(), dtype=np.float64, count=len(quadratic))
+        u_cols = to_columns((u for u, _ in quadratic), quad_biases)
+        v_cols = to_columns((v for _, v in quadratic), quad_biases)
+
+        # drop (zero-bias) terms on inactive variables
+        lin_used = lin_cols >= 0
+        lin_cols, lin_biases = lin_cols[lin_used], lin_biases[lin_used]
+        quad_used = (u_cols >= 0) & (v_cols >= 0)
+        u_cols, v_cols, quad_biases = u_cols[quad_used], v_cols[quad_used], quad_biases[quad_used]
+
+        energies = np.full(len(self), offset, dtype=np.float64)
+        start = 0
+        for block in self._blocks(max(len(self.active_variables), len(quad_biases))):
+            values = self._unpack(block, active_only=True)
+            rows = slice(start, start + len(block))
+            energies[rows] += values[:, lin_cols] @ lin_biases
+            energies[rows] += (values[:, u_cols] * values[:, v_cols]) @ quad_biases
+            start += len(block)
+
+        return energies
+
+    def _blocks(self, row_size: int):
+        # packed samples in blocks of rows, each unpacked into about
+        # `_BLOCK_SIZE` values of size `row_size`
+        block_rows = max(1, self._BLOCK_SIZE // max(row_size, 1))
+        for start in range(0, len(self.packed), block_rows):
+            yield self.packed[start:start + block_rows]
+
+    def _unpack(self, packed: 'np.ndarray', active_only: bool = False) -> 'np.ndarray':
+        from dwave.cloud.coders import _qp_unpack_table, _unpack_qp_rows
+
+        num_active = len(self.active_variables)
+        table = _qp_unpack_table(self.problem_type)
+        values = _unpack_qp_rows(packed, num_active, table)
+        if active_only:
+            return values
+
+        dense = np.full((len(packed), self.num_variables),
+                        0 if self.problem_type == 'ising' else 3, dtype=np.int8)
+        dense[:, self.active_variables] = values
+        return dense
+
+
+class ResultBatch:
+    """Samples, energies and occurrences of multiple problems, stacked into
+    columnar arrays, with the problem of origin recorded for each row.
+
+    Constructed with :meth:`Future.gather`.
+
+    Args:
+        samples:
+            Samples matrix. For QPU problems, samples are on all solver qubits
+            (as in :attr:`Future.samples`), otherwise on ``variables``.
+        energies:
+            Sample energies.
+        num_occurrences:
+            Sample occurrences.
+        problem_index:
+            Index of the problem (in ``problem_ids``) each sample comes from.
+        problem_ids:
+            Problem IDs, in order of gathered futures.
+        variables:
+            Sample variables, for non-QPU problems.
+
+    .. versionadded:: 0.14.0
+    """
+
+    def __init__(self, samples: 'np.ndarray', energies: 'np.ndarray',
+                 num_occurrences: 'np.ndarray', problem_index: 'np.ndarray',
+                 problem_ids: list[typing.Optional[str]],
+                 variables: typing.Optional[list] = None):
+        self.samples = samples
+        self.energies = energies
+        self.num_occurrences = num_occurrences
+        self.problem_index = problem_index
+        self.problem_ids = problem_ids
+        self.variables = variables
+
+    def __len__(self):
+        return len(self.energies)
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(num_rows={len(self)}, "
+                f"num_problems={len(self.problem_ids)})")
+
+    @property
+    def row_problem_ids(self) -> 'np.ndarray':
+        """Problem ID for each row."""
+        return np.asarray(self.problem_ids, dtype=object)[self.problem_index]
+
+    def deduplicated(self) -> 'ResultBatch':
+        """Return a batch with rows of the same problem with identical
+        samples and energies merged, and their number of occurrences summed
+        up. Merged rows keep the order of their first occurrence."""
+        n = len(self)
+        if not n:
+            return self
+
+        # rows (problem, sample and energy) as opaque byte strings
+        keys = np.concatenate([
+            np.ascontiguousarray(self.problem_index, dtype=np.int64).view(np.uint8).reshape(n, -1),
+            np.ascontiguousarray(self.samples).view(np.uint8).reshape(n, -1),
+            np.ascontiguousarray(self.energies, dtype=np.float64).view(np.uint8).reshape(n, -1),
+        ], axis=1)
+        keys = keys.view(np.dtype((np.void, keys.shape[1]))).ravel()
+
+        _, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+
+        # renumber unique rows in order of first occurrence
+        order = np.argsort(first)
+        rank = np.empty_like(order)
+        rank[order] = np.arange(len(order))
+
+        num_occurrences = np.bincount(
+            rank[inverse.ravel()], weights=self.num_occurrences,
+            minlength=len(order)).astype(self.num_occurrences.dtype)
+        rows = first[order]
+
+        return type(self)(
+            samples=self.samples[rows],
+            energies=self.energies[rows],
+            num_occurrences=num_occurrences,
+            problem_index=self.problem_index[rows],
+            problem_ids=self.problem_ids,
+            variables=self.variables)
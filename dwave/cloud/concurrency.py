@@ -15,11 +15,21 @@
 """Concurrency utilities."""
 
 import sys
+import math
+import time
+import heapq
+import itertools
 import functools
+import threading
 import concurrent.futures
 import queue
+from collections import abc, deque, OrderedDict
+from multiprocessing import shared_memory
+from typing import Any, Hashable, Optional, Sequence
 
-__all__ = ['PriorityThreadPoolExecutor']
+__all__ = ['PriorityThreadPoolExecutor', 'SmallestRemainingFirstExecutor',
+           'AgingPriorityQueue', 'TimerWheel', 'TokenBucket', 'RateLimiter',
+           'LRUCache', 'SharedArrays']
 
 
 @functools.total_ordering
@@ -106,6 +116,574 @@ class PriorityThreadPoolExecutor(concurrent.futures.ThreadPoolExecutor):
         self._work_queue = _PrioritizingQueue()
 
 
+class _SmallestRemainingFirstQueue(queue.Queue):
+    """Work queue that groups :class:`concurrent.futures.thread._WorkItem`
+    items (by ``group`` passed in item's `kwargs`), and serves items from the
+    group with the smallest total ``size`` of items queued, less ``aging``
+    units of size for each second the group has been waiting. Items within
+    a group are served in FIFO order.
+
+    Other items (executor's wake-up sentinels) are served only once no work
+    items are left.
+    """
+
+    def __init__(self, maxsize: int = 0, aging: float = 0):
+        super().__init__(maxsize)
+        self.aging = aging
+
+    def _init(self, maxsize):
+        self._groups = {}       # group -> deque[(size, item)]
+        self._remaining = {}    # group -> total size of items queued
+        self._since = {}        # group -> time group became non-empty
+        self._other = deque()
+        self._count = 0
+
+    def _qsize(self):
+        return self._count
+
+    def _put(self, item):
+        self._count += 1
+        if not isinstance(item, concurrent.futures.thread._WorkItem):
+            self._other.append(item)
+            return
+
+        group = item.kwargs.pop('group', None)
+        size = item.kwargs.pop('size', 0)
+        if group is None:
+            # ungrouped items are groups of their own
+            group = object()
+
+        if group not in self._groups:
+            self._groups[group] = deque()
+            self._remaining[group] = 0
+            self._since[group] = time.monotonic()
+
+        self._groups[group].append((size, item))
+        self._remaining[group] += size
+
+    def _get(self):
+        self._count -= 1
+        if not self._groups:
+            return self._other.popleft()
+
+        now = time.monotonic()
+        group = min(self._groups, key=lambda g: (
+            self._remaining[g] - self.aging * (now - self._since[g])))
+
+        items = self._groups[group]
+        size, item = items.popleft()
+        self._remaining[group] -= size
+        if not items:
+            del self._groups[group], self._remaining[group], self._since[group]
+
+        return item
+
+
+class SmallestRemainingFirstExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Thread pool executor that shares workers between groups of tasks (e.g.
+    parts of uploads), serving first the group with the least work remaining.
+
+    Interface is identical to :class:`concurrent.futures.ThreadPoolExecutor`,
+    except the `.submit()` which accepts optional `group` and `size` keyword
+    arguments::
+
+        def submit(self, fn, *args, group=None, size=0, **kwargs):
+            ...
+
+    Tasks in a group are run in submission order. The next task run is from
+    the group with the smallest total size of tasks queued, so short jobs are
+    not blocked behind long ones. To prevent starvation of large groups, the
+    size of a group is reduced by ``aging`` for each second the group has been
+    waiting.
+
+    Args:
+        max_workers:
+            See :class:`concurrent.futures.ThreadPoolExecutor`.
+        aging:
+            Size units (e.g. bytes) equivalent to one second of waiting.
+
+    .. versionadded:: 0.14.0
+    """
+
+    def __init__(self, *args, aging: float = 0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._work_queue = _SmallestRemainingFirstQueue(aging=aging)
+
+
+class AgingPriorityQueue(queue.Queue):
+    """Priority queue with FIFO order within priority levels, and aging to
+    prevent starvation of low-priority items.
+
+    Items are ordered by their enqueue time, shifted back by ``aging`` seconds
+    for each unit of priority. So an item with a higher priority jumps ahead
+    of lower-priority items queued at most ``aging`` seconds (per priority
+    unit difference) before it, but never ahead of items that have already
+    waited longer than that.
+
+    Interface is identical to :class:`queue.Queue`, except :meth:`.put`, which
+    accepts an optional ``priority`` keyword argument (higher is served first).
+
+    Args:
+        maxsize:
+            See :class:`queue.Queue`.
+        aging:
+            Time, in seconds, equivalent to one unit of priority.
+    """
+
+    def __init__(self, maxsize: int = 0, aging: float = 1.0):
+        super().__init__(maxsize)
+        self.aging = aging
+
+    def _init(self, maxsize):
+        self.queue = []
+        self._counter = itertools.count()
+
+    def _qsize(self):
+        return len(self.queue)
+
+    def _put(self, item):
+        heapq.heappush(self.queue, item)
+
+    def _get(self):
+        return heapq.heappop(self.queue)[-1]
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None,
+            priority: float = 0) -> None:
+        key = time.monotonic() - priority * self.aging
+        super().put((key, next(self._counter), item), block=block, timeout=timeout)
+
+    def put_nowait(self, item: Any, priority: float = 0) -> None:
+        return self.put(item, block=False, priority=priority)
+
+
+class TimerWheel:
+    """Thread-safe hashed timer wheel, scheduling items on the
+    :func:`time.monotonic` clock.
+
+    Items are hashed into slots of ``tick`` seconds, so scheduling an item in
+    an already occupied slot is O(1), and only occupied slots are kept ordered
+    (in a heap). Consumers block in :meth:`.get` until items are due. Task
+    accounting (:meth:`.task_done` and :meth:`.join`) mirrors that of
+    :class:`queue.Queue`.
+
+    Due items are returned in order of their scheduled time, shifted back by
+    ``aging`` seconds for each unit of item's priority (see
+    :class:`AgingPriorityQueue`), so when more items are due than consumers
+    can take, higher-priority items are returned first. Priority never makes
+    an item due sooner.
+
+    Args:
+        tick:
+            Slot width, in seconds. Items are never returned before their
+            scheduled time, but they can be returned up to ``tick`` seconds
+            later.
+        aging:
+            Time, in seconds, equivalent to one unit of priority.
+
+    Example::
+
+        wheel = TimerWheel(tick=0.05)
+        wheel.put('task', at=time.monotonic() + 1)
+        items = wheel.get(max_items=10)     # blocks for ~1 sec
+        wheel.task_done(len(items))
+    """
+
+    def __init__(self, tick: float, aging: float = 1.0):
+        self.tick = tick
+        self.aging = aging
+
+        self._mutex = threading.Lock()
+        self._not_empty = threading.Condition(self._mutex)
+        self._all_tasks_done = threading.Condition(self._mutex)
+        self._unfinished_tasks = 0
+        self._closed = False
+
+        # slot index -> items; heap of occupied slot indices
+        self._slots = {}
+        self._heap = []
+
+        # due items, ordered by priority-adjusted schedule
+        self._ready = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        """Number of scheduled items not yet returned by :meth:`.get`."""
+        with self._mutex:
+            return len(self._ready) + sum(map(len, self._slots.values()))
+
+    def put(self, item: Any, at: Optional[float] = None, priority: float = 0) -> None:
+        """Schedule ``item`` for time ``at`` on the :func:`time.monotonic`
+        clock (now if omitted), with ``priority`` (higher is returned first
+        among due items)."""
+        if at is None:
+            at = time.monotonic()
+        index = math.ceil(at / self.tick)
+        item = (at - priority * self.aging, next(self._counter), item)
+
+        with self._not_empty:
+            self._unfinished_tasks += 1
+
+            slot = self._slots.get(index)
+            if slot is None:
+                slot = self._slots[index] = []
+                heapq.heappush(self._heap, index)
+                if self._heap[0] == index:
+                    # new earliest slot, consumers might have to wake up sooner
+                    self._not_empty.notify()
+
+            slot.append(item)
+
+    def get(self, max_items: int = 1, lookahead: float = 0) -> Optional[list]:
+        """Block until the earliest scheduled item is due, and return up to
+        ``max_items`` due items, highest priority first. Items scheduled
+        within ``lookahead`` seconds from the earliest one are also included.
+
+        Returns ``None`` after the wheel is closed.
+        """
+        with self._not_empty:
+            while True:
+                if self._closed:
+                    return None
+
+                if self._ready:
+                    break
+
+                if not self._heap:
+                    self._not_empty.wait()
+                    continue
+
+                delay = self._heap[0] * self.tick - time.monotonic()
+                if delay > 0:
+                    self._not_empty.wait(delay)
+                    continue
+
+                # move all due slots, and slots within lookahead from the
+                # earliest one, to the ready heap
+                horizon = max(self._heap[0] + math.floor(lookahead / self.tick),
+                              math.floor(time.monotonic() / self.tick))
+                while self._heap and self._heap[0] <= horizon:
+                    for item in self._slots.pop(heapq.heappop(self._heap)):
+                        heapq.heappush(self._ready, item)
+                break
+
+            items = []
+            while self._ready and len(items) < max_items:
+                items.append(heapq.heappop(self._ready)[-1])
+
+            if self._ready or self._heap:
+                # let another consumer handle remaining items
+                self._not_empty.notify()
+
+            return items
+
+    def task_done(self, n: int = 1) -> None:
+        """Indicate ``n`` formerly scheduled items are processed."""
+        with self._all_tasks_done:
+            unfinished = self._unfinished_tasks - n
+            if unfinished < 0:
+                raise ValueError('task_done() called too many times')
+            self._unfinished_tasks = unfinished
+            if unfinished == 0:
+                self._all_tasks_done.notify_all()
+
+    def join(self) -> None:
+        """Block until all scheduled items have been retrieved and processed."""
+        with self._all_tasks_done:
+            while self._unfinished_tasks:
+                self._all_tasks_done.wait()
+
+    def close(self) -> None:
+        """Wake up all consumers blocked in :meth:`.get`, and make all
+        subsequent calls to :meth:`.get` return ``None``."""
+        with self._not_empty:
+            self._closed = True
+            self._not_empty.notify_all()
+
+
+class TokenBucket:
+    """Thread-safe token bucket rate limiter.
+
+    Tokens are added at ``rate`` tokens per second, up to ``capacity``. Each
+    :meth:`.acquire` takes the number of tokens requested (one by default, at
+    most ``capacity``), blocking until they are available. The bucket can also
+    be paused for a period of time (see :meth:`.pause`), e.g. when the server
+    asks clients to back off.
+
+    Args:
+        rate:
+            Token refill rate, in tokens per second. If ``None``, rate is
+            unlimited, but the bucket can still be paused.
+        capacity:
+            Maximum number of tokens (burst size). Defaults to ``rate``, but at
+            least one token.
+    """
+
+    def __init__(self, rate: Optional[float] = None, capacity: Optional[float] = None):
+        if capacity is None:
+            capacity = max(1, rate or 0)
+
+        self.rate = rate
+        self.capacity = capacity
+
+        self._lock = threading.Lock()
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+        self._pause_count = 0
+        self._wait_count = 0
+        self._wait_time = 0.0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(rate={self.rate!r}, capacity={self.capacity!r})"
+
+    def _refill(self, now: float) -> None:
+        if self.rate is not None:
+            elapsed = max(0, now - self._updated)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1) -> float:
+        """Take ``tokens`` tokens (one by default), blocking until they are
+        available, and the bucket is not paused. Returns the time waited, in
+        seconds."""
+        if self.rate is not None and tokens > self.capacity:
+            raise ValueError("can't acquire more tokens than bucket capacity")
+
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self.rate is None:
+                    break
+                elif self._tokens >= tokens:
+                    self._tokens -= tokens
+                    break
+                else:
+                    delay = (tokens - self._tokens) / self.rate
+
+            time.sleep(delay)
+            waited += delay
+
+        if waited:
+            with self._lock:
+                self._wait_count += 1
+                self._wait_time += waited
+
+        return waited
+
+    def pause(self, seconds: float) -> None:
+        """Block all acquires for the next ``seconds`` seconds."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._paused_until = max(self._paused_until, now + seconds)
+            self._pause_count += 1
+
+    @property
+    def stats(self) -> dict:
+        """Bucket state and counters: current number of ``tokens``, seconds
+        remaining until the bucket is unpaused (``paused_for``), number of
+        times paused (``pauses``), and number of acquires that had to wait
+        (``waits``), with the total time waited (``wait_time``)."""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            return dict(
+                rate=self.rate,
+                capacity=self.capacity,
+                tokens=self._tokens,
+                paused_for=max(0.0, self._paused_until - now),
+                pauses=self._pause_count,
+                waits=self._wait_count,
+                wait_time=self._wait_time,
+            )
+
+
+class RateLimiter:
+    """Thread-safe collection of per-endpoint :class:`TokenBucket` rate
+    limiters.
+
+    Args:
+        limits:
+            Mapping of endpoint name to ``(rate, capacity)`` of its token
+            bucket. Endpoints not listed are not rate limited, but can be
+            paused.
+    """
+
+    def __init__(self, limits: Optional[abc.Mapping[str, tuple]] = None):
+        self.limits = dict(limits or {})
+        self._lock = threading.Lock()
+        self._buckets = {}
+
+    def __repr__(self):
+        return f"{type(self).__name__}(limits={self.limits!r})"
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        """Return token bucket for ``endpoint``, creating it if needed."""
+        with self._lock:
+            bucket = self._buckets.get(endpoint)
+            if bucket is None:
+                rate, capacity = self.limits.get(endpoint, (None, None))
+                bucket = self._buckets[endpoint] = TokenBucket(rate, capacity)
+            return bucket
+
+    def acquire(self, endpoint: str) -> float:
+        """Take a token from the ``endpoint`` bucket. See :meth:`TokenBucket.acquire`."""
+        return self.bucket(endpoint).acquire()
+
+    def pause(self, endpoint: str, seconds: float) -> None:
+        """Pause the ``endpoint`` bucket. See :meth:`TokenBucket.pause`."""
+        self.bucket(endpoint).pause(seconds)
+
+    @property
+    def stats(self) -> dict:
+        """Per-endpoint :attr:`TokenBucket.stats`."""
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {endpoint: bucket.stats for endpoint, bucket in buckets.items()}
+
+
+class LRUCache:
+    """Thread-safe bounded mapping that evicts least recently used items.
+
+    Args:
+        maxsize:
+            Maximum number of items held.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 1:
+            raise ValueError("'maxsize' must be a positive integer")
+
+        self.maxsize = maxsize
+
+        self._lock = threading.Lock()
+        self._items = OrderedDict()
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(maxsize={self.maxsize!r})"
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return value for ``key`` (marking it as most recently used), or
+        ``default`` if ``key`` is not cached."""
+        with self._lock:
+            try:
+                self._items.move_to_end(key)
+            except KeyError:
+                self._misses += 1
+                return default
+            self._hits += 1
+            return self._items[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Cache ``value`` under ``key``, evicting the least recently used
+        item if the cache is full."""
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Remove all items. Counters are not reset."""
+        with self._lock:
+            self._items.clear()
+
+    @property
+    def stats(self) -> dict:
+        """Cache ``size`` and counters: number of ``hits``, ``misses`` and
+        ``evictions``."""
+        with self._lock:
+            return dict(
+                maxsize=self.maxsize,
+                size=len(self._items),
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+            )
+
+
+class SharedArrays:
+    """Numpy arrays packed in a single shared memory block, for passing to
+    worker processes without copying them through a pipe.
+
+    Instances are picklable: an unpickled instance (e.g. in a worker process)
+    is attached to the same shared memory block. Each process should
+    :meth:`.close` its instance when done (after releasing all array views),
+    and the creating process should also :meth:`.unlink` the block.
+
+    Args:
+        arrays:
+            Arrays to copy to shared memory.
+
+    Note:
+        Requires numpy.
+    """
+
+    _ALIGNMENT = 64
+
+    def __init__(self, arrays: Sequence['numpy.ndarray']):
+        import numpy
+
+        layout = []
+        size = 0
+        for array in arrays:
+            array = numpy.asarray(array)
+            layout.append((size, array.dtype.str, array.shape))
+            size += -(-array.nbytes // self._ALIGNMENT) * self._ALIGNMENT
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        self._layout = layout
+
+        for array, view in zip(arrays, self.arrays):
+            view[...] = array
+
+    @property
+    def name(self) -> str:
+        """Shared memory block name."""
+        return self._shm.name
+
+    @property
+    def arrays(self) -> list['numpy.ndarray']:
+        """Views of shared arrays."""
+        import numpy
+        return [numpy.ndarray(shape, dtype=dtype, buffer=self._shm.buf, offset=offset)
+                for offset, dtype, shape in self._layout]
+
+    def __getstate__(self):
+        return dict(name=self._shm.name, layout=self._layout)
+
+    def __setstate__(self, state):
+        self._shm = shared_memory.SharedMemory(name=state['name'])
+        self._layout = state['layout']
+
+    def __repr__(self):
+        return f"{type(self).__name__}(name={self.name!r}, layout={self._layout!r})"
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Request the shared memory block is destroyed (once all processes
+        detach from it)."""
+        self._shm.unlink()
+
+
 class Present(concurrent.futures.Future):
     """Already resolved :class:`~concurrent.futures.Future` object.
 
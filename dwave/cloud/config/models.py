@@ -23,13 +23,13 @@ from collections import abc
 from typing import Optional, Union, Literal, Any, Annotated
 
 import urllib3
-from pydantic import BaseModel, BeforeValidator, NonNegativeInt
+from pydantic import BaseModel, BeforeValidator, NonNegativeInt, PositiveInt
 
 from dwave.cloud.config import constants
 from dwave.cloud.config.loaders import update_config, _solver_id_as_identity
 
 __all__ = ['RequestRetryConfig', 'ClientConfig',
-           'BackoffPollingSchedule', 'LongPollingSchedule',
+           'BackoffPollingSchedule', 'LongPollingSchedule', 'InFlightPolicy',
            'validate_config_v1', 'dump_config_v1', 'load_config_v1']
 
 logger = logging.getLogger(__name__)
@@ -125,6 +125,19 @@ class LongPollingSchedule(BaseModel):
     pause: Optional[float] = 0.0
 
 
+class InFlightPolicy(str, enum.Enum):
+    """Action taken on problem submit when the in-flight limit is reached."""
+
+    #: Block until in-flight problems resolve
+    BLOCK = "block"
+
+    #: Raise :exc:`~dwave.cloud.exceptions.InFlightLimitExceeded`
+    RAISE = "raise"
+
+    #: Return a future; submit the problem when in-flight problems resolve
+    DEFER = "defer"
+
+
 def _literal_eval(obj):
     if isinstance(obj, str):
         return ast.literal_eval(obj)
@@ -158,6 +171,34 @@ class ClientConfig(BaseModel, GetterMixin):
     # [sapi client specific] preemptive compression on qpu problem upload
     compress_qpu_problem_data: Optional[bool] = True
 
+    # [sapi client specific] limits on problems in flight (unlimited if None)
+    max_in_flight: Optional[PositiveInt] = None
+    max_queued_bytes: Optional[PositiveInt] = None
+    in_flight_policy: Optional[InFlightPolicy] = InFlightPolicy.BLOCK
+
+    # [sapi client specific] crash-safe problem journal
+    journal: Optional[bool] = False
+    journal_path: Optional[str] = None
+
+    # [sapi client specific] content-addressed cache of uploaded problems
+    upload_cache: Optional[bool] = False
+    upload_cache_path: Optional[str] = None
+    upload_cache_maxage: Optional[PositiveInt] = 86400
+
+    # [sapi client specific] problem upload concurrency and bandwidth
+    upload_concurrency: Optional[PositiveInt] = 4
+    upload_bandwidth_limit: Optional[PositiveInt] = None
+
+    # [sapi client specific] per-solver cache of encoded qpu problems
+    encoding_cache_size: Optional[NonNegativeInt] = 0
+
+    # [sapi client specific] number of qpu problem encoding processes
+    encoding_processes: Optional[NonNegativeInt] = 0
+
+    # [sapi client specific] binary-ref answer ranged download
+    answer_download_segment_size: Optional[PositiveInt] = 8 * 1024 * 1024
+    answer_download_parallelism: Optional[PositiveInt] = 4
+
     # general http(s) connection params
     cert: Optional[Union[str, tuple[str, str]]] = None
     headers: Optional[abc.Mapping[str, str]] = None
@@ -327,6 +368,20 @@ _V1_CONFIG_DEFAULTS = {
     'polling_timeout': None,
     'connection_close': False,
     'compress_qpu_problem_data': True,
+    'max_in_flight': None,
+    'max_queued_bytes': None,
+    'in_flight_policy': 'block',
+    'journal': False,
+    'journal_path': None,
+    'upload_cache': False,
+    'upload_cache_path': None,
+    'upload_cache_maxage': 86400,
+    'upload_concurrency': 4,
+    'upload_bandwidth_limit': None,
+    'encoding_cache_size': 0,
+    'encoding_processes': 0,
+    'answer_download_segment_size': 8 * 1024 * 1024,
+    'answer_download_parallelism': 4,
     'headers': None,
     'client_cert': None,
     'client_cert_key': None,
@@ -0,0 +1,380 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Ranged (segmented) download helpers."""
+
+import io
+import os
+import mmap
+import re
+import tempfile
+import threading
+from collections import abc
+from concurrent.futures import Executor, wait
+from typing import Optional
+
+__all__ = ['Segment', 'MappedSpool', 'RangedStream', 'parse_content_range',
+           'spooled_temporary_file']
+
+
+class Segment:
+    """Byte range ``[start, end)`` of a download, with the progress tracked in
+    ``offset``.
+
+    A segment download interrupted part way can be resumed from ``offset``.
+    """
+
+    __slots__ = ('start', 'end', 'offset')
+
+    def __init__(self, start: int, end: int):
+        self.start = start
+        self.end = end
+        self.offset = start
+
+    def __repr__(self):
+        return (f"{type(self).__name__}(start={self.start!r}, end={self.end!r}, "
+                f"offset={self.offset!r})")
+
+    @property
+    def remaining(self) -> int:
+        return self.end - self.offset
+
+    @property
+    def range_header(self) -> str:
+        """HTTP ``Range`` header value for the remaining part of the segment."""
+        return f'bytes={self.offset}-{self.end - 1}'
+
+    @classmethod
+    def split(cls, total_size: int, segment_size: int, start: int = 0) -> list['Segment']:
+        """Split ``[start, total_size)`` into segments of at most
+        ``segment_size`` bytes."""
+        return [cls(pos, min(pos + segment_size, total_size))
+                for pos in range(start, total_size, segment_size)]
+
+
+_content_range_pattern = re.compile(r'^\s*bytes\s+(\d+)-(\d+)/(\d+)\s*$')
+
+def parse_content_range(value: Optional[str]) -> Optional[tuple[int, int, int]]:
+    """Parse HTTP ``Content-Range`` header value, returning
+    ``(first_byte, last_byte, total_size)``, or ``None`` if the value is
+    missing, malformed, or of unknown total size (``*``).
+    """
+    if not isinstance(value, str):
+        return None
+    match = _content_range_pattern.match(value)
+    if match is None:
+        return None
+    return tuple(map(int, match.groups()))
+
+
+def spooled_temporary_file(max_size: int = 10**8) -> tempfile.SpooledTemporaryFile:
+    """Binary :class:`tempfile.SpooledTemporaryFile` usable with :mod:`zipfile`."""
+    sf = tempfile.SpooledTemporaryFile(max_size=max_size, mode='w+b')
+    # backport a fix for bpo-26175, https://github.com/python/cpython/pull/29560.
+    # to make sure `zipfile` works with `SpooledTemporaryFile` in Python < 3.11
+    if not hasattr(sf, 'seekable'):
+        # of all the methods fixed in the above PR, only seekable is actually
+        # ever used in `zipfile`.
+        sf.seekable = lambda: sf._file.seekable()
+    return sf
+
+
+class MappedSpool(io.RawIOBase):
+    """Fixed-size temporary file, memory-mapped for concurrent positional writes
+    and read back as a seekable raw binary stream.
+
+    Args:
+        size:
+            Spool size in bytes.
+
+        dir:
+            Directory in which the temporary file is created. Defaults to the
+            platform's temporary directory (see :func:`tempfile.gettempdir`).
+
+    Note:
+        Writes to disjoint ranges (see :meth:`.write_at`) are safe from multiple
+        threads. The file is anonymous (deleted on create where supported), so
+        the disk space is released when the spool is closed.
+    """
+
+    def __init__(self, size: int, dir: Optional[str] = None):
+        super().__init__()
+        self._size = size
+        self._pos = 0
+        self._file = tempfile.TemporaryFile(dir=dir)
+        self._mmap = None
+        self._lock = threading.Lock()
+
+        if size > 0:
+            self._file.truncate(size)
+            self._mmap = mmap.mmap(self._file.fileno(), size)
+
+    def __len__(self):
+        return self._size
+
+    def write_at(self, offset: int, data) -> int:
+        """Write bytes-like ``data`` at position ``offset``, without moving the
+        stream position. Returns the number of bytes written."""
+        n = len(data)
+        if offset < 0 or offset + n > self._size:
+            raise ValueError("write outside of the spool boundaries")
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        self._mmap[offset:offset+n] = data
+        return n
+
+    def readinto_at(self, offset: int, b) -> int:
+        """Read bytes at position ``offset`` into a pre-allocated bytes-like
+        object b, without moving the stream position. Returns the number of
+        bytes read."""
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        start = min(max(offset, 0), self._size)
+        target = memoryview(b).cast('B')
+        n = min(len(target), self._size - start)
+        if n > 0:
+            target[:n] = self._mmap[start:start+n]
+        return n
+
+    def read_at(self, offset: int, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes (all, if negative) at position
+        ``offset``, without moving the stream position."""
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        start = min(max(offset, 0), self._size)
+        stop = self._size if size < 0 else min(start + size, self._size)
+        if stop <= start:
+            return b''
+        return self._mmap[start:stop]
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            pass
+        elif whence == os.SEEK_CUR:
+            pos += self._pos
+        elif whence == os.SEEK_END:
+            pos += self._size
+        else:
+            raise ValueError("whence must be one of 'io.SEEK_{SET,CUR,END}'")
+
+        if pos < 0:
+            raise ValueError("negative seek position")
+
+        self._pos = pos
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, b):
+        """Read bytes into a pre-allocated bytes-like object b.
+
+        Returns:
+            int:
+                The number of bytes read.
+        """
+        n = self.readinto_at(self._pos, b)
+        self._pos = min(self._pos, self._size) + n
+        return n
+
+    def readall(self):
+        data = self.read_at(self._pos)
+        self._pos = max(self._pos, self._size)
+        return data
+
+    def close(self):
+        with self._lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+            self._file.close()
+        super().close()
+
+
+class RangedStream(io.RawIOBase):
+    """Lazy, seekable, read-only binary stream over remote data, downloaded in
+    segments as they are read.
+
+    Args:
+        size:
+            Data size in bytes.
+
+        segment_size:
+            Size of the segments in which data is fetched (the last segment can
+            be shorter).
+
+        fetch:
+            Segment downloader, called as ``fetch(segment, write_at)`` for a
+            :class:`.Segment` not yet fetched. It should write data received
+            with ``write_at(offset, data)``, and advance ``segment.offset``.
+
+        executor:
+            If given, segments missing for a read that spans multiple segments
+            are fetched concurrently, on this executor. Once the executor is
+            shut down, segments are fetched in the reading thread.
+
+    Note:
+        Each segment is fetched at most once, into a :class:`.MappedSpool`
+        released when the stream is closed.
+    """
+
+    def __init__(self, size: int, segment_size: int,
+                 fetch: abc.Callable[[Segment, abc.Callable[[int, bytes], int]], None],
+                 executor: Optional[Executor] = None):
+        super().__init__()
+        if segment_size <= 0:
+            raise ValueError("positive segment size required")
+
+        self._size = size
+        self._segment_size = segment_size
+        self._fetch = fetch
+        self._executor = executor
+        self._pos = 0
+
+        self._spool = MappedSpool(size)
+
+        num_segments = -(-size // segment_size)
+        self._loaded = [False] * num_segments
+        self._locks = [threading.Lock() for _ in range(num_segments)]
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def num_segments(self) -> int:
+        """Total number of data segments."""
+        return len(self._loaded)
+
+    @property
+    def num_loaded(self) -> int:
+        """Number of data segments fetched."""
+        return sum(self._loaded)
+
+    def load(self, index: int, fetch: Optional[abc.Callable] = None) -> None:
+        """Fetch segment ``index``, unless it's already loaded.
+
+        A segment-specific ``fetch`` function can be given (e.g. to consume a
+        response already open), overriding the stream default.
+        """
+        if self._loaded[index]:
+            return
+
+        with self._locks[index]:
+            if self._loaded[index]:
+                return
+            if self.closed:
+                raise ValueError("I/O operation on closed file.")
+
+            start = index * self._segment_size
+            segment = Segment(start, min(start + self._segment_size, self._size))
+            (fetch or self._fetch)(segment, self._spool.write_at)
+            self._loaded[index] = True
+
+    def load_all(self) -> None:
+        """Fetch all segments not yet loaded."""
+        self._load_range(0, self._size)
+
+    def _load_range(self, start: int, stop: int) -> None:
+        if stop <= start:
+            return
+
+        missing = [index for index in range(start // self._segment_size,
+                                            (stop - 1) // self._segment_size + 1)
+                   if not self._loaded[index]]
+
+        futures = []
+        try:
+            if len(missing) > 1 and self._executor is not None:
+                try:
+                    for index in missing:
+                        futures.append(self._executor.submit(self.load, index))
+                except RuntimeError:
+                    # executor shut down, fetch the rest in this thread
+                    pass
+
+            for index in missing[len(futures):]:
+                self.load(index)
+            for future in futures:
+                future.result()
+        except:
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        if whence == os.SEEK_SET:
+            pass
+        elif whence == os.SEEK_CUR:
+            pos += self._pos
+        elif whence == os.SEEK_END:
+            pos += self._size
+        else:
+            raise ValueError("whence must be one of 'io.SEEK_{SET,CUR,END}'")
+
+        if pos < 0:
+            raise ValueError("negative seek position")
+
+        self._pos = pos
+        return self._pos
+
+    def tell(self):
+        return self._pos
+
+    def readinto(self, b):
+        """Read bytes into a pre-allocated bytes-like object b, fetching
+        segments as needed.
+
+        Returns:
+            int:
+                The number of bytes read.
+        """
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        start = min(self._pos, self._size)
+        stop = min(start + memoryview(b).nbytes, self._size)
+        self._load_range(start, stop)
+
+        n = self._spool.readinto_at(start, b)
+        self._pos = start + n
+        return n
+
+    def readall(self):
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+
+        start = min(self._pos, self._size)
+        self._load_range(start, self._size)
+
+        self._pos = max(self._pos, self._size)
+        return self._spool.read_at(start)
+
+    def close(self):
+        self._spool.close()
+        super().close()
@@ -41,6 +41,17 @@ class SolverOfflineError(SolverError):
 class SolverAuthenticationError(_api.ResourceAuthenticationError, SolverError):
     """Invalid token or access denied"""
 
+class SolverThrottledError(SolverError):
+    """Request rejected due to rate limiting (429) or server overload (503).
+
+    Time the server asked us to wait before retrying (parsed from
+    ``Retry-After`` response header) is available in ``retry_after``.
+    """
+
+    def __init__(self, *args, retry_after=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.retry_after = retry_after
+
 class UnsupportedSolverError(SolverError):
     """The solver received from the API is not supported by the client"""
 
@@ -77,6 +88,10 @@ class ProblemUploadError(Exception):
     """Problem multipart upload failed."""
 
 
+class InFlightLimitExceeded(Exception):
+    """Problem submit rejected due to the client's in-flight problems limit."""
+
+
 class UseAfterCloseError(Exception):
     """Use attempted after client/solver/connection was closed."""
 
@@ -0,0 +1,285 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Crash-safe journal of submitted problems.
+
+The journal is an append-only log of problem state transitions (submitted,
+acknowledged by the server, resolved), kept in a SQLite database on the local
+disk. After a crash, problems acknowledged but not resolved can be retrieved
+(see :meth:`~dwave.cloud.client.Client.resume_from_journal`), so their results
+are not lost.
+
+Transitions are recorded by an owner (a journal instance), which holds a lease
+on its problems while alive. Only problems of owners whose lease is released
+(on close) or lapsed (after a crash) can be claimed for resume.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from typing import NamedTuple, Optional
+
+from dwave.cloud.config import get_cache_dir
+
+__all__ = ['Journal', 'JournalEntry']
+
+logger = logging.getLogger(__name__)
+
+
+class JournalEntry(NamedTuple):
+    """Problem acknowledged by the server, as recorded in the journal."""
+
+    problem_id: str
+    endpoint: Optional[str]
+    solver: Optional[str]
+    time: float
+
+
+class Journal:
+    """Append-only log of problem state transitions, stored in a SQLite
+    database.
+
+    Each transition is committed on record, so the journal survives a crash of
+    the process (or of the machine, up to the last checkpoint). A journal can
+    be shared between processes.
+
+    Each journal instance is an owner of the transitions it records, and holds
+    a lease on them, renewed in a background thread every ``lease_ttl/3``
+    seconds, and released on :meth:`.close`. Problems of other live owners are
+    not claimed (see :meth:`.claim`). Transitions of resolved problems are
+    deleted when a journal is opened.
+
+    Args:
+        path:
+            Journal database file path. Defaults to ``journal.sqlite`` in the
+            package cache directory (see
+            :func:`~dwave.cloud.config.get_cache_dir`).
+
+        lease_ttl:
+            Time, in seconds, after which a lease not renewed lapses (e.g.
+            after a crash of the owner).
+
+    .. versionadded:: 0.14.0
+    """
+
+    SUBMITTED = 'submitted'
+    ACKNOWLEDGED = 'acknowledged'
+    RESOLVED = 'resolved'
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS transitions (
+            seq INTEGER PRIMARY KEY AUTOINCREMENT,
+            time REAL NOT NULL,
+            event TEXT NOT NULL,
+            key TEXT NOT NULL,
+            problem_id TEXT,
+            endpoint TEXT,
+            solver TEXT,
+            status TEXT,
+            owner TEXT
+        );
+        CREATE INDEX IF NOT EXISTS transitions_problem_id
+            ON transitions (problem_id, event);
+        CREATE INDEX IF NOT EXISTS transitions_key
+            ON transitions (key);
+        CREATE TABLE IF NOT EXISTS leases (
+            owner TEXT PRIMARY KEY,
+            expires REAL NOT NULL
+        );
+    """
+
+    # transitions recorded by owners without a live lease (or before owners
+    # were recorded) can be claimed
+    _UNOWNED = """
+        (owner IS NULL OR owner NOT IN (
+            SELECT owner FROM leases WHERE expires > :now))
+    """
+
+    def __init__(self, path: Optional[str] = None, lease_ttl: float = 60):
+        if path is None:
+            path = os.path.join(get_cache_dir(create=True), 'journal.sqlite')
+        self.path = path
+        self.lease_ttl = lease_ttl
+
+        #: Owner ID of transitions recorded by this journal instance.
+        self.owner = uuid.uuid4().hex
+
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(
+            path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._con.execute('PRAGMA journal_mode=WAL')
+        self._con.execute('PRAGMA synchronous=NORMAL')
+        self._con.executescript(self._SCHEMA)
+
+        columns = [row[1] for row in self._con.execute('PRAGMA table_info(transitions)')]
+        if 'owner' not in columns:
+            self._con.execute('ALTER TABLE transitions ADD COLUMN owner TEXT')
+
+        self._renew_lease()
+        self._compact()
+
+        self._lease_released = threading.Event()
+        self._lease_renewer = threading.Thread(
+            target=self._do_renew_lease, daemon=True)
+        self._lease_renewer.start()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(path={self.path!r})"
+
+    def _renew_lease(self) -> None:
+        self._con.execute(
+            'INSERT OR REPLACE INTO leases (owner, expires) VALUES (?, ?)',
+            (self.owner, time.time() + self.lease_ttl))
+
+    def _do_renew_lease(self) -> None:
+        while not self._lease_released.wait(self.lease_ttl / 3):
+            with self._lock:
+                if self._con is None or self._lease_released.is_set():
+                    return
+                try:
+                    self._renew_lease()
+                except sqlite3.Error as exc:
+                    logger.debug("Journal lease renewal failed with %r", exc)
+
+    def _release_lease(self) -> None:
+        """Stop lease renewal, and release the lease (problems of this owner
+        become claimable)."""
+        with self._lock:
+            self._lease_released.set()
+            if self._con is not None:
+                self._con.execute('DELETE FROM leases WHERE owner = ?', (self.owner,))
+
+    def _compact(self) -> None:
+        """Delete transitions of resolved problems, of problems never
+        acknowledged by unowned submits, and expired leases."""
+        params = dict(now=time.time(), ack=self.ACKNOWLEDGED,
+                      resolved=self.RESOLVED)
+        self._con.execute(f"""
+            DELETE FROM transitions WHERE key IN (
+                SELECT key FROM transitions WHERE problem_id IN (
+                    SELECT problem_id FROM transitions WHERE event = :resolved)
+                UNION
+                SELECT key FROM transitions
+                WHERE {self._UNOWNED}
+                GROUP BY key
+                HAVING SUM(event = :ack) = 0)
+        """, params)
+        self._con.execute('DELETE FROM leases WHERE expires <= :now', params)
+
+    def record(self, event: str, key: str, *,
+               problem_id: Optional[str] = None,
+               endpoint: Optional[str] = None,
+               solver: Optional[str] = None,
+               status: Optional[str] = None) -> None:
+        """Append a problem state transition.
+
+        Args:
+            event:
+                Transition, one of :attr:`.SUBMITTED`, :attr:`.ACKNOWLEDGED`
+                or :attr:`.RESOLVED`.
+            key:
+                Client-side problem key (stable across transitions, including
+                the ones before problem ID is known).
+            problem_id:
+                Problem ID, if known.
+            endpoint:
+                SAPI endpoint the problem was submitted to.
+            solver:
+                Solver name.
+            status:
+                Problem status on resolve.
+        """
+        with self._lock:
+            if self._con is None:
+                logger.debug("Journal closed, %r transition for %r not recorded",
+                             event, key)
+                return
+
+            self._con.execute(
+                'INSERT INTO transitions '
+                '(time, event, key, problem_id, endpoint, solver, status, owner) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (time.time(), event, key, problem_id, endpoint, solver, status,
+                 self.owner))
+
+    _PENDING = """
+        SELECT problem_id, endpoint, solver, MIN(time) AS time
+        FROM transitions AS t
+        WHERE event = :ack
+            AND (:endpoint IS NULL OR endpoint = :endpoint)
+            AND NOT EXISTS (
+                SELECT 1 FROM transitions AS r
+                WHERE r.problem_id = t.problem_id AND r.event = :resolved)
+            {where}
+        GROUP BY problem_id
+        ORDER BY time
+    """
+
+    def pending(self, endpoint: Optional[str] = None) -> list[JournalEntry]:
+        """Return problems acknowledged by the server, but not resolved,
+        optionally filtered by ``endpoint``, in order of acknowledgment.
+
+        Problems of all owners are included, live or not.
+        """
+        params = dict(ack=self.ACKNOWLEDGED, resolved=self.RESOLVED,
+                      endpoint=endpoint)
+        with self._lock:
+            if self._con is None:
+                return []
+            rows = self._con.execute(self._PENDING.format(where=''), params).fetchall()
+        return [JournalEntry(*row) for row in rows]
+
+    def claim(self, endpoint: Optional[str] = None) -> list[JournalEntry]:
+        """Take over problems acknowledged by the server, but not resolved,
+        of owners without a live lease, optionally filtered by ``endpoint``.
+
+        Claimed problems are owned by this journal, so they are not claimed
+        by other journals while this one is alive.
+
+        Returns:
+            Claimed problems, in order of acknowledgment.
+        """
+        query = self._PENDING.format(where=f'AND {self._UNOWNED}')
+        params = dict(ack=self.ACKNOWLEDGED, resolved=self.RESOLVED,
+                      endpoint=endpoint, now=time.time())
+        with self._lock:
+            if self._con is None:
+                return []
+
+            # claim atomically wrt other processes
+            self._con.execute('BEGIN IMMEDIATE')
+            try:
+                rows = self._con.execute(query, params).fetchall()
+                self._con.executemany(
+                    'UPDATE transitions SET owner = ? WHERE key IN ('
+                    '   SELECT key FROM transitions WHERE problem_id = ?)',
+                    [(self.owner, row[0]) for row in rows])
+                self._con.execute('COMMIT')
+            except:
+                self._con.execute('ROLLBACK')
+                raise
+
+        return [JournalEntry(*row) for row in rows]
+
+    def close(self) -> None:
+        """Release the lease, and close the journal database. Transitions
+        recorded after close are ignored."""
+        self._release_lease()
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
@@ -31,13 +31,13 @@ You can list all solvers available to a :class:`~dwave.cloud.client.Client` with
 import io
 import concurrent.futures
 import copy
+import itertools
 import logging
 import orjson
 import warnings
 import weakref
 from collections import abc
 from functools import partial, cached_property
-from tempfile import SpooledTemporaryFile
 from typing import Any, Literal, Optional, Union, TYPE_CHECKING
 
 from dwave.cloud.api.models import (
@@ -46,9 +46,10 @@ from dwave.cloud.exceptions import (
     SolverPropertyMissingError, UnsupportedSolverError, ProblemStructureError)
 from dwave.cloud.coders import (
     encode_problem_as_qp, encode_problem_as_ref, decode_binary_ref,
-    decode_qp_numpy, decode_qp, decode_bq)
+    decode_qp_numpy, decode_qp, decode_qp_field, decode_bq, _QPEncodingIndex, _encode_doubles,
+    _encode_qp_body)
 from dwave.cloud.computation import Future
-from dwave.cloud.concurrency import Present
+from dwave.cloud.concurrency import LRUCache, Present, SharedArrays
 from dwave.cloud.events import dispatches_events
 from dwave.cloud.utils.qubo import reformat_qubo_as_ising
 
@@ -86,6 +87,23 @@ if TYPE_CHECKING:
         _Vartype = _Type
 
 
+def _expand_param_grid(param_grid: Union[abc.Mapping[str, abc.Sequence],
+                                         abc.Iterable[abc.Mapping[str, Any]]]
+                       ) -> list[dict[str, Any]]:
+    """Expand a parameter grid into a list of parameter sets.
+
+    A mapping of parameter names to lists of values is expanded into a
+    cartesian product (with the last parameter varying fastest). An iterable
+    of mappings is taken as an explicit list of parameter sets.
+    """
+    if isinstance(param_grid, abc.Mapping):
+        names = list(param_grid)
+        return [dict(zip(names, values))
+                for values in itertools.product(*param_grid.values())]
+
+    return [dict(params) for params in param_grid]
+
+
 class BaseSolver:
     """Base class for a general D-Wave solver.
 
@@ -192,14 +210,25 @@ class BaseSolver:
     def check_problem(self, *args, **kwargs):
         return True
 
-    def _decode_qp(self, msg):
+    def _decode_qp(self, msg, decoded=None):
         if _numpy:
-            return decode_qp_numpy(msg, return_matrix=self.return_matrix)
+            return decode_qp_numpy(msg, return_matrix=self.return_matrix,
+                                   decoded=decoded)
         else:
-            return decode_qp(msg)
+            return decode_qp(msg, decoded=decoded)
+
+    def _decode_qp_field(self, msg, field, active_variables=None):
+        return decode_qp_field(msg, field, use_numpy=_numpy,
+                               return_matrix=self.return_matrix,
+                               active_variables=active_variables)
 
     def _download_binary_ref(self, *, auth_method: str, url: str,
                              output: Optional[io.IOBase] = None) -> Union[bytes, io.IOBase]:
+        if output is None:
+            # download lazily, as answer data is read
+            return self.client._open_answer_binary_ref(
+                auth_method=auth_method, url=url)
+
         return self.client._download_answer_binary_ref(
             auth_method=auth_method, url=url, output=output).result()
 
@@ -231,6 +260,9 @@ class BaseSolver:
     def sample_bqm(self, bqm, **params):
         raise NotImplementedError
 
+    def sample_sweep(self, problem, param_grid, **kwargs):
+        raise NotImplementedError
+
     def upload_bqm(self, bqm):
         raise NotImplementedError
 
@@ -313,7 +345,8 @@ class BaseUnstructuredSolver(BaseSolver):
         Events are not yet dispatched from unstructured solvers.
     """
 
-    def sample_ising(self, linear, quadratic, offset=0, label=None, **params):
+    def sample_ising(self, linear, quadratic, offset=0, label=None, priority=0,
+                     **params):
         """Sample from the specified :term:`Ising` model.
 
         Args:
@@ -335,6 +368,13 @@ class BaseUnstructuredSolver(BaseSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             **params:
                 Parameters for the sampling method, solver-specific.
 
@@ -351,9 +391,9 @@ class BaseUnstructuredSolver(BaseSolver):
                                "Re-install the library with bqm/cqm/dqm support.")
 
         bqm = dimod.BinaryQuadraticModel.from_ising(linear, quadratic, offset)
-        return self.sample_bqm(bqm, label=label, **params)
+        return self.sample_bqm(bqm, label=label, priority=priority, **params)
 
-    def sample_qubo(self, qubo, offset=0, label=None, **params):
+    def sample_qubo(self, qubo, offset=0, label=None, priority=0, **params):
         """Sample from the specified :term:`QUBO`.
 
         Args:
@@ -370,6 +410,13 @@ class BaseUnstructuredSolver(BaseSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             **params:
                 Parameters for the sampling method, solver-specific.
 
@@ -386,7 +433,7 @@ class BaseUnstructuredSolver(BaseSolver):
                                "Re-install the library with bqm/cqm/dqm support.")
 
         bqm = dimod.BinaryQuadraticModel.from_qubo(qubo, offset)
-        return self.sample_bqm(bqm, label=label, **params)
+        return self.sample_bqm(bqm, label=label, priority=priority, **params)
 
     def _encode_problem_for_upload(self, problem, **kwargs):
         """Encode problem for upload to solver.
@@ -422,6 +469,12 @@ class BaseUnstructuredSolver(BaseSolver):
             :class:`concurrent.futures.Future`\ [str]:
                 Problem ID in a Future. Problem ID can be used to submit
                 problems by reference.
+
+        Note:
+            With the ``upload_cache`` client config option enabled, a problem
+            with the same encoded content as a problem uploaded earlier is not
+            uploaded again, and ID of the problem data already uploaded is
+            returned.
         """
         try:
             data = self._encode_problem_for_upload(problem, **kwargs)
@@ -442,8 +495,9 @@ class BaseUnstructuredSolver(BaseSolver):
         problem if it's not already uploaded.
 
         Args:
-            problem (dimod-model-like/str):
-                A quadratic model, or a reference to one (Problem ID).
+            problem (dimod-model-like/str/:class:`concurrent.futures.Future`):
+                A quadratic model, or a reference to one (Problem ID), or a
+                reference in a future (as returned by :meth:`.upload_problem`).
 
             problem_type (str):
                 Problem type, one of the handled problem types by the solver.
@@ -472,6 +526,8 @@ class BaseUnstructuredSolver(BaseSolver):
 
         if isinstance(problem, str):
             problem_id = problem
+        elif isinstance(problem, concurrent.futures.Future):
+            problem_id = problem.result()
         else:
             logger.debug("To encode the problem for submit in the 'ref' format, "
                          "we need to upload it first.")
@@ -495,7 +551,7 @@ class BaseUnstructuredSolver(BaseSolver):
 
     @dispatches_events('sample')
     def sample_problem(self, problem, problem_type=None, label=None,
-                       upload_params=None, **sample_params):
+                       upload_params=None, priority=0, **sample_params):
         """Sample from the specified problem.
 
         Args:
@@ -512,6 +568,13 @@ class BaseUnstructuredSolver(BaseSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             upload_params (dict):
                 Optional upload/encode parameters, solver specific.
 
@@ -529,6 +592,7 @@ class BaseUnstructuredSolver(BaseSolver):
         # computation future holds a reference to the remote job
         computation = Future(
             solver=self, id_=None, return_matrix=self.return_matrix)
+        computation._priority = priority
 
         # encode the request (body as future)
         body = self.client._encode_problem_executor.submit(
@@ -542,6 +606,63 @@ class BaseUnstructuredSolver(BaseSolver):
 
         return computation
 
+    def sample_sweep(self, problem, param_grid, problem_type=None, label=None,
+                     upload_params=None, priority=0):
+        """Sample from the specified problem with each set of sampling
+        parameters in a parameter grid.
+
+        The problem is uploaded only once, and all parameter variants are
+        submitted by reference to it.
+
+        Args:
+            problem (model-like/str):
+                A quadratic model (e.g. :class:`~dimod.BQM`, :class:`~dimod.CQM`,
+                :class:`~dimod.DQM`), a nonlinear model (:class:`~dwave.optimization.Model`)
+                or a reference to one (Problem ID returned by :meth:`.upload_problem` method).
+
+            param_grid (dict[str, list]/list[dict]):
+                Sampling parameters grid. Either a mapping of parameter names
+                to lists of values, expanded to all value combinations (the
+                last parameter varying fastest), or a list of parameter sets.
+
+            problem_type (str, optional):
+                Problem type, one of the handled problem types by the solver.
+                If not specified, the first handled problem type is used.
+
+            label (str, optional):
+                Problem label, used for all submissions.
+
+            upload_params (dict):
+                Optional upload/encode parameters, solver specific.
+
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues.
+
+        Returns:
+            list[:class:`~dwave.cloud.computation.Future`]:
+                Futures in parameter grid order.
+
+        Examples:
+            >>> import dimod
+            >>> from dwave.cloud import Client
+            >>> bqm = dimod.generators.ran_r(1, 10)
+            >>> with Client.from_config() as client:    # doctest: +SKIP
+            ...     solver = client.get_solver(supported_problem_types__contains='bqm')
+            ...     futures = solver.sample_sweep(bqm, dict(time_limit=[5, 10, 20]))
+            ...     energies = [f.sampleset.first.energy for f in futures]
+
+        .. versionadded:: 0.14.0
+        """
+        if not isinstance(problem, str):
+            if upload_params is None:
+                upload_params = {}
+            problem = self.upload_problem(problem, **upload_params)
+
+        return [self.sample_problem(problem, problem_type=problem_type,
+                                    label=label, priority=priority, **params)
+                for params in _expand_param_grid(param_grid)]
+
 
 class BQMSolver(BaseUnstructuredSolver):
     """Class for D-Wave unstructured binary quadratic model solvers.
@@ -564,7 +685,7 @@ class BQMSolver(BaseUnstructuredSolver):
     def _encode_problem_for_upload(self, bqm, **kwargs):
         return bqm.to_file()
 
-    def sample_bqm(self, bqm, label=None, **params):
+    def sample_bqm(self, bqm, label=None, priority=0, **params):
         """Sample from the specified :term:`BQM`.
 
         Args:
@@ -576,6 +697,13 @@ class BQMSolver(BaseUnstructuredSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             **params:
                 Parameters for the sampling method, solver-specific.
 
@@ -585,7 +713,7 @@ class BQMSolver(BaseUnstructuredSolver):
         Note:
             To use this method, dimod package has to be installed.
         """
-        return self.sample_problem(bqm, label=label, **params)
+        return self.sample_problem(bqm, label=label, priority=priority, **params)
 
     def upload_bqm(self, bqm):
         r"""Upload the specified :term:`BQM` to SAPI, returning a Problem ID
@@ -883,20 +1011,6 @@ class NLSolver(BaseUnstructuredSolver):
         return self.sample_problem(
             model, label=label, upload_params=upload_params, **sample_params)
 
-    def sample_problem(self, *args, **kwargs):
-        sf = SpooledTemporaryFile(max_size=1e8, mode='w+b')
-        # backport a fix for bpo-26175, https://github.com/python/cpython/pull/29560.
-        # to make sure `zipfile` works with `SpooledTemporaryFile` in Python < 3.11
-        if not hasattr(sf, 'seekable'):
-            # of all the methods fixed in the above PR, only seekable is actually
-            # ever used in `zipfile`.
-            sf.seekable = lambda: sf._file.seekable()
-
-        future = super().sample_problem(*args, **kwargs)
-        future._answer_data = sf
-
-        return future
-
     def upload_nlm(self,
                    model: Union['dwave.optimization.Model', io.IOBase, bytes],
                    **upload_params,
@@ -1025,6 +1139,27 @@ class StructuredSolver(BaseSolver):
         # solver couplers converted to list of tuples
         return [tuple(edge) for edge in self.properties['couplers']]
 
+    @cached_property
+    def encoding_cache(self) -> Optional[LRUCache]:
+        """Cache of encoded problem data, keyed by problem content, if enabled
+        with the ``encoding_cache_size`` config option. Sampling the same
+        problem again, e.g. with different parameters, reuses its encoded
+        data. See :attr:`~dwave.cloud.concurrency.LRUCache.stats` for hit/miss
+        counts.
+
+        .. versionadded:: 0.14.0
+        """
+        config = getattr(self.client, 'config', None)
+        size = getattr(config, 'encoding_cache_size', None)
+        if isinstance(size, int) and size > 0:
+            return LRUCache(maxsize=size)
+        return None
+
+    @cached_property
+    def _encoding_index(self) -> '_QPEncodingIndex':
+        # qubit/coupler to `qp` encoding position maps (requires numpy)
+        return _QPEncodingIndex(self._encoding_qubits, self._encoding_couplers)
+
     @cached_property
     def edges(self) -> set[tuple[int, int]]:
         """The edges in this solver's graph, including both directions: (a,b) and (b,a)."""
@@ -1085,7 +1220,8 @@ class StructuredSolver(BaseSolver):
 
     # Sampling methods
 
-    def sample_ising(self, linear, quadratic, offset=0, label=None, **params):
+    def sample_ising(self, linear, quadratic, offset=0, label=None, priority=0,
+                     **params):
         """Sample from the specified :term:`Ising` model.
 
         Args:
@@ -1107,6 +1243,13 @@ class StructuredSolver(BaseSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             **params:
                 Parameters for the sampling method, solver-specific.
 
@@ -1137,9 +1280,10 @@ class StructuredSolver(BaseSolver):
         """
         # Our linear and quadratic objective terms are already separated in an
         # ising model so we can just directly call `_sample`.
-        return self._sample('ising', linear, quadratic, offset, params, label=label)
+        return self._sample('ising', linear, quadratic, offset, params,
+                            label=label, priority=priority)
 
-    def sample_qubo(self, qubo, offset=0, label=None, **params):
+    def sample_qubo(self, qubo, offset=0, label=None, priority=0, **params):
         """Sample from the specified :term:`QUBO`.
 
         Args:
@@ -1156,6 +1300,13 @@ class StructuredSolver(BaseSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             **params:
                 Parameters for the sampling method, solver-specific.
 
@@ -1186,9 +1337,10 @@ class StructuredSolver(BaseSolver):
 
         """
         linear, quadratic = reformat_qubo_as_ising(qubo)
-        return self._sample('qubo', linear, quadratic, offset, params, label=label)
+        return self._sample('qubo', linear, quadratic, offset, params,
+                            label=label, priority=priority)
 
-    def sample_bqm(self, bqm, label=None, **params):
+    def sample_bqm(self, bqm, label=None, priority=0, **params):
         """Sample from the specified :term:`BQM`.
 
         Args:
@@ -1199,6 +1351,13 @@ class StructuredSolver(BaseSolver):
                 Problem label you can optionally tag submissions with for ease
                 of identification.
 
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues. Problems with a higher priority are handled first,
+                but without starving lower-priority problems.
+
+                .. versionadded:: 0.14.0
+
             **params:
                 Parameters for the sampling method, solver-specific.
 
@@ -1221,17 +1380,90 @@ class StructuredSolver(BaseSolver):
         else:
             raise TypeError("unknown/unsupported vartype")
 
-        # convert to dicts once, to save multiple conversions later on
-        linear = dict(bqm.linear)
-        quadratic = dict(bqm.quadratic)
+        # note: bqm is checked and encoded directly from its vectors, without
+        # expansion to dicts (if numpy is available)
+        return self._sample(problem_type, bqm.linear, bqm.quadratic, bqm.offset,
+                            params, label=label, priority=priority,
+                            undirected_biases=True, bqm=bqm)
+
+    def sample_sweep(self, problem, param_grid, label=None, priority=0):
+        """Sample from the specified problem with each set of sampling
+        parameters in a parameter grid.
+
+        The problem is checked against the solver graph and encoded only
+        once, and all parameter variants are submitted together (in as few
+        batch requests as possible).
+
+        Args:
+            problem (:class:`~dimod.BinaryQuadraticModel`/tuple):
+                A binary quadratic model, or an :term:`Ising` problem given as
+                a ``(linear, quadratic)`` or ``(linear, quadratic, offset)``
+                tuple (see :meth:`.sample_ising`).
+
+            param_grid (dict[str, list]/list[dict]):
+                Sampling parameters grid. Either a mapping of parameter names
+                to lists of values, expanded to all value combinations (the
+                last parameter varying fastest), or a list of parameter sets.
+
+            label (str, optional):
+                Problem label, used for all submissions.
+
+            priority (int, optional, default=0):
+                Problem priority in the client's submit, poll and answer load
+                queues.
+
+        Returns:
+            list[:class:`~dwave.cloud.computation.Future`]:
+                Futures in parameter grid order.
+
+        Examples:
+            This example samples a random Ising problem with a range of
+            annealing times, and varying number of reads.
+
+            >>> from dwave.cloud import Client
+            >>> from dwave.cloud.utils.qubo import generate_random_ising_problem
+            >>> with Client.from_config() as client:    # doctest: +SKIP
+            ...     solver = client.get_solver()
+            ...     h, J = generate_random_ising_problem(solver)
+            ...     grid = dict(annealing_time=[5, 20, 100], num_reads=[10, 100])
+            ...     futures = solver.sample_sweep((h, J), grid)
+            ...     energies = [min(f.energies) for f in futures]
+
+        .. versionadded:: 0.14.0
+        """
+        if isinstance(problem, tuple):
+            type_ = 'ising'
+            linear, quadratic, *rest = problem
+            offset = rest[0] if rest else 0
+            bqm = None
+            undirected_biases = False
+        else:
+            bqm = problem
+            if bqm.vartype is dimod.SPIN:
+                type_ = 'ising'
+            elif bqm.vartype is dimod.BINARY:
+                type_ = 'qubo'
+            else:
+                raise TypeError("unknown/unsupported vartype")
+            linear, quadratic, offset = bqm.linear, bqm.quadratic, bqm.offset
+            undirected_biases = True
+
+        data = self._encode_problem_as_qp(linear, quadratic, offset,
+                                          undirected_biases=undirected_biases,
+                                          bqm=bqm)
 
-        return self._sample(problem_type, linear, quadratic, bqm.offset,
-                            params, label=label, undirected_biases=True)
+        return [self._sample(type_, linear, quadratic, offset, params,
+                             label=label, priority=priority,
+                             undirected_biases=undirected_biases, bqm=bqm,
+                             encoded_data=data)
+                for params in _expand_param_grid(param_grid)]
 
     @dispatches_events('sample')
     def _sample(self, type_, linear, quadratic, offset, params,
-                label=None, undirected_biases=False):
-        """Internal method for `sample_ising`, `sample_qubo` and `sample_bqm`.
+                label=None, priority=0, undirected_biases=False, bqm=None,
+                encoded_data=None):
+        """Internal method for `sample_ising`, `sample_qubo`, `sample_bqm`
+        and `sample_sweep`.
 
         Args:
             linear (list/dict):
@@ -1249,20 +1481,26 @@ class StructuredSolver(BaseSolver):
             label (str, optional):
                 Problem label.
 
+            priority (int, optional, default=0):
+                Problem scheduling priority.
+
             undirected_biases (boolean, default=False):
                 Are (quadratic) biases specified on undirected edges? For
                 triangular or symmetric matrix of quadratic biases set it to
                 ``True``.
 
+            bqm (:class:`~dimod.BinaryQuadraticModel`, optional):
+                Binary quadratic model ``linear`` and ``quadratic`` are views
+                of. If given, the problem is checked and encoded from bqm's
+                numpy vectors.
+
+            encoded_data (dict, optional):
+                Problem already checked and encoded in ``qp`` format.
+
         Returns:
             :class:`~dwave.cloud.computation.Future`
         """
 
-        # Check the problem
-        if not self.check_problem(linear, quadratic):
-            raise ProblemStructureError(
-                f"Problem graph incompatible with {self!r}")
-
         # Mix the new parameters with the default parameters
         combined_params = dict(self._params)
         combined_params.update(params)
@@ -1277,27 +1515,188 @@ class StructuredSolver(BaseSolver):
 
         body_dict = {
             'solver': self.identity.dict(),
-            'data': encode_problem_as_qp(self, linear, quadratic, offset,
-                                         undirected_biases=undirected_biases),
+            'data': encoded_data,
             'type': type_,
             'params': combined_params
         }
         if label is not None:
             body_dict['label'] = label
-        body_data = orjson.dumps(body_dict, option=orjson.OPT_SERIALIZE_NUMPY)
-        logger.trace("Encoded sample request: %r", body_data)
 
-        body = Present(result=body_data)
+        # Check and encode the problem, in a worker process if enabled
+        body = None
+        if encoded_data is None:
+            body = self._encode_body_in_worker(
+                body_dict, linear, quadratic, offset,
+                undirected_biases=undirected_biases, bqm=bqm)
+
+        if body is None:
+            if encoded_data is None:
+                body_dict['data'] = self._encode_problem_as_qp(
+                    linear, quadratic, offset,
+                    undirected_biases=undirected_biases, bqm=bqm)
+
+            body_data = orjson.dumps(body_dict, option=orjson.OPT_SERIALIZE_NUMPY)
+            logger.trace("Encoded sample request: %r", body_data)
+            body = Present(result=body_data)
+
         computation = Future(solver=self, id_=None, return_matrix=self.return_matrix)
 
         # XXX: offset is carried on Future until implemented in SAPI
         computation._offset = offset
+        computation._priority = priority
 
         logger.debug("Submitting new problem to: %r", self.identity)
         self.client._submit(body, computation)
 
         return computation
 
+    def _problem_vectors(self, linear, quadratic, bqm=None):
+        """Problem in vector form (see :meth:`_QPEncodingIndex.encode_vectors`),
+        or ``None`` if numpy is not available, or problem variables are not
+        integers."""
+        if not _numpy or (bqm is None and not isinstance(linear, abc.Mapping)):
+            return None
+
+        try:
+            if bqm is not None:
+                return self._encoding_index.bqm_vectors(bqm)
+            return self._encoding_index.problem_vectors(linear, quadratic)
+        except (TypeError, ValueError, OverflowError):
+            return None
+
+    def _encoding_cache_key(self, vectors, undirected_biases):
+        return (self.graph_id, undirected_biases,
+                self._encoding_index.digest(vectors))
+
+    def _encode_problem_as_qp(self, linear, quadratic, offset,
+                              undirected_biases=False, bqm=None):
+        """Check the problem against the solver graph, and encode it in ``qp``
+        format.
+
+        If numpy is available, and problem variables are integers, the problem
+        is checked and encoded with array operations (directly from ``bqm``
+        vectors, if given). Encoded problems are then also cached in
+        :attr:`.encoding_cache`, if enabled.
+
+        Raises:
+            :exc:`~dwave.cloud.exceptions.ProblemStructureError`:
+                Problem graph incompatible with the solver.
+        """
+        vectors = self._problem_vectors(linear, quadratic, bqm)
+
+        if vectors is None:
+            if bqm is not None:
+                # convert to dicts once, to save multiple conversions later on
+                linear = dict(linear)
+                quadratic = dict(quadratic)
+
+            if not self.check_problem(linear, quadratic):
+                raise ProblemStructureError(
+                    f"Problem graph incompatible with {self!r}")
+
+            return encode_problem_as_qp(self, linear, quadratic, offset,
+                                        undirected_biases=undirected_biases)
+
+        cache = self.encoding_cache
+        encoded = None
+        if cache is not None:
+            key = self._encoding_cache_key(vectors, undirected_biases)
+            encoded = cache.get(key)
+
+        if encoded is None:
+            lin, quad, fits = self._encoding_index.encode_vectors(
+                *vectors, undirected_biases=undirected_biases)
+            if not fits:
+                raise ProblemStructureError(
+                    f"Problem graph incompatible with {self!r}")
+
+            encoded = (_encode_doubles(lin), _encode_doubles(quad))
+            if cache is not None:
+                cache.put(key, encoded)
+
+        return {
+            'format': 'qp',
+            'lin': encoded[0],
+            'quad': encoded[1],
+            'offset': offset
+        }
+
+    @cached_property
+    def _shared_encoding_index(self) -> SharedArrays:
+        # encoding index in shared memory, attached by encoding worker processes
+        shared = self._encoding_index.share()
+        weakref.finalize(self, lambda: (shared.close(), shared.unlink()))
+        return shared
+
+    def _encode_body_in_worker(self, body_dict, linear, quadratic, offset,
+                               undirected_biases=False, bqm=None):
+        """Check and encode the problem in ``qp`` format, and serialize the
+        submit body (``body_dict`` with ``data`` set to encoded problem) in
+        one of client's encoding worker processes. Problem vectors are passed
+        to the worker in shared memory.
+
+        Returns a :class:`concurrent.futures.Future` of the serialized body,
+        or ``None`` if process-pool encoding is not enabled (see
+        ``encoding_processes`` client config option) or not available for the
+        problem.
+
+        Note: problem vectors are built in the calling thread. For biases
+        given as dicts, that's comparable in cost to the encoding offloaded.
+        """
+        pool = getattr(self.client, '_encode_process_pool', None)
+        if pool is None:
+            return None
+
+        vectors = self._problem_vectors(linear, quadratic, bqm)
+        if vectors is None:
+            return None
+
+        cache = self.encoding_cache
+        key = None
+        if cache is not None:
+            key = self._encoding_cache_key(vectors, undirected_biases)
+            encoded = cache.get(key)
+            if encoded is not None:
+                body_dict['data'] = {
+                    'format': 'qp',
+                    'lin': encoded[0],
+                    'quad': encoded[1],
+                    'offset': offset
+                }
+                return Present(result=orjson.dumps(
+                    body_dict, option=orjson.OPT_SERIALIZE_NUMPY))
+
+        problem = SharedArrays(vectors)
+        try:
+            task = pool.submit(
+                _encode_qp_body, self._shared_encoding_index, problem,
+                undirected_biases, offset, body_dict, repr(self),
+                return_encoded=key is not None)
+        except:
+            problem.close()
+            problem.unlink()
+            raise
+
+        body = concurrent.futures.Future()
+
+        def resolve(task):
+            problem.close()
+            problem.unlink()
+
+            try:
+                result = task.result()
+            except BaseException as exc:
+                body.set_exception(exc)
+                return
+
+            if key is not None:
+                result, *encoded = result
+                cache.put(key, tuple(encoded))
+            body.set_result(result)
+
+        task.add_done_callback(resolve)
+        return body
+
     # kept for internal backwards compatibility and in case it's being
     # used externally anywhere.
     def _format_params(self, type_, params):
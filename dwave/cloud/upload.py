@@ -24,7 +24,7 @@ from abc import abstractmethod
 from collections import abc
 from functools import partial
 
-__all__ = ['ChunkedData']
+__all__ = ['ChunkedData', 'ThrottledStream']
 
 logger = logging.getLogger(__name__)
 
@@ -229,8 +229,11 @@ class GettableMemory(GettableBase):
             return 0
 
         # copy source[start:stop] => target[0:stop-start]
-        source_view = self._buf[start:stop]
-        target_view = memoryview(buf)
+        # note: slice a memoryview, so that only the bytes copied into the
+        # target are touched (and not the complete source slice)
+        target_view = memoryview(buf).cast('B')
+        stop = min(stop, start + len(target_view))
+        source_view = memoryview(self._buf)[start:stop]
         size = min(len(source_view), len(target_view))
         target_view[:size] = source_view[:size]
 
@@ -326,6 +329,59 @@ class FileView(io.RawIOBase):
         return self._raw[self._offset + start]
 
 
+class ThrottledStream(io.RawIOBase):
+    """A raw binary stream that limits the read rate of the wrapped stream.
+
+    Each byte read takes one token from a (possibly shared)
+    :class:`~dwave.cloud.concurrency.TokenBucket`, so the aggregate read rate of
+    all streams sharing a bucket is bounded by the bucket's rate.
+
+    Args:
+        raw (:class:`.FileView`/binary-stream-like):
+            Sized wrapped stream that supports `readinto`, `seek` and `tell`.
+
+        bucket (:class:`~dwave.cloud.concurrency.TokenBucket`):
+            Token bucket, one token per byte.
+    """
+
+    def __init__(self, raw, bucket):
+        super().__init__()
+        self._raw = raw
+        self._bucket = bucket
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return self._raw.seekable()
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        return self._raw.seek(pos, whence)
+
+    def tell(self):
+        return self._raw.tell()
+
+    def readinto(self, b):
+        """Read bytes into a pre-allocated bytes-like object b, at most
+        bucket capacity bytes at a time. Tokens are taken only for the bytes
+        left in the stream.
+
+        Returns:
+            int:
+                The number of bytes read.
+        """
+        target = memoryview(b).cast('B')
+        size = min(len(target), max(0, len(self._raw) - self._raw.tell()))
+        if self._bucket.rate is not None:
+            size = min(size, max(1, int(self._bucket.capacity)))
+        if size:
+            self._bucket.acquire(size)
+        return self._raw.readinto(target[:size])
+
+    def __len__(self):
+        return len(self._raw)
+
+
 class ChunkedData(object):
     """Unifying and performant streaming file-like interface to (large problem)
     data chunks.
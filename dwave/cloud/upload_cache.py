@@ -0,0 +1,130 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Content-addressed cache of uploaded problem data.
+
+The cache maps a content hash of an encoded problem to the ID of the problem
+data already uploaded to SAPI, kept in a SQLite database on the local disk.
+Problems uploaded repeatedly (e.g. sampled with different parameters) can be
+submitted by reference to the uploaded data, skipping the upload.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+from dwave.cloud.config import get_cache_dir
+
+__all__ = ['UploadCache']
+
+logger = logging.getLogger(__name__)
+
+
+class UploadCache:
+    """Persistent map of problem data content hash to uploaded problem data ID,
+    stored in a SQLite database.
+
+    Entries are scoped by SAPI endpoint, and they expire ``maxage`` seconds
+    after upload. A cache can be shared between processes.
+
+    Args:
+        path:
+            Cache database file path. Defaults to ``uploads.sqlite`` in the
+            package cache directory (see
+            :func:`~dwave.cloud.config.get_cache_dir`).
+
+        maxage:
+            Time, in seconds, for which uploaded problem data is assumed to be
+            available for submission by reference.
+
+    Note:
+        Cache hits are not guaranteed to be valid (e.g. uploaded data can be
+        deleted server-side before the entry expires), so uploaded problem
+        status should be verified before use.
+
+    .. versionadded:: 0.14.0
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS uploads (
+            endpoint TEXT NOT NULL,
+            key TEXT NOT NULL,
+            problem_id TEXT NOT NULL,
+            expires REAL NOT NULL,
+            PRIMARY KEY (endpoint, key)
+        );
+    """
+
+    def __init__(self, path: Optional[str] = None, maxage: float = 86400):
+        if path is None:
+            path = os.path.join(get_cache_dir(create=True), 'uploads.sqlite')
+        self.path = path
+        self.maxage = maxage
+
+        self._lock = threading.Lock()
+        self._con = sqlite3.connect(
+            path, timeout=60, isolation_level=None, check_same_thread=False)
+        self._con.execute('PRAGMA journal_mode=WAL')
+        self._con.executescript(self._SCHEMA)
+        self._con.execute('DELETE FROM uploads WHERE expires <= ?', (time.time(),))
+
+    def __repr__(self):
+        return f"{type(self).__name__}(path={self.path!r}, maxage={self.maxage!r})"
+
+    def get(self, endpoint: str, key: str) -> Optional[str]:
+        """Return problem data ID uploaded with content hash ``key`` to
+        ``endpoint``, or ``None`` if not cached, or expired."""
+        with self._lock:
+            if self._con is None:
+                return None
+
+            row = self._con.execute(
+                'SELECT problem_id FROM uploads '
+                'WHERE endpoint = ? AND key = ? AND expires > ?',
+                (endpoint, key, time.time())).fetchone()
+
+        return row[0] if row is not None else None
+
+    def put(self, endpoint: str, key: str, problem_id: str) -> None:
+        """Record problem data with content hash ``key`` uploaded to
+        ``endpoint`` as ``problem_id``."""
+        with self._lock:
+            if self._con is None:
+                logger.debug("Upload cache closed, %r not recorded", problem_id)
+                return
+
+            self._con.execute(
+                'INSERT OR REPLACE INTO uploads (endpoint, key, problem_id, expires) '
+                'VALUES (?, ?, ?, ?)',
+                (endpoint, key, problem_id, time.time() + self.maxage))
+
+    def discard(self, endpoint: str, key: str) -> None:
+        """Remove the entry for content hash ``key`` uploaded to ``endpoint``,
+        if present."""
+        with self._lock:
+            if self._con is not None:
+                self._con.execute(
+                    'DELETE FROM uploads WHERE endpoint = ? AND key = ?',
+                    (endpoint, key))
+
+    def close(self) -> None:
+        """Close the cache database. Lookups after close miss, and puts are
+        ignored."""
+        with self._lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
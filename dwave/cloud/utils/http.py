@@ -18,9 +18,15 @@
    These functions previously lived under ``dwave.cloud.utils``.
 """
 
+import contextlib
+import email.utils
 import platform
+import queue
 import sys
-from typing import Optional
+import threading
+import time
+from datetime import timezone
+from typing import Callable, Iterator, Optional
 from urllib.parse import urljoin
 
 import requests
@@ -110,6 +116,140 @@ class BaseUrlSession(BaseUrlSessionMixin, requests.Session):
     """
 
 
+class SessionPool:
+    """A thread-safe pool of reusable :class:`~requests.Session` objects.
+
+    Since :class:`~requests.Session` is not thread-safe, a session is
+    checked out for exclusive use by one thread, and returned to the pool
+    afterwards, retaining its open (keep-alive) connections for the next user.
+    The most recently returned session is reused first.
+
+    Args:
+        factory:
+            Callable that creates a new session.
+        maxsize:
+            Maximum number of idle sessions kept in the pool. Sessions returned
+            to a full pool are closed. If zero or negative, pool size is
+            unlimited.
+
+    Example::
+
+        pool = SessionPool(factory=requests.Session, maxsize=10)
+        with pool.session() as session:
+            session.get('http://example.com/')
+        pool.close()
+
+    """
+
+    def __init__(self, factory: Callable[[], requests.Session], maxsize: int = 0):
+        self.factory = factory
+        self.maxsize = maxsize
+        self._idle = queue.LifoQueue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._created = 0
+        self._reused = 0
+
+    def __repr__(self):
+        return f"{type(self).__name__}(maxsize={self.maxsize}, stats={self.stats})"
+
+    @property
+    def stats(self) -> dict:
+        """Session pool usage counters: number of sessions ``created``, and
+        number of times an existing session was ``reused``."""
+        with self._lock:
+            return dict(created=self._created, reused=self._reused)
+
+    def acquire(self) -> requests.Session:
+        """Check out a session, creating a new one if none are idle.
+
+        Raises:
+            RuntimeError: pool is closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("cannot acquire a session from a closed pool")
+            try:
+                session = self._idle.get_nowait()
+            except queue.Empty:
+                self._created += 1
+            else:
+                self._reused += 1
+                return session
+
+        # note: create the session without holding the lock
+        return self.factory()
+
+    def release(self, session: requests.Session) -> None:
+        """Return a session checked out with :meth:`.acquire` to the pool."""
+        with self._lock:
+            if not self._closed:
+                try:
+                    self._idle.put_nowait(session)
+                    return
+                except queue.Full:
+                    pass
+        session.close()
+
+    @contextlib.contextmanager
+    def session(self) -> Iterator[requests.Session]:
+        """Context manager that checks out a session for the duration of the
+        block."""
+        session = self.acquire()
+        try:
+            yield session
+        finally:
+            self.release(session)
+
+    def close(self) -> None:
+        """Close all idle sessions. Sessions returned after the pool is closed
+        are closed on return, and new sessions can't be acquired."""
+        with self._lock:
+            self._closed = True
+            idle = []
+            while True:
+                try:
+                    idle.append(self._idle.get_nowait())
+                except queue.Empty:
+                    break
+
+        for session in idle:
+            session.close()
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse ``Retry-After`` HTTP response header value.
+
+    Args:
+        value:
+            Header value, either a (non-negative) number of seconds, or an
+            HTTP-date.
+
+    Return:
+        Number of seconds to wait before retrying the request (clipped to zero
+        for dates in the past), or ``None`` if value is missing or invalid.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+
+    # HTTP-dates are always in GMT, even if not marked as such
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+
+    return max(0.0, date.timestamp() - time.time())
+
+
 def user_agent(name: Optional[str] = None,
                version: Optional[str] = None,
                *,
@@ -14,9 +14,13 @@
 
 import copy
 import base64
+import pickle
 import random
 import struct
 import unittest
+from collections import OrderedDict
+from functools import partial
+from unittest import mock
 
 try:
     import dimod
@@ -28,8 +32,11 @@ from parameterized import parameterized
 from plucky import pluck
 
 from dwave.cloud.coders import (
-    encode_problem_as_qp, decode_qp, decode_qp_numpy, decode_qp_problem,
-    encode_problem_as_bq, decode_bq, encode_problem_as_ref)
+    encode_problem_as_qp, decode_qp, decode_qp_numpy, decode_qp_field, decode_qp_problem,
+    encode_problem_as_bq, decode_bq, encode_problem_as_ref,
+    _encode_qp_body, _QPEncodingIndex)
+from dwave.cloud.concurrency import SharedArrays
+from dwave.cloud.exceptions import ProblemStructureError
 from dwave.cloud.solver import StructuredSolver, UnstructuredSolver
 from dwave.cloud.testing import mocks
 from dwave.cloud.utils.qubo import generate_const_ising_problem, generate_random_ising_problem
@@ -181,6 +188,274 @@ class TestQPCoders(CodersTestBase):
         self.assertEqual(qp['quadratic'], quadratic)
         self.assertEqual(qp['offset'], offset)
 
+    @parameterized.expand([
+        ("C4", lambda: mocks.qpu_chimera_solver_data(4)),
+        ("P6", lambda: mocks.qpu_pegasus_solver_data(6)),
+        ("sparse", lambda: mocks.structured_solver_data(
+            qubits=[1, 3, 4, 7, 10], couplers=[(1, 3), (4, 3), (1, 7), (7, 10), (10, 4)])),
+    ])
+    @unittest.skipUnless(dimod, "dimod required for mock solver generators")
+    def test_qp_vectorized_encoding_matches_generic(self, name, get_solver_data):
+        solver = StructuredSolver(client=None, data=get_solver_data())
+        qubits = solver.properties['qubits']
+        couplers = solver.properties['couplers']
+        rng = random.Random(name)
+
+        # sparse problem with: directed duplicates, reversed couplers,
+        # variables/couplings not on solver, and quadratic-only variables
+        linear = {q: rng.uniform(-2, 2) for q in rng.sample(qubits, len(qubits) // 3)}
+        linear.update({max(qubits) + 10: 1.0, -1: 1.0})
+        quadratic = {}
+        for u, v in rng.sample(couplers, len(couplers) // 2):
+            quadratic[(u, v) if rng.random() < 0.5 else (v, u)] = rng.uniform(-1, 1)
+            if rng.random() < 0.2:
+                quadratic[(v, u)] = rng.uniform(-1, 1)
+        quadratic[(qubits[0], qubits[0])] = 1.0
+        quadratic[(qubits[0], max(qubits) + 1)] = 1.0
+
+        for undirected_biases in (False, True):
+            with self.subTest(undirected_biases=undirected_biases):
+                vectorized = encode_problem_as_qp(
+                    solver, linear, quadratic, undirected_biases=undirected_biases)
+                with mock.patch('dwave.cloud.coders._numpy', False):
+                    generic = encode_problem_as_qp(
+                        solver, linear, quadratic, undirected_biases=undirected_biases)
+
+                self.assertEqual(vectorized, generic)
+
+    @parameterized.expand([
+        ("C4", lambda: mocks.qpu_chimera_solver_data(4)),
+        ("P6", lambda: mocks.qpu_pegasus_solver_data(6)),
+    ])
+    @unittest.skipUnless(dimod, "dimod required for mock solver generators")
+    def test_qp_bqm_encoding_matches_generic(self, name, get_solver_data):
+        solver = StructuredSolver(client=None, data=get_solver_data())
+        rng = random.Random(name)
+
+        # sparse problem, including zero-bias and quadratic-only variables
+        linear, quadratic = generate_random_ising_problem(solver)
+        linear = {q: rng.choice([0, bias]) for q, bias in linear.items()
+                  if rng.random() < 0.5}
+        quadratic = dict(rng.sample(sorted(quadratic.items()), len(quadratic) // 3))
+
+        for vartype in ('SPIN', 'BINARY'):
+            with self.subTest(vartype=vartype):
+                bqm = dimod.BQM(linear, quadratic, 1.5, vartype)
+                encoded = solver._encode_problem_as_qp(
+                    bqm.linear, bqm.quadratic, bqm.offset,
+                    undirected_biases=True, bqm=bqm)
+                expected = encode_problem_as_qp(
+                    solver, dict(bqm.linear), dict(bqm.quadratic), bqm.offset,
+                    undirected_biases=True)
+                self.assertEqual(encoded, expected)
+
+    @unittest.skipUnless(dimod, "dimod required for 'Solver.sample_bqm'")
+    def test_qp_bqm_encoding_checks_structure(self):
+        solver = get_structured_solver()
+
+        def encode(bqm):
+            return solver._encode_problem_as_qp(
+                bqm.linear, bqm.quadratic, bqm.offset, undirected_biases=True, bqm=bqm)
+
+        with self.subTest("compatible"):
+            bqm = dimod.BQM({0: 1, 3: 1}, {(3, 0): -1}, 0, 'SPIN')
+            self.assertEqual(encode(bqm)['quad'], self.encode_doubles([-1]))
+
+        with self.subTest("qubit not on solver"):
+            bqm = dimod.BQM({0: 1, 4: 1}, {}, 0, 'SPIN')
+            with self.assertRaises(ProblemStructureError):
+                encode(bqm)
+
+        with self.subTest("coupler not on solver"):
+            bqm = dimod.BQM({}, {(0, 2): 1}, 0, 'SPIN')
+            with self.assertRaises(ProblemStructureError):
+                encode(bqm)
+
+        with self.subTest("non-integer variables"):
+            bqm = dimod.BQM({0: 1, 'a': 1}, {}, 0, 'SPIN')
+            with self.assertRaises(ProblemStructureError):
+                encode(bqm)
+
+        with self.subTest("non-integral variables"):
+            bqm = dimod.BQM({0: 1, 1.5: 1}, {}, 0, 'SPIN')
+            with self.assertRaises(ProblemStructureError):
+                encode(bqm)
+
+        with self.subTest("numeric string variables"):
+            bqm = dimod.BQM({'0': 1, '1': 1}, {('0', '1'): -1}, 0, 'SPIN')
+            with self.assertRaises(ProblemStructureError):
+                encode(bqm)
+
+    def test_qp_encoding_checks_structure(self):
+        """Problems with variables that aren't qubits are rejected, and
+        invalid biases are not encoded, like with the generic encoder."""
+
+        solver = get_structured_solver()
+
+        def encode(linear, quadratic):
+            return solver._encode_problem_as_qp(linear, quadratic, 0)
+
+        for name, linear, quadratic in [
+                ("numeric string variables", {'0': 1, '1': 1}, {('0', '1'): -1}),
+                ("string variable on coupler", {0: 1}, {(0, '1'): -1})]:
+            with self.subTest(name):
+                with self.assertRaises(ProblemStructureError):
+                    encode(linear, quadratic)
+
+        for name, linear, quadratic in [
+                ("None linear bias", {0: None}, {}),
+                ("None quadratic bias", {0: 1}, {(0, 1): None})]:
+            with self.subTest(name):
+                with mock.patch('dwave.cloud.coders._numpy', False), \
+                        mock.patch('dwave.cloud.solver._numpy', False):
+                    with self.assertRaises(Exception) as generic:
+                        encode(linear, quadratic)
+                with self.assertRaises(type(generic.exception)):
+                    encode(linear, quadratic)
+
+    def test_qp_encoding_cache(self):
+        client = mock.Mock()
+        client.config.encoding_cache_size = 2
+        solver = StructuredSolver(client=client, data=get_structured_solver().data)
+        cache = solver.encoding_cache
+
+        def encode(linear, quadratic, offset=0):
+            return solver._encode_problem_as_qp(linear, quadratic, offset)
+
+        problems = [({0: 1}, {(0, 1): -1}), ({0: 2}, {(0, 1): -1}), ({1: 1}, {})]
+        encoded = [encode(*problem) for problem in problems]
+        self.assertEqual(cache.stats['misses'], 3)
+        self.assertEqual(cache.stats['evictions'], 1)
+
+        with self.subTest("hit"):
+            self.assertEqual(encode(*problems[2]), encoded[2])
+            self.assertEqual(cache.stats['hits'], 1)
+
+        with self.subTest("offset not cached"):
+            self.assertEqual(encode(*problems[2], offset=3), {**encoded[2], 'offset': 3})
+            self.assertEqual(cache.stats['hits'], 2)
+
+        with self.subTest("content keyed"):
+            self.assertEqual(encode({0: 2}, {(1, 0): -1}), encode(*problems[1]))
+            self.assertNotEqual(encode({0: 2.5}, {(0, 1): -1}), encoded[1])
+
+        with self.subTest("evicted"):
+            hits = cache.stats['hits']
+            self.assertEqual(encode(*problems[0]), encoded[0])
+            self.assertEqual(cache.stats['hits'], hits)
+
+        with self.subTest("incompatible problem not cached"):
+            size = cache.stats['size']
+            with self.assertRaises(ProblemStructureError):
+                encode({5: 1}, {})
+            self.assertEqual(cache.stats['size'], size)
+
+        with self.subTest("non-integer variables skip cache"):
+            stats = dict(cache.stats)
+            for linear, quadratic in [({'0': 1, '1': 1}, {('0', '1'): -1}),
+                                      ({'a': 1}, {})]:
+                self.assertFalse(solver.check_problem(linear, quadratic))
+                with self.assertRaises(ProblemStructureError):
+                    encode(linear, quadratic)
+            self.assertEqual(cache.stats, stats)
+
+    def test_qp_encoding_cache_disabled(self):
+        self.assertIsNone(get_structured_solver().encoding_cache)
+
+        client = mock.Mock()
+        client.config.encoding_cache_size = 0
+        solver = StructuredSolver(client=client, data=get_structured_solver().data)
+        self.assertIsNone(solver.encoding_cache)
+
+    def test_qp_vectorized_encoding_fallback(self):
+        """Non-integer variables are encoded with generic encoder."""
+
+        solver = get_structured_solver()
+        linear = {0: 1, 'a': 1}
+        quadratic = {(0, 1): -1, ('a', 'b'): 1}
+        request = encode_problem_as_qp(solver, linear, quadratic)
+        self.assertEqual(request['lin'], self.encode_doubles([1, 0, self.nan, self.nan]))
+        self.assertEqual(request['quad'], self.encode_doubles([-1]))
+
+    def test_qp_vectorized_encoding_rejects_non_integer_labels(self):
+        index = _QPEncodingIndex([0, 1, 2, 3], [(0, 1)])
+
+        np.testing.assert_array_equal(index._as_labels([0, 4]), [0, 4])
+        np.testing.assert_array_equal(index._as_labels([0.0, 4.0]), [0, 4])
+        np.testing.assert_array_equal(index._as_labels(np.array([0, 4], dtype=np.uint8)), [0, 4])
+
+        for labels in (['0', '4'], [True, False], [0, 'a'], [0, None], [0, 2**70]):
+            with self.subTest(labels=labels):
+                with self.assertRaises((TypeError, ValueError, OverflowError)):
+                    index._as_labels(labels)
+
+    def test_qp_vectorized_encoding_rejects_non_numeric_biases(self):
+        index = _QPEncodingIndex([0, 1, 2, 3], [(0, 1)])
+
+        for bias in (None, '1.5', self.nan, 1j):
+            with self.subTest(bias=bias):
+                with self.assertRaises((TypeError, ValueError)):
+                    index.problem_vectors({0: bias}, {})
+                with self.assertRaises((TypeError, ValueError)):
+                    index.problem_vectors({}, {(0, 1): bias})
+
+    def test_qp_vectorized_encoding_numeric_string_labels(self):
+        """Numeric string variables are not mapped onto integer qubits."""
+
+        solver = get_structured_solver()
+        linear = {'0': 1, '1': 1}
+        quadratic = {('0', '1'): -1}
+        request = encode_problem_as_qp(solver, linear, quadratic)
+        with mock.patch('dwave.cloud.coders._numpy', False):
+            generic = encode_problem_as_qp(solver, linear, quadratic)
+        self.assertEqual(request, generic)
+        self.assertEqual(request['lin'], self.encode_doubles([self.nan] * 4))
+
+
+class TestWorkerEncodingIndices(unittest.TestCase):
+    """Worker processes keep only a few solvers' encoding indices attached."""
+
+    def encode(self, index):
+        problem = SharedArrays([np.array([0]), np.array([1.0]),
+                                np.array([], dtype=np.int64),
+                                np.array([], dtype=np.int64), np.array([])])
+        try:
+            # unpickled copies are attached like in a worker process
+            return _encode_qp_body(pickle.loads(pickle.dumps(index)),
+                                   pickle.loads(pickle.dumps(problem)),
+                                   False, 0, {}, 'solver')
+        finally:
+            problem.close()
+            problem.unlink()
+
+    @mock.patch('dwave.cloud.coders._WORKER_ENCODING_INDICES_MAXSIZE', 2)
+    @mock.patch('dwave.cloud.coders._worker_encoding_indices', OrderedDict())
+    def test_eviction(self):
+        from dwave.cloud.coders import _worker_encoding_indices as attached
+
+        shared = [_QPEncodingIndex([0, 1], [(0, 1)]).share() for _ in range(3)]
+        try:
+            for index in shared[:2]:
+                self.encode(index)
+            self.assertEqual(list(attached), [shared[0].name, shared[1].name])
+
+            # reuse marks index as recently used, least recently used is evicted
+            self.encode(shared[0])
+            evicted = attached[shared[1].name]
+            self.encode(shared[2])
+            self.assertEqual(list(attached), [shared[0].name, shared[2].name])
+
+            # evicted index is detached
+            self.assertIsNone(evicted._shared)
+            self.assertIsNone(evicted.qubit_lut)
+
+        finally:
+            for index in attached.values():
+                index.close()
+            for index in shared:
+                index.close()
+                index.unlink()
+
 
 class TestQPDecoders(CodersTestBase):
     """Test QP decoders correctly decode response data."""
@@ -215,6 +490,74 @@ class TestQPDecoders(CodersTestBase):
         np.testing.assert_array_equal(res.get('energies'), np.array(self.res_energies))
         np.testing.assert_array_equal(res.get('num_occurrences'), np.array(self.res_num_occurrences))
 
+    @parameterized.expand([
+        ("generic", dict(use_numpy=False), decode_qp),
+        ("numpy", dict(use_numpy=True, return_matrix=False),
+         partial(decode_qp_numpy, return_matrix=False)),
+    ])
+    def test_qp_response_field_decoding(self, name, options, decoder):
+        msg = copy.deepcopy(self.res_msg)
+        expected = decoder(copy.deepcopy(self.res_msg))
+
+        for field in ('energies', 'num_occurrences', 'active_variables', 'solutions'):
+            with self.subTest(field=field):
+                self.assertEqual(decode_qp_field(msg, field, **options), expected[field])
+
+        # message not modified
+        self.assertEqual(msg, self.res_msg)
+
+        with self.assertRaises(ValueError):
+            decode_qp_field(msg, 'timing', **options)
+
+    @staticmethod
+    def _random_answer_msg(problem_type, num_solutions, active_variables,
+                           total_variables):
+        rng = np.random.default_rng(1)
+        bits = rng.integers(0, 2, size=(num_solutions, len(active_variables)),
+                            dtype=np.uint8)
+        answer = {
+            "format": "qp",
+            "num_variables": total_variables,
+            "energies": base64.b64encode(
+                np.zeros(num_solutions, dtype='<f8').tobytes()).decode(),
+            "active_variables": base64.b64encode(
+                np.array(active_variables, dtype='<i4').tobytes()).decode(),
+            "solutions": base64.b64encode(
+                np.packbits(bits, axis=1).tobytes()).decode(),
+        }
+        return {"type": problem_type, "answer": answer}
+
+    @parameterized.expand([
+        ("ising, all active", "ising", 10, range(13), 13),
+        ("ising, sparse", "ising", 10, [0, 2, 3, 7, 11, 12, 20], 21),
+        ("qubo, sparse", "qubo", 11, [1, 4, 5, 6, 8, 9, 10, 15, 16], 17),
+        ("qubo, no solutions", "qubo", 0, [1, 2], 3),
+        ("ising, no variables", "ising", 4, [], 3),
+    ])
+    def test_qp_response_numpy_decoding_matches_generic(
+            self, name, problem_type, num_solutions, active_variables,
+            total_variables):
+        active_variables = list(active_variables)
+        msg = self._random_answer_msg(
+            problem_type, num_solutions, active_variables, total_variables)
+
+        # note: pure-python decoder sets inactive spins to -1, not to 0
+        expected = np.full((num_solutions, total_variables),
+                           0 if problem_type == 'ising' else 3, dtype=np.int8)
+        generic = np.array(decode_qp(copy.deepcopy(msg))['solutions'], dtype=np.int8)
+        expected[:, active_variables] = generic.reshape(expected.shape)[:, active_variables]
+
+        # decode in one block, and in blocks of different sizes
+        for block_bytes in (1 << 20, 1, 4, 7):
+            with self.subTest(block_bytes=block_bytes):
+                with mock.patch('dwave.cloud.coders._QP_DECODE_BLOCK_BYTES', block_bytes):
+                    res = decode_qp_numpy(copy.deepcopy(msg))
+
+                self.assertEqual(res['solutions'].dtype, np.int8)
+                self.assertEqual(res['solutions'].shape, (num_solutions, total_variables))
+                np.testing.assert_array_equal(res['solutions'], expected)
+
+
 
 class TestQPDecodersWithOffset(TestQPDecoders):
     """Test decoders correctly apply energy offset."""
@@ -12,16 +12,27 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 import sys
+import time
 import unittest
 import threading
 import concurrent.futures
 
+import numpy
+
 from dwave.cloud.concurrency import (
     _PriorityOrderedItem,
+    AgingPriorityQueue,
+    LRUCache,
     _PrioritizedWorkItem,
     _PrioritizingQueue,
     PriorityThreadPoolExecutor,
+    RateLimiter,
+    SharedArrays,
+    SmallestRemainingFirstExecutor,
+    TimerWheel,
+    TokenBucket,
 )
 
 
@@ -152,3 +163,393 @@ class TestPriorityThreadPoolExecutor(unittest.TestCase):
 
         # verify executor shutdown (all threads stopped)
         self.assertFalse(any(t.is_alive() for t in executor._threads))
+
+
+class TestSmallestRemainingFirstExecutor(unittest.TestCase):
+
+    def run_ordered(self, submit, **kwargs):
+        # block the single worker until all tasks are queued
+        go = threading.Event()
+        results = []
+
+        with SmallestRemainingFirstExecutor(max_workers=1, **kwargs) as executor:
+            executor.submit(go.wait)
+            fs = submit(executor, results.append)
+            go.set()
+            concurrent.futures.wait(fs)
+
+        # verify executor shutdown (all threads stopped)
+        self.assertFalse(any(t.is_alive() for t in executor._threads))
+
+        return results
+
+    def test_fallback(self):
+        """Without groups specified, tasks run in submission order."""
+
+        def submit(executor, worker):
+            return [executor.submit(worker, i) for i in range(5)]
+
+        self.assertListEqual(self.run_ordered(submit), list(range(5)))
+
+    def test_smallest_remaining_first(self):
+
+        def submit(executor, worker):
+            fs = [executor.submit(worker, ('big', i), group='big', size=10)
+                  for i in range(3)]
+            fs += [executor.submit(worker, ('small', i), group='small', size=5)
+                   for i in range(2)]
+            return fs
+
+        # small group (10 remaining) goes before the big one (30 remaining)
+        self.assertListEqual(self.run_ordered(submit), [
+            ('small', 0), ('small', 1), ('big', 0), ('big', 1), ('big', 2)])
+
+    def test_remaining_size_updated(self):
+
+        def submit(executor, worker):
+            fs = [executor.submit(worker, ('a', i), group='a', size=s)
+                  for i, s in enumerate([1, 10])]
+            fs += [executor.submit(worker, ('b', i), group='b', size=s)
+                   for i, s in enumerate([5, 5])]
+            return fs
+
+        # a: 11 > b: 10, so b0; then a: 11 > b: 5, so b1; then a
+        self.assertListEqual(self.run_ordered(submit), [
+            ('b', 0), ('b', 1), ('a', 0), ('a', 1)])
+
+    def test_aging(self):
+
+        def submit(executor, worker):
+            fs = [executor.submit(worker, 'old', group='old', size=100)]
+            time.sleep(0.1)
+            fs += [executor.submit(worker, 'new', group='new', size=50)]
+            return fs
+
+        # without aging, the smaller group goes first
+        self.assertListEqual(self.run_ordered(submit), ['new', 'old'])
+
+        # with 1000 units/sec aging, 0.1 sec of waiting is worth more than 50
+        self.assertListEqual(self.run_ordered(submit, aging=1000), ['old', 'new'])
+
+
+class TestTimerWheel(unittest.TestCase):
+
+    def test_due_order(self):
+        wheel = TimerWheel(tick=0.01)
+        now = time.monotonic()
+
+        wheel.put('c', at=now + 0.03)
+        wheel.put('a', at=now - 1)
+        wheel.put('b', at=now)
+        self.assertEqual(len(wheel), 3)
+
+        self.assertEqual(wheel.get(), ['a'])
+        self.assertEqual(wheel.get(), ['b'])
+        self.assertEqual(wheel.get(), ['c'])
+        self.assertGreaterEqual(time.monotonic(), now + 0.03)
+        self.assertEqual(len(wheel), 0)
+
+    def test_max_items_and_lookahead(self):
+        wheel = TimerWheel(tick=0.01)
+        now = time.monotonic()
+
+        for i in range(5):
+            wheel.put(i, at=now)
+        wheel.put(5, at=now + 0.5)
+        wheel.put(6, at=now + 10)
+
+        self.assertEqual(wheel.get(max_items=3, lookahead=1), [0, 1, 2])
+
+        # items due within lookahead from the earliest are grouped
+        t = time.monotonic()
+        self.assertEqual(wheel.get(max_items=10, lookahead=1), [3, 4, 5])
+        self.assertLess(time.monotonic() - t, 0.5)
+
+        self.assertEqual(len(wheel), 1)
+
+    def test_blocking_get(self):
+        wheel = TimerWheel(tick=0.01)
+        result = []
+
+        consumer = threading.Thread(target=lambda: result.append(wheel.get()))
+        consumer.start()
+
+        wheel.put('x', at=time.monotonic() + 0.05)
+        consumer.join(timeout=1)
+
+        self.assertEqual(result, [['x']])
+
+    def test_close(self):
+        wheel = TimerWheel(tick=0.01)
+        wheel.put('x', at=time.monotonic() + 100)
+        result = []
+
+        consumer = threading.Thread(target=lambda: result.append(wheel.get()))
+        consumer.start()
+
+        wheel.close()
+        consumer.join(timeout=1)
+
+        self.assertEqual(result, [None])
+
+    def test_join(self):
+        wheel = TimerWheel(tick=0.01)
+        wheel.put('x')
+        wheel.put('y')
+
+        def consume():
+            items = wheel.get(max_items=2)
+            time.sleep(0.05)
+            wheel.task_done(len(items))
+
+        threading.Thread(target=consume).start()
+        wheel.join()
+
+        self.assertEqual(len(wheel), 0)
+        with self.assertRaises(ValueError):
+            wheel.task_done()
+
+    def test_priority(self):
+        wheel = TimerWheel(tick=0.01, aging=1)
+        now = time.monotonic()
+        wheel.put('low', at=now - 0.5)
+        wheel.put('high', at=now - 0.1, priority=1)
+        wheel.put('later', at=now + 100, priority=1000)
+
+        # of due items, higher priority first; priority doesn't make item due
+        self.assertEqual(wheel.get(max_items=3), ['high', 'low'])
+        self.assertEqual(len(wheel), 1)
+
+    def test_priority_aging(self):
+        wheel = TimerWheel(tick=0.01, aging=0.1)
+        now = time.monotonic()
+        wheel.put('old', at=now - 1)
+        wheel.put('new', at=now - 0.1, priority=1)
+
+        # low-priority item waited longer than priority difference is worth
+        self.assertEqual(wheel.get(max_items=2), ['old', 'new'])
+
+
+class TestAgingPriorityQueue(unittest.TestCase):
+
+    def test_fifo(self):
+        q = AgingPriorityQueue()
+        for i in range(5):
+            q.put(i)
+        self.assertEqual([q.get_nowait() for _ in range(5)], list(range(5)))
+
+    def test_priority(self):
+        q = AgingPriorityQueue(aging=10)
+        q.put('low')
+        q.put('high', priority=1)
+        q.put_nowait('higher', priority=2)
+        q.put(None)
+
+        self.assertEqual(q.qsize(), 4)
+        self.assertEqual([q.get() for _ in range(4)], ['higher', 'high', 'low', None])
+
+    def test_aging(self):
+        q = AgingPriorityQueue(aging=0.01)
+        q.put('old')
+        time.sleep(0.05)
+        q.put('new', priority=1)
+
+        self.assertEqual([q.get(), q.get()], ['old', 'new'])
+
+    def test_task_accounting(self):
+        q = AgingPriorityQueue()
+        q.put('x', priority=1)
+        q.get()
+        q.task_done()
+        q.join()
+        with self.assertRaises(ValueError):
+            q.task_done()
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_unlimited(self):
+        bucket = TokenBucket()
+        for _ in range(100):
+            self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.stats['waits'], 0)
+
+    def test_rate(self):
+        bucket = TokenBucket(rate=100, capacity=1)
+
+        t = time.monotonic()
+        for _ in range(6):
+            bucket.acquire()
+        dt = time.monotonic() - t
+
+        # first token is available immediately, then 100/sec
+        self.assertGreaterEqual(dt, 0.05 - 0.01)
+        self.assertEqual(bucket.stats['waits'], 5)
+
+    def test_burst(self):
+        bucket = TokenBucket(rate=1, capacity=5)
+        for _ in range(5):
+            self.assertEqual(bucket.acquire(), 0)
+        self.assertLess(bucket.stats['tokens'], 1)
+
+    def test_pause(self):
+        bucket = TokenBucket()
+        bucket.pause(0.05)
+
+        stats = bucket.stats
+        self.assertEqual(stats['pauses'], 1)
+        self.assertGreater(stats['paused_for'], 0)
+
+        self.assertGreaterEqual(bucket.acquire(), 0.05 - 0.01)
+        self.assertEqual(bucket.stats['paused_for'], 0)
+
+    def test_shared(self):
+        bucket = TokenBucket(rate=200, capacity=1)
+
+        def acquire():
+            for _ in range(5):
+                bucket.acquire()
+
+        t = time.monotonic()
+        workers = [threading.Thread(target=acquire) for _ in range(4)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        dt = time.monotonic() - t
+
+        # 20 tokens at 200/sec, regardless of the number of threads
+        self.assertGreaterEqual(dt, 19 / 200 - 0.01)
+
+    def test_acquire_many(self):
+        bucket = TokenBucket(rate=1000, capacity=100)
+
+        t = time.monotonic()
+        for _ in range(3):
+            bucket.acquire(100)
+        dt = time.monotonic() - t
+
+        # full bucket is available immediately, then 1000/sec
+        self.assertGreaterEqual(dt, 0.2 - 0.01)
+
+        with self.assertRaises(ValueError):
+            bucket.acquire(101)
+
+        # unlimited bucket accepts any number of tokens
+        self.assertEqual(TokenBucket().acquire(1000), 0)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_per_endpoint(self):
+        limiter = RateLimiter({'problems': (10, 2)})
+
+        limiter.acquire('problems')
+        limiter.acquire('solvers')
+
+        self.assertEqual(limiter.bucket('problems').rate, 10)
+        self.assertEqual(limiter.bucket('problems').capacity, 2)
+        self.assertIsNone(limiter.bucket('solvers').rate)
+        self.assertIs(limiter.bucket('problems'), limiter.bucket('problems'))
+
+    def test_pause(self):
+        limiter = RateLimiter()
+        limiter.pause('problems', 10)
+
+        stats = limiter.stats
+        self.assertEqual(set(stats), {'problems'})
+        self.assertEqual(stats['problems']['pauses'], 1)
+        self.assertGreater(stats['problems']['paused_for'], 9)
+
+        # other endpoints are unaffected
+        self.assertEqual(limiter.acquire('bqm'), 0)
+
+
+class TestLRUCache(unittest.TestCase):
+
+    def test_get_put(self):
+        cache = LRUCache(maxsize=2)
+        self.assertIsNone(cache.get('a'))
+        self.assertEqual(cache.get('a', 0), 0)
+
+        cache.put('a', 1)
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(len(cache), 1)
+
+        stats = cache.stats
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 2)
+        self.assertEqual(stats['size'], 1)
+
+    def test_eviction(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+
+        # touch `a`, so that `b` is evicted next
+        cache.get('a')
+        cache.put('c', 3)
+
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats['evictions'], 1)
+        self.assertEqual(len(cache), 2)
+
+    def test_clear(self):
+        cache = LRUCache(maxsize=2)
+        cache.put('a', 1)
+        cache.get('a')
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats['hits'], 1)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            LRUCache(maxsize=0)
+
+
+class TestSharedArrays(unittest.TestCase):
+
+    def setUp(self):
+        self.data = [numpy.arange(5), numpy.linspace(0, 1, 3),
+                     numpy.empty(0, dtype=numpy.int8), numpy.eye(2)]
+
+    def test_roundtrip(self):
+        shared = SharedArrays(self.data)
+        try:
+            arrays = shared.arrays
+            for array, expected in zip(arrays, self.data):
+                numpy.testing.assert_array_equal(array, expected)
+                self.assertEqual(array.dtype, expected.dtype)
+                self.assertEqual(array.ctypes.data % SharedArrays._ALIGNMENT, 0)
+            del array, arrays
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_pickle_attaches(self):
+        shared = SharedArrays(self.data)
+        try:
+            attached = pickle.loads(pickle.dumps(shared))
+            self.assertEqual(attached.name, shared.name)
+
+            # writes are visible through the other instance
+            view = attached.arrays[0]
+            view[0] = 100
+            self.assertEqual(shared.arrays[0][0], 100)
+            del view
+
+            attached.close()
+        finally:
+            shared.close()
+            shared.unlink()
+
+    def test_empty(self):
+        shared = SharedArrays([])
+        try:
+            self.assertEqual(shared.arrays, [])
+        finally:
+            shared.close()
+            shared.unlink()
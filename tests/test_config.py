@@ -32,7 +32,7 @@ from dwave.cloud.config.loaders import (
     _solver_id_as_identity, _solver_identity_as_id)
 from dwave.cloud.config.constants import DEFAULT_METADATA_API_ENDPOINT
 from dwave.cloud.config.exceptions import ConfigFileParseError, ConfigFileReadError
-from dwave.cloud.config.models import ClientConfig, PollingStrategy
+from dwave.cloud.config.models import ClientConfig, InFlightPolicy, PollingStrategy
 from dwave.cloud.config.models import validate_config_v1, load_config_v1, dump_config_v1
 from dwave.cloud.testing import isolated_environ
 
@@ -634,6 +634,86 @@ class TestConfigModel(unittest.TestCase):
                      get_field=lambda config: config.solver,
                      model_value=model_value)
 
+    @parameterized.expand([
+        ("default", {}, (None, None, InFlightPolicy.BLOCK)),
+        ("limits", {"max_in_flight": "100", "max_queued_bytes": 2**30},
+                   (100, 2**30, InFlightPolicy.BLOCK)),
+        ("policy", {"in_flight_policy": "defer"}, (None, None, InFlightPolicy.DEFER)),
+    ])
+    def test_in_flight_limits(self, name, raw_config, model_value):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: (config.max_in_flight,
+                                               config.max_queued_bytes,
+                                               config.in_flight_policy),
+                     model_value=model_value)
+
+    @parameterized.expand([
+        ("default", {}, (False, None)),
+        ("enabled", {"journal": "on"}, (True, None)),
+        ("path", {"journal": True, "journal_path": "/tmp/j.sqlite"}, (True, "/tmp/j.sqlite")),
+    ])
+    def test_journal(self, name, raw_config, model_value):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: (config.journal, config.journal_path),
+                     model_value=model_value)
+
+    @parameterized.expand([
+        ("default", {}, (False, None, 86400)),
+        ("enabled", {"upload_cache": "on"}, (True, None, 86400)),
+        ("custom", {"upload_cache": True, "upload_cache_path": "/tmp/u.sqlite",
+                    "upload_cache_maxage": "3600"}, (True, "/tmp/u.sqlite", 3600)),
+    ])
+    def test_upload_cache(self, name, raw_config, model_value):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: (config.upload_cache,
+                                               config.upload_cache_path,
+                                               config.upload_cache_maxage),
+                     model_value=model_value)
+
+    @parameterized.expand([
+        ("default", {}, 0),
+        ("enabled", {"encoding_cache_size": "10"}, 10),
+        ("disabled", {"encoding_cache_size": 0}, 0),
+    ])
+    def test_encoding_cache_size(self, name, raw_config, model_value):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: config.encoding_cache_size,
+                     model_value=model_value)
+
+    @parameterized.expand([
+        ("default", {}, 0),
+        ("enabled", {"encoding_processes": "4"}, 4),
+        ("disabled", {"encoding_processes": 0}, 0),
+    ])
+    def test_encoding_processes(self, name, raw_config, model_value):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: config.encoding_processes,
+                     model_value=model_value)
+
+    @parameterized.expand([
+        ("default", {}, 8 * 1024 * 1024, 4),
+        ("custom", {"answer_download_segment_size": "1024",
+                    "answer_download_parallelism": 8}, 1024, 8),
+    ])
+    def test_answer_download(self, name, raw_config, segment_size, parallelism):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: config.answer_download_segment_size,
+                     model_value=segment_size)
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: config.answer_download_parallelism,
+                     model_value=parallelism)
+
+    @parameterized.expand([
+        ("default", {}, (4, None)),
+        ("custom", {"upload_concurrency": "2",
+                    "upload_bandwidth_limit": "1000000"}, (2, 1000000)),
+    ])
+    def test_upload_concurrency(self, name, raw_config, model_value):
+        self._verify(raw_config=raw_config,
+                     get_field=lambda config: (config.upload_concurrency,
+                                               config.upload_bandwidth_limit),
+                     model_value=model_value)
+
     @parameterized.expand([
         ("null meta", "metadata_api_endpoint", None, None),
         ("null leap", "leap_api_endpoint", None, None),
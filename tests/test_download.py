@@ -0,0 +1,553 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import os
+import threading
+import unittest
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+import requests
+from parameterized import parameterized
+
+from dwave.cloud.client import Client
+from dwave.cloud.download import (
+    MappedSpool, RangedStream, Segment, parse_content_range,
+    spooled_temporary_file)
+from dwave.cloud.exceptions import InvalidAPIResponseError, UseAfterCloseError
+
+
+class RangedSession:
+    """Mock session serving ``data`` with support for HTTP range requests.
+
+    ``failures`` maps segment start offset to the number of bytes sent before
+    the connection drops (applied once per start offset).
+    """
+
+    def __init__(self, data, ranges=True, failures=None):
+        self.data = data
+        self.ranges = ranges
+        self.failures = dict(failures or {})
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def close(self):
+        pass
+
+    def set_accept(self, **kwargs):
+        pass
+
+    def get(self, url, stream=False, headers=None):
+        range_header = (headers or {}).get('Range')
+        with self._lock:
+            self.requests.append(range_header)
+
+        response = mock.Mock()
+        if not self.ranges or range_header is None:
+            response.status_code = 200
+            response.headers = {}
+            body = self.data
+            fail_after = None
+        else:
+            first, last = map(int, range_header.split('=')[1].split('-'))
+            last = min(last, len(self.data) - 1)
+            response.status_code = 206
+            response.headers = {
+                'Content-Range': f'bytes {first}-{last}/{len(self.data)}'}
+            body = self.data[first:last+1]
+            with self._lock:
+                fail_after = self.failures.pop(first, None)
+
+        def iter_content(chunk_size=1):
+            for pos in range(0, len(body), chunk_size):
+                if fail_after is not None and pos + chunk_size > fail_after:
+                    yield body[pos:fail_after]
+                    raise requests.exceptions.ChunkedEncodingError
+                yield body[pos:pos+chunk_size]
+
+        response.iter_content = iter_content
+        return response
+
+
+class TestSegment(unittest.TestCase):
+
+    def test_split(self):
+        segments = Segment.split(25, 10)
+        self.assertEqual([(s.start, s.end) for s in segments],
+                         [(0, 10), (10, 20), (20, 25)])
+
+        segments = Segment.split(25, 10, start=5)
+        self.assertEqual([(s.start, s.end) for s in segments],
+                         [(5, 15), (15, 25)])
+
+        self.assertEqual(Segment.split(0, 10), [])
+
+    def test_progress(self):
+        segment = Segment(10, 20)
+        self.assertEqual(segment.remaining, 10)
+        self.assertEqual(segment.range_header, 'bytes=10-19')
+
+        segment.offset += 4
+        self.assertEqual(segment.remaining, 6)
+        self.assertEqual(segment.range_header, 'bytes=14-19')
+
+    @parameterized.expand([
+        ("valid", "bytes 0-9/100", (0, 9, 100)),
+        ("whitespace", " bytes 10-19/20 ", (10, 19, 20)),
+        ("unknown size", "bytes 0-9/*", None),
+        ("unsatisfied", "bytes */100", None),
+        ("missing", None, None),
+        ("not a string", mock.Mock(), None),
+    ])
+    def test_parse_content_range(self, name, value, expected):
+        self.assertEqual(parse_content_range(value), expected)
+
+
+class TestMappedSpool(unittest.TestCase):
+
+    def test_write_read(self):
+        data = os.urandom(1000)
+
+        with MappedSpool(len(data)) as spool:
+            self.assertEqual(len(spool), len(data))
+            self.assertTrue(spool.readable())
+            self.assertTrue(spool.seekable())
+            self.assertFalse(spool.writable())
+
+            # write in reverse, from multiple threads
+            with ThreadPoolExecutor(4) as executor:
+                for pos in reversed(range(0, len(data), 100)):
+                    executor.submit(spool.write_at, pos, data[pos:pos+100])
+
+            self.assertEqual(spool.tell(), 0)
+            self.assertEqual(spool.read(), data)
+            self.assertEqual(spool.read(), b'')
+
+            spool.seek(10)
+            self.assertEqual(spool.read(5), data[10:15])
+            spool.seek(-5, io.SEEK_END)
+            self.assertEqual(spool.read(), data[-5:])
+            spool.seek(2, io.SEEK_CUR)
+            self.assertEqual(spool.read(1), b'')
+
+            spool.seek(0)
+            buf = bytearray(300)
+            self.assertEqual(spool.readinto(buf), 300)
+            self.assertEqual(buf, data[:300])
+
+        self.assertTrue(spool.closed)
+        with self.assertRaises(ValueError):
+            spool.read()
+
+    def test_negative_seek(self):
+        with MappedSpool(10) as spool:
+            spool.seek(5)
+            for pos, whence in [(-1, io.SEEK_SET), (-6, io.SEEK_CUR), (-11, io.SEEK_END)]:
+                with self.subTest(pos=pos, whence=whence):
+                    with self.assertRaisesRegex(ValueError, "negative seek position"):
+                        spool.seek(pos, whence)
+                    self.assertEqual(spool.tell(), 5)
+
+    def test_out_of_bounds_write(self):
+        with MappedSpool(10) as spool:
+            with self.assertRaises(ValueError):
+                spool.write_at(5, b'x' * 6)
+            with self.assertRaises(ValueError):
+                spool.write_at(-1, b'x')
+
+    def test_empty(self):
+        with MappedSpool(0) as spool:
+            self.assertEqual(len(spool), 0)
+            self.assertEqual(spool.read(), b'')
+            self.assertEqual(spool.readinto(bytearray(10)), 0)
+
+    def test_zipfile(self):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('a', b'abc')
+        data = buf.getvalue()
+
+        with MappedSpool(len(data)) as spool:
+            spool.write_at(0, data)
+            with zipfile.ZipFile(spool) as zf:
+                self.assertEqual(zf.read('a'), b'abc')
+
+    def test_spooled_temporary_file(self):
+        with spooled_temporary_file(max_size=10) as sf:
+            self.assertTrue(sf.seekable())
+            sf.write(b'x' * 20)
+            sf.seek(0)
+            self.assertEqual(sf.read(), b'x' * 20)
+
+
+class TestRangedAnswerDownload(unittest.TestCase):
+
+    url = 'https://example.com/answer/data/'
+    auth_method = 'sapi-token'
+
+    def download(self, session, output=None, **config):
+        with mock.patch.object(Client, 'create_session', lambda self: session):
+            with Client(endpoint='endpoint', token='token', **config) as client:
+                return client._download_answer_binary_ref(
+                    auth_method=self.auth_method, url=self.url, output=output).result()
+
+    def test_parallel_segments(self):
+        data = os.urandom(1000)
+        session = RangedSession(data)
+
+        answer = self.download(session, answer_download_segment_size=64,
+                               answer_download_parallelism=4)
+
+        self.assertIsInstance(answer, MappedSpool)
+        self.assertEqual(answer.read(), data)
+        self.assertEqual(len(session.requests), 16)
+        self.assertEqual(session.requests[0], 'bytes=0-63')
+        self.assertIn('bytes=960-999', session.requests)
+        answer.close()
+
+    def test_single_segment(self):
+        data = os.urandom(100)
+        session = RangedSession(data)
+
+        answer = self.download(session, answer_download_segment_size=1000)
+
+        self.assertEqual(answer.read(), data)
+        self.assertEqual(session.requests, ['bytes=0-999'])
+        answer.close()
+
+    def test_given_output(self):
+        data = os.urandom(1000)
+        session = RangedSession(data)
+        output = io.BytesIO()
+
+        answer = self.download(session, output=output,
+                               answer_download_segment_size=100)
+
+        self.assertIs(answer, output)
+        self.assertEqual(answer.read(), data)
+
+    def test_ranges_not_supported(self):
+        data = os.urandom(1000)
+        session = RangedSession(data, ranges=False)
+
+        answer = self.download(session, answer_download_segment_size=100)
+
+        self.assertEqual(answer.read(), data)
+        self.assertEqual(len(session.requests), 1)
+        answer.close()
+
+    def test_first_segment_resumed(self):
+        data = os.urandom(1000)
+        session = RangedSession(data, failures={0: 30})
+
+        with mock.patch.object(Client, '_DOWNLOAD_CHUNK_SIZE_BYTES', 16):
+            answer = self.download(session, answer_download_segment_size=100)
+
+        self.assertEqual(answer.read(), data)
+        # first segment is requested again only from the byte at which the
+        # connection dropped
+        self.assertIn('bytes=30-99', session.requests)
+        answer.close()
+
+    def test_segment_retry_resumes(self):
+        data = os.urandom(100)
+        session = RangedSession(data, failures={10: 25})
+        output = MappedSpool(len(data))
+        segment = Segment(10, 50)
+
+        with mock.patch('dwave.cloud.utils.decorators.time.sleep'), \
+                mock.patch.object(Client, '_DOWNLOAD_CHUNK_SIZE_BYTES', 8):
+            Client._download_answer_segment(
+                session, self.url, segment, output.write_at)
+
+        self.assertEqual(segment.remaining, 0)
+        self.assertEqual(session.requests, ['bytes=10-49', 'bytes=35-49'])
+        self.assertEqual(output.read()[10:50], data[10:50])
+        output.close()
+
+    def test_segment_retries_exhausted(self):
+        session = mock.Mock()
+        session.get.return_value.status_code = 200
+
+        with mock.patch('dwave.cloud.utils.decorators.time.sleep'):
+            with self.assertRaises(InvalidAPIResponseError):
+                Client._download_answer_segment(
+                    session, self.url, Segment(0, 10), mock.Mock())
+
+        self.assertEqual(session.get.call_count, Client._DOWNLOAD_SEGMENT_RETRIES + 1)
+
+
+class TestRangedStream(unittest.TestCase):
+
+    def stream(self, data, segment_size, **kwargs):
+        fetched = []
+
+        def fetch(segment, write_at):
+            fetched.append(segment.start)
+            segment.offset += write_at(segment.offset, data[segment.start:segment.end])
+
+        return RangedStream(len(data), segment_size, fetch, **kwargs), fetched
+
+    def test_lazy_read(self):
+        data = os.urandom(1000)
+        stream, fetched = self.stream(data, 100)
+
+        self.assertEqual(len(stream), len(data))
+        self.assertEqual(stream.num_segments, 10)
+        self.assertEqual(stream.num_loaded, 0)
+
+        self.assertEqual(stream.read(10), data[:10])
+        self.assertEqual(fetched, [0])
+
+        stream.seek(450)
+        self.assertEqual(stream.read(100), data[450:550])
+        self.assertEqual(fetched, [0, 400, 500])
+
+        # segments are fetched only once
+        stream.seek(420)
+        self.assertEqual(stream.read(150), data[420:570])
+        self.assertEqual(fetched, [0, 400, 500])
+        self.assertEqual(stream.num_loaded, 3)
+
+        stream.seek(-10, io.SEEK_END)
+        self.assertEqual(stream.read(), data[-10:])
+        self.assertEqual(stream.read(), b'')
+
+        stream.seek(0)
+        self.assertEqual(stream.read(), data)
+        self.assertEqual(sorted(fetched), list(range(0, 1000, 100)))
+
+        stream.close()
+        with self.assertRaises(ValueError):
+            stream.read()
+
+    def test_negative_seek(self):
+        data = os.urandom(100)
+        stream, fetched = self.stream(data, 10)
+
+        for pos, whence in [(-5, io.SEEK_SET), (-1, io.SEEK_CUR), (-101, io.SEEK_END)]:
+            with self.subTest(pos=pos, whence=whence):
+                with self.assertRaisesRegex(ValueError, "negative seek position"):
+                    stream.seek(pos, whence)
+                self.assertEqual(stream.tell(), 0)
+
+        # nothing fetched outside of the stream
+        self.assertEqual(stream.read(10), data[:10])
+        self.assertEqual(fetched, [0])
+
+    def test_concurrent_fetch(self):
+        data = os.urandom(1000)
+        with ThreadPoolExecutor(4) as executor:
+            stream, fetched = self.stream(data, 64, executor=executor)
+            self.assertEqual(stream.read(), data)
+
+        self.assertEqual(sorted(fetched), list(range(0, 1000, 64)))
+
+    def test_fetch_failure(self):
+        data = os.urandom(100)
+        stream, fetched = self.stream(data, 10)
+
+        with mock.patch.object(stream, '_fetch', side_effect=OSError):
+            with self.assertRaises(OSError):
+                stream.read(5)
+
+        # failed segment is fetched on next read
+        self.assertEqual(stream.num_loaded, 0)
+        self.assertEqual(stream.tell(), 0)
+        self.assertEqual(stream.read(5), data[:5])
+
+    def test_load_override(self):
+        data = os.urandom(100)
+        stream, fetched = self.stream(data, 10)
+
+        def fetch(segment, write_at):
+            segment.offset += write_at(segment.offset, b'x' * segment.remaining)
+
+        stream.load(0, fetch=fetch)
+        self.assertEqual(stream.read(12), b'x' * 10 + data[10:12])
+        self.assertEqual(fetched, [10])
+
+    def test_executor_shutdown(self):
+        data = os.urandom(1000)
+        executor = ThreadPoolExecutor(4)
+        stream, fetched = self.stream(data, 100, executor=executor)
+        executor.shutdown()
+
+        # segments are fetched in the reading thread
+        self.assertEqual(stream.read(), data)
+        self.assertEqual(fetched, list(range(0, 1000, 100)))
+
+    def test_load_all(self):
+        data = os.urandom(1000)
+        stream, fetched = self.stream(data, 100)
+        stream.load_all()
+        self.assertEqual(stream.num_loaded, stream.num_segments)
+        self.assertEqual(stream.read(), data)
+        self.assertEqual(len(fetched), 10)
+
+    def test_empty(self):
+        stream, fetched = self.stream(b'', 10)
+        self.assertEqual(stream.num_segments, 0)
+        self.assertEqual(stream.read(), b'')
+        self.assertEqual(fetched, [])
+
+    def test_zipfile(self):
+        buf = io.BytesIO()
+        with zipfile.ZipFile(buf, 'w') as zf:
+            zf.writestr('a', os.urandom(1000))
+            zf.writestr('b', b'abc')
+        data = buf.getvalue()
+
+        stream, fetched = self.stream(data, 100)
+        with zipfile.ZipFile(stream) as zf:
+            self.assertEqual(zf.read('b'), b'abc')
+
+        # only the archive directory and the member read are fetched
+        self.assertLess(len(fetched), stream.num_segments)
+
+
+class TestLazyAnswerDownload(unittest.TestCase):
+
+    url = 'https://example.com/answer/data/'
+    auth_method = 'sapi-token'
+
+    def test_open(self):
+        data = os.urandom(1000)
+        session = RangedSession(data)
+
+        with mock.patch.object(Client, 'create_session', lambda self: session):
+            with Client(endpoint='endpoint', token='token',
+                        answer_download_segment_size=100) as client:
+                stream = client._open_answer_binary_ref(
+                    auth_method=self.auth_method, url=self.url)
+
+                # only the first segment is fetched on open
+                self.assertIsInstance(stream, RangedStream)
+                self.assertEqual(session.requests, ['bytes=0-99'])
+
+                stream.seek(550)
+                self.assertEqual(stream.read(10), data[550:560])
+                self.assertEqual(session.requests, ['bytes=0-99', 'bytes=500-599'])
+
+                stream.seek(0)
+                self.assertEqual(stream.read(), data)
+                self.assertEqual(len(session.requests), 10)
+                stream.close()
+
+    def test_open_first_segment_resumed(self):
+        data = os.urandom(1000)
+        session = RangedSession(data, failures={0: 30})
+
+        with mock.patch.object(Client, 'create_session', lambda self: session), \
+                mock.patch.object(Client, '_DOWNLOAD_CHUNK_SIZE_BYTES', 16):
+            with Client(endpoint='endpoint', token='token',
+                        answer_download_segment_size=100) as client:
+                stream = client._open_answer_binary_ref(
+                    auth_method=self.auth_method, url=self.url)
+                self.assertEqual(session.requests, ['bytes=0-99', 'bytes=30-99'])
+                self.assertEqual(stream.read(), data)
+                stream.close()
+
+    def test_open_ranges_not_supported(self):
+        data = os.urandom(1000)
+        session = RangedSession(data, ranges=False)
+
+        with mock.patch.object(Client, 'create_session', lambda self: session):
+            with Client(endpoint='endpoint', token='token',
+                        answer_download_segment_size=100) as client:
+                stream = client._open_answer_binary_ref(
+                    auth_method=self.auth_method, url=self.url)
+                self.assertEqual(stream.read(), data)
+                stream.close()
+
+    def test_open_without_close_lock(self):
+        data = os.urandom(1000)
+        session = RangedSession(data)
+        locked = []
+
+        with mock.patch.object(Client, 'create_session', lambda self: session):
+            with Client(endpoint='endpoint', token='token',
+                        answer_download_segment_size=100) as client:
+                get = session.get
+
+                def spy(*args, **kwargs):
+                    locked.append(client._close_lock.locked())
+                    return get(*args, **kwargs)
+
+                with mock.patch.object(session, 'get', spy):
+                    stream = client._open_answer_binary_ref(
+                        auth_method=self.auth_method, url=self.url)
+                    stream.close()
+
+        # first segment is downloaded without blocking other client calls
+        self.assertEqual(locked, [False])
+
+    def test_open_after_close(self):
+        with Client(endpoint='endpoint', token='token') as client:
+            pass
+
+        with self.assertRaises(UseAfterCloseError):
+            client._open_answer_binary_ref(auth_method=self.auth_method, url=self.url)
+
+    def test_read_after_close(self):
+        data = os.urandom(1000)
+        session = RangedSession(data)
+
+        with mock.patch.object(Client, 'create_session', lambda self: session):
+            with Client(endpoint='endpoint', token='token',
+                        answer_download_segment_size=100) as client:
+                stream = client._open_answer_binary_ref(
+                    auth_method=self.auth_method, url=self.url)
+
+            # remaining segments are downloaded on close
+            self.assertEqual(len(session.requests), 10)
+            self.assertEqual(stream.read(), data)
+            self.assertEqual(len(session.requests), 10)
+            stream.close()
+
+    def test_read_after_close_without_wait(self):
+        data = os.urandom(1000)
+        session = RangedSession(data)
+
+        with mock.patch.object(Client, 'create_session', lambda self: session):
+            client = Client(endpoint='endpoint', token='token',
+                            answer_download_segment_size=100)
+            stream = client._open_answer_binary_ref(
+                auth_method=self.auth_method, url=self.url)
+            client.close(wait=False)
+
+            # segments loaded before close are readable
+            self.assertEqual(stream.read(100), data[:100])
+
+            # others can't be downloaded, whether in one segment or many
+            with self.assertRaises(UseAfterCloseError):
+                stream.read(10)
+            with self.assertRaises(UseAfterCloseError):
+                stream.read()
+
+            self.assertEqual(session.requests, ['bytes=0-99'])
+            stream.close()
+
+    def test_unsupported_auth_method(self):
+        with Client(endpoint='endpoint', token='token') as client:
+            with self.assertRaises(ValueError):
+                client._open_answer_binary_ref(auth_method='unknown', url=self.url)
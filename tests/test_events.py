@@ -138,14 +138,15 @@ class TestEventDispatch(unittest.TestCase):
             future = solver.sample_ising(lin, quad, offset, **sample_params)
             args = dict(type_='ising', linear=lin, quadratic=quad,
                         offset=offset, params=sample_params,
-                        undirected_biases=False, label=None)
+                        undirected_biases=False, label=None, priority=0,
+                        bqm=None, encoded_data=None)
         elif solver.hybrid:
             if not dimod:
                 self.skipTest("dimod not installed")
             future = solver.sample_ising(lin, quad, offset,
                                          upload_params=upload_params, **sample_params)
             bqm = dimod.BQM.from_ising(lin, quad, offset)
-            args = dict(problem=bqm, problem_type=None, label=None,
+            args = dict(problem=bqm, problem_type=None, label=None, priority=0,
                         sample_params=sample_params, upload_params=upload_params)
 
         before = memo['before_sample']
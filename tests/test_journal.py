@@ -0,0 +1,181 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+from dwave.cloud.journal import Journal
+
+
+class TestJournal(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'journal.sqlite')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_default_path(self):
+        with mock.patch('dwave.cloud.journal.get_cache_dir',
+                        lambda create: self.tmpdir.name):
+            journal = Journal()
+            self.assertEqual(journal.path, self.path)
+            journal.close()
+
+    def test_pending(self):
+        journal = Journal(self.path)
+
+        journal.record(Journal.SUBMITTED, 'a')
+        journal.record(Journal.ACKNOWLEDGED, 'a', problem_id='1', endpoint='x', solver='s')
+        journal.record(Journal.SUBMITTED, 'b')
+        journal.record(Journal.ACKNOWLEDGED, 'b', problem_id='2', endpoint='x')
+        journal.record(Journal.RESOLVED, 'b', problem_id='2', status='COMPLETED')
+        journal.record(Journal.ACKNOWLEDGED, 'c', problem_id='3', endpoint='y')
+        # never acknowledged
+        journal.record(Journal.SUBMITTED, 'd')
+
+        self.assertEqual([e.problem_id for e in journal.pending()], ['1', '3'])
+
+        entries = journal.pending(endpoint='x')
+        self.assertEqual(len(entries), 1)
+        self.assertEqual(entries[0].problem_id, '1')
+        self.assertEqual(entries[0].solver, 's')
+
+        journal.close()
+
+    def test_persistence(self):
+        journal = Journal(self.path)
+        journal.record(Journal.ACKNOWLEDGED, 'a', problem_id='1')
+        # no close, simulating a crash
+
+        reopened = Journal(self.path)
+        self.assertEqual([e.problem_id for e in reopened.pending()], ['1'])
+
+        reopened.record(Journal.RESOLVED, '1', problem_id='1')
+        self.assertEqual(journal.pending(), [])
+
+        journal.close()
+        reopened.close()
+
+    def test_threads(self):
+        journal = Journal(self.path)
+
+        def record(n):
+            for i in range(20):
+                journal.record(Journal.ACKNOWLEDGED, f'{n}-{i}', problem_id=f'{n}-{i}')
+
+        workers = [threading.Thread(target=record, args=(n,)) for n in range(4)]
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+
+        self.assertEqual(len(journal.pending()), 80)
+        journal.close()
+
+    def test_record_after_close(self):
+        journal = Journal(self.path)
+        journal.close()
+        journal.record(Journal.SUBMITTED, 'a')
+        self.assertEqual(journal.pending(), [])
+        self.assertEqual(journal.claim(), [])
+
+    def test_claim_skips_live_owners(self):
+        live = Journal(self.path)
+        live.record(Journal.ACKNOWLEDGED, 'a', problem_id='1', endpoint='x')
+
+        other = Journal(self.path)
+        self.assertEqual([e.problem_id for e in other.pending()], ['1'])
+        self.assertEqual(other.claim(), [])
+
+        # released on close
+        live.close()
+        self.assertEqual([e.problem_id for e in other.claim(endpoint='x')], ['1'])
+
+        # claimed problems are not claimed again while the claimant is alive
+        third = Journal(self.path)
+        self.assertEqual(third.claim(), [])
+
+        other.close()
+        self.assertEqual([e.problem_id for e in third.claim()], ['1'])
+        third.close()
+
+    def test_lease_lapse(self):
+        crashed = Journal(self.path, lease_ttl=0.3)
+        crashed.record(Journal.ACKNOWLEDGED, 'a', problem_id='1')
+
+        other = Journal(self.path)
+
+        # lease is renewed while the owner is alive
+        time.sleep(0.5)
+        self.assertEqual(other.claim(), [])
+
+        # renewal stops on crash (simulated), and the lease lapses
+        crashed._lease_released.set()
+        time.sleep(0.5)
+        self.assertEqual([e.problem_id for e in other.claim()], ['1'])
+
+        crashed.close()
+        other.close()
+
+    def test_compaction(self):
+        journal = Journal(self.path)
+        journal.record(Journal.SUBMITTED, 'a')
+        journal.record(Journal.ACKNOWLEDGED, 'a', problem_id='1')
+        journal.record(Journal.RESOLVED, 'a', problem_id='1', status='COMPLETED')
+        journal.record(Journal.SUBMITTED, 'b')
+        journal.record(Journal.ACKNOWLEDGED, 'b', problem_id='2')
+        # never acknowledged
+        journal.record(Journal.SUBMITTED, 'c')
+
+        live = Journal(self.path)
+        live.record(Journal.SUBMITTED, 'd')
+        journal.close()
+
+        reopened = Journal(self.path)
+        keys = [row[0] for row in reopened._con.execute(
+            'SELECT DISTINCT key FROM transitions ORDER BY key')]
+        self.assertEqual(keys, ['b', 'd'])
+        self.assertEqual([e.problem_id for e in reopened.pending()], ['2'])
+
+        live.close()
+        reopened.close()
+
+    def test_schema_migration(self):
+        con = sqlite3.connect(self.path)
+        con.execute("""
+            CREATE TABLE transitions (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                time REAL NOT NULL,
+                event TEXT NOT NULL,
+                key TEXT NOT NULL,
+                problem_id TEXT,
+                endpoint TEXT,
+                solver TEXT,
+                status TEXT
+            )""")
+        con.execute("INSERT INTO transitions (time, event, key, problem_id) "
+                    "VALUES (0, 'acknowledged', 'a', '1')")
+        con.commit()
+        con.close()
+
+        journal = Journal(self.path)
+        self.assertEqual([e.problem_id for e in journal.claim()], ['1'])
+        journal.close()
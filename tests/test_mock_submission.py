@@ -14,6 +14,12 @@
 
 """Test problem submission against hard-coded replies with unittest.mock."""
 
+import asyncio
+import base64
+import concurrent.futures
+import itertools
+import os
+import tempfile
 import threading
 import time
 import unittest
@@ -35,10 +41,12 @@ except ImportError:
     dimod = None
 
 from dwave.cloud.client import Client
-from dwave.cloud.computation import Future
+from dwave.cloud.computation import Future, PackedSamples
+from dwave.cloud.concurrency import Present
 from dwave.cloud.exceptions import (
     SolverFailureError, CanceledFutureError, SolverError,
-    InvalidAPIResponseError, UseAfterCloseError)
+    InvalidAPIResponseError, UseAfterCloseError, InFlightLimitExceeded,
+    SolverThrottledError, ProblemStructureError)
 from dwave.cloud.solver import Solver
 from dwave.cloud.utils.qubo import evaluate_ising
 from dwave.cloud.utils.time import utcrel
@@ -431,7 +439,9 @@ class MockSubmissionBaseTests(MockSubmissionBase):
                                              self.sapi.error_reply(id='1')]
                     }, **self.poll_params))
 
-            def accept_problems_with_continue_reply(path, data=None, headers=None, ids=iter('12')):
+            # problems can be submitted in separate (concurrent) batches, so
+            # problem id is derived from problem label, not submit order
+            def accept_problems_with_continue_reply(path, data=None, headers=None):
                 if headers is None:
                     headers = {}
                 encoding = headers.get('Content-Encoding', 'identity').lower()
@@ -439,7 +449,7 @@ class MockSubmissionBaseTests(MockSubmissionBase):
                     data = zlib.decompress(data)
                 problems = orjson.loads(data)
                 return choose_reply(path, {
-                    'problems/': [self.sapi.continue_reply(id=next(ids)) for _ in problems]
+                    'problems/': [self.sapi.continue_reply(id=p['label']) for p in problems]
                 })
 
             session.get = continue_then_complete
@@ -456,8 +466,8 @@ class MockSubmissionBaseTests(MockSubmissionBase):
                 linear, quadratic = self.sapi.problem
                 params = dict(num_reads=100)
 
-                results1 = solver.sample_ising(linear, quadratic, **params)
-                results2 = solver.sample_ising(linear, quadratic, **params)
+                results1 = solver.sample_ising(linear, quadratic, label='1', **params)
+                results2 = solver.sample_ising(linear, quadratic, label='2', **params)
 
                 with self.assertRaises(SolverFailureError):
                     self._check(results1, linear, quadratic, **params)
@@ -600,6 +610,702 @@ class TestUploadCompression(MockSubmissionBase, unittest.TestCase):
                 self._check(results, linear, quadratic, **params)
 
 
+class TestSubmissionOnEncode(MockSubmissionBase, unittest.TestCase):
+    """Problems are enqueued for submission only after their encoding is done."""
+
+    def create_mock_session(self, client):
+        session = mock.Mock()
+        session.post = lambda path, **kwargs: choose_reply(path, {
+            'problems/': [self.sapi.complete_no_answer_reply(id='123')]})
+        session.get = lambda path, **kwargs: choose_reply(path, {
+            'problems/123/': self.sapi.complete_reply(id='123')})
+        return session
+
+    def test_submit_after_encode(self):
+        with mock.patch.object(Client, 'create_session',
+                               lambda client: self.create_mock_session(client)):
+            with Client(**self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                body = concurrent.futures.Future()
+                future = Future(solver=solver, id_=None)
+                client._submit(body, future)
+
+                # encoding in progress, nothing to submit
+                time.sleep(0.1)
+                self.assertEqual(client._submission_queue.unfinished_tasks, 0)
+                self.assertFalse(future.done())
+
+                body.set_result(b'{}')
+                future.result()
+                self.assertEqual(future.id, '123')
+
+    def test_encode_failure(self):
+        with mock.patch.object(Client, 'create_session',
+                               lambda client: self.create_mock_session(client)):
+            with Client(**self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                body = concurrent.futures.Future()
+                future = Future(solver=solver, id_=None)
+                client._submit(body, future)
+
+                body.set_exception(ValueError('encoding failed'))
+                with self.assertRaisesRegex(ValueError, 'encoding failed'):
+                    future.result()
+
+
+class TestSubmitBatching(MockSubmissionBase, unittest.TestCase):
+    """Problems submitted in a burst are batched, subject to batch limits."""
+
+    class BatchingClient(Client):
+        _SUBMISSION_THREAD_COUNT = 1
+        _SUBMIT_BATCH_LINGER = 0.5
+
+    def run_batches(self, num_problems, **client_attrs):
+        batches = []
+
+        def create_mock_session(client):
+            def post(path, data, **kwargs):
+                problems = orjson.loads(data)
+                batches.append(len(problems))
+                return choose_reply(path, {'problems/': [
+                    self.sapi.complete_no_answer_reply(id=str(p['n']))
+                    for p in problems]})
+
+            session = mock.Mock()
+            session.post = post
+            session.get = lambda path, **kwargs: choose_reply(path, {
+                f'problems/{n}/': self.sapi.complete_reply(id=str(n))
+                for n in range(num_problems)})
+            return session
+
+        client_class = type('Client', (self.BatchingClient, ), client_attrs)
+
+        with mock.patch.object(Client, 'create_session', create_mock_session):
+            with client_class(compress_qpu_problem_data=False, **self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                futures = []
+                for n in range(num_problems):
+                    future = Future(solver=solver, id_=None)
+                    client._submit(Present(result=orjson.dumps(dict(n=n))), future)
+                    futures.append(future)
+
+                for n, future in enumerate(futures):
+                    self.assertEqual(future.wait_id(), str(n))
+
+        return batches
+
+    def test_linger(self):
+        self.assertEqual(self.run_batches(10), [10])
+
+    def test_count_limit(self):
+        batches = self.run_batches(10, _SUBMIT_BATCH_SIZE=4)
+        self.assertEqual(sum(batches), 10)
+        self.assertLessEqual(max(batches), 5)
+
+    def test_size_limit(self):
+        # each problem is 7 bytes; 3 fit in a batch
+        batches = self.run_batches(10, _SUBMIT_BATCH_MAX_BYTES=21)
+        self.assertEqual(batches, [3, 3, 3, 1])
+
+    def test_adaptive_batch_size(self):
+        size = Client._AdaptiveBatchSize(
+            initial=10, min_size=1, max_size=12, target_latency=1)
+
+        # full batches below target latency increase the limit
+        size.update(batch_size=10, latency=0.1)
+        self.assertEqual(size.value, 11)
+        size.update(batch_size=11, latency=0.1)
+        size.update(batch_size=12, latency=0.1)
+        self.assertEqual(size.value, 12)
+
+        # partial batches don't change it
+        size.update(batch_size=3, latency=0.1)
+        self.assertEqual(size.value, 12)
+
+        # slow requests halve it
+        size.update(batch_size=12, latency=2)
+        self.assertEqual(size.value, 6)
+        for _ in range(5):
+            size.update(batch_size=1, latency=2)
+        self.assertEqual(size.value, 1)
+
+
+class TestSampleSweep(MockSubmissionBase, unittest.TestCase):
+    """Parameter sweep is encoded once, and submitted in a batch."""
+
+    class SweepClient(Client):
+        _SUBMISSION_THREAD_COUNT = 1
+        _SUBMIT_BATCH_LINGER = 0.5
+
+    def run_sweep(self, problem, param_grid):
+        posted = []
+
+        def create_mock_session(client):
+            def post(path, data, **kwargs):
+                problems = orjson.loads(data)
+                posted.append(problems)
+                return choose_reply(path, {'problems/': [
+                    self.sapi.complete_no_answer_reply(id=str(p['params']['x_n']))
+                    for p in problems]})
+
+            session = mock.Mock()
+            session.post = post
+            session.get = lambda path, **kwargs: choose_reply(path, {
+                f'problems/{n}/': self.sapi.complete_reply(id=str(n))
+                for n in range(10)})
+            return session
+
+        with mock.patch.object(Client, 'create_session', create_mock_session):
+            with self.SweepClient(compress_qpu_problem_data=False, **self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                with mock.patch.object(solver, '_encode_problem_as_qp',
+                                       wraps=solver._encode_problem_as_qp) as encode:
+                    futures = solver.sample_sweep(problem, param_grid)
+                    ids = [future.wait_id() for future in futures]
+
+                encode.assert_called_once()
+
+        return ids, posted
+
+    def test_grid(self):
+        h, J = self.sapi.problem
+        ids, posted = self.run_sweep(
+            (h, J), dict(x_n=[0, 1, 2], num_reads=[10, 100]))
+
+        # expanded in grid order (last parameter varies fastest)
+        self.assertEqual(ids, ['0', '0', '1', '1', '2', '2'])
+
+        self.assertEqual(len(posted), 1)
+        problems = posted[0]
+        self.assertEqual([p['params'] for p in problems], [
+            dict(x_n=n, num_reads=r) for n in range(3) for r in (10, 100)])
+        self.assertTrue(all(p['data'] == problems[0]['data'] for p in problems))
+        self.assertTrue(all(p['type'] == 'ising' for p in problems))
+
+    def test_list(self):
+        h, J = self.sapi.problem
+        ids, posted = self.run_sweep((h, J, 1.5), [dict(x_n=2), dict(x_n=0), dict(x_n=1)])
+
+        self.assertEqual(ids, ['2', '0', '1'])
+        self.assertEqual([p['data']['offset'] for p in posted[0]], [1.5] * 3)
+
+    @unittest.skipUnless(dimod, "dimod required for 'Solver.sample_sweep'")
+    def test_bqm(self):
+        h, J = self.sapi.problem
+        bqm = dimod.BQM.from_ising(h, J)
+        ids, posted = self.run_sweep(bqm.change_vartype('BINARY', inplace=False),
+                                     dict(x_n=[0, 1]))
+
+        self.assertEqual(ids, ['0', '1'])
+        self.assertTrue(all(p['type'] == 'qubo' for p in posted[0]))
+
+    def test_incompatible_problem(self):
+        solver = Solver(None, self.sapi.solver.data)
+        with self.assertRaises(ProblemStructureError):
+            solver.sample_sweep(({100: 1}, {}), dict(num_reads=[1, 2]))
+
+
+class TestEncodingProcesses(MockSubmissionBase, unittest.TestCase):
+    """Problems are encoded in worker processes, if enabled."""
+
+    def test_encoding(self):
+        posted = []
+
+        def create_mock_session(client):
+            def post(path, data, **kwargs):
+                posted.extend(orjson.loads(data))
+                return choose_reply(path, {
+                    'problems/': self.sapi.complete_no_answer_reply(id='123')})
+
+            session = mock.Mock()
+            session.post = post
+            session.get = lambda path, **kwargs: choose_reply(path, {
+                'problems/123/': self.sapi.complete_reply(id='123')})
+            return session
+
+        config = dict(compress_qpu_problem_data=False, encoding_processes=2,
+                      encoding_cache_size=10, **self.config)
+
+        with mock.patch.object(Client, 'create_session', create_mock_session):
+            with Client(**config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+                h, J = self.sapi.problem
+
+                with self.subTest("problem encoded in worker"):
+                    future = solver.sample_ising(h, J, label='worker')
+                    future.wait_id()
+                    self.assertEqual(len(solver.encoding_cache), 1)
+
+                with self.subTest("cached problem encoded in-process"):
+                    future = solver.sample_ising(h, J, label='cached')
+                    future.wait_id()
+                    self.assertEqual(solver.encoding_cache.stats['hits'], 1)
+
+                with self.subTest("structure error raised on future"):
+                    future = solver.sample_ising({100: 1}, {})
+                    with self.assertRaises(ProblemStructureError):
+                        future.result()
+
+        expected = solver._encode_problem_as_qp(h, J, 0)
+        self.assertEqual([p['label'] for p in posted], ['worker', 'cached'])
+        self.assertTrue(all(p['data'] == expected for p in posted))
+        self.assertEqual(list(posted[0]), ['solver', 'data', 'type', 'params', 'label'])
+
+
+class TestPriority(MockSubmissionBase, unittest.TestCase):
+    """Higher-priority problems are submitted (and batched) first."""
+
+    class PriorityClient(Client):
+        _SUBMISSION_THREAD_COUNT = 1
+        _SUBMIT_BATCH_SIZE = 3
+
+    def test_submit_order(self):
+        posted = []
+        unblock = threading.Event()
+
+        def create_mock_session(client):
+            def post(path, data, **kwargs):
+                # hold the submit worker until all problems are queued
+                unblock.wait()
+                problems = orjson.loads(data)
+                posted.append([p['n'] for p in problems])
+                return choose_reply(path, {'problems/': [
+                    self.sapi.complete_no_answer_reply(id=str(p['n']))
+                    for p in problems]})
+
+            session = mock.Mock()
+            session.post = post
+            session.get = lambda path, **kwargs: choose_reply(path, {
+                f'problems/{n}/': self.sapi.complete_reply(id=str(n))
+                for n in range(6)})
+            return session
+
+        with mock.patch.object(Client, 'create_session', create_mock_session):
+            with self.PriorityClient(compress_qpu_problem_data=False, **self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                futures = []
+                for n in range(6):
+                    future = Future(solver=solver, id_=None)
+                    future._priority = 1 if n >= 4 else 0
+                    client._submit(Present(result=orjson.dumps(dict(n=n))), future)
+                    futures.append(future)
+
+                    if n == 0:
+                        # wait for the first problem to be picked up
+                        while client._submission_queue.qsize():
+                            time.sleep(0.01)
+
+                unblock.set()
+                for future in futures:
+                    future.result()
+
+        self.assertEqual(posted, [[0], [4, 5, 1], [2, 3]])
+
+    def test_sample_priority(self):
+        def create_mock_session(client):
+            session = mock.Mock()
+            session.post = lambda path, **kwargs: choose_reply(path, {
+                'problems/': [self.sapi.complete_reply(id='123')]})
+            return session
+
+        with mock.patch.object(Client, 'create_session', create_mock_session):
+            with Client(**self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                future = solver.sample_qubo({}, priority=5)
+                self.assertEqual(future._priority, 5)
+                future.result()
+
+                future = solver.sample_ising({}, {})
+                self.assertEqual(future._priority, 0)
+
+
+class TestInFlightLimits(MockSubmissionBase, unittest.TestCase):
+    """Problem admission is limited by `max_in_flight`/`max_queued_bytes`."""
+
+    def create_mock_session(self, client):
+        def post(path, data, **kwargs):
+            return choose_reply(path, {'problems/': [
+                self.sapi.complete_no_answer_reply(id=str(p['n']))
+                for p in orjson.loads(data)]})
+
+        session = mock.Mock()
+        session.post = post
+        session.get = lambda path, **kwargs: choose_reply(path, {
+            f'problems/{n}/': self.sapi.complete_reply(id=str(n)) for n in range(10)})
+        return session
+
+    def submit(self, client, n, body=None):
+        if body is None:
+            body = Present(result=orjson.dumps(dict(n=n)))
+        solver = Solver(client, self.sapi.solver.data)
+        future = Future(solver=solver, id_=None)
+        client._submit(body, future)
+        return future
+
+    def test_raise(self):
+        with mock.patch.object(Client, 'create_session',
+                               lambda client: self.create_mock_session(client)):
+            with Client(max_in_flight=1, in_flight_policy='raise',
+                        compress_qpu_problem_data=False, **self.config) as client:
+
+                body = concurrent.futures.Future()
+                f0 = self.submit(client, 0, body)
+
+                with self.assertRaises(InFlightLimitExceeded):
+                    self.submit(client, 1)
+
+                body.set_result(orjson.dumps(dict(n=0)))
+                self.assertEqual(f0.wait_id(), '0')
+                f0.result()
+
+                f1 = self.submit(client, 1)
+                self.assertEqual(f1.wait_id(), '1')
+
+    def test_block(self):
+        with mock.patch.object(Client, 'create_session',
+                               lambda client: self.create_mock_session(client)):
+            with Client(max_in_flight=1, in_flight_policy='block',
+                        compress_qpu_problem_data=False, **self.config) as client:
+
+                body = concurrent.futures.Future()
+                f0 = self.submit(client, 0, body)
+
+                futures = []
+                producer = threading.Thread(
+                    target=lambda: futures.append(self.submit(client, 1)))
+                producer.start()
+
+                # producer blocked until the first problem resolves
+                producer.join(timeout=0.1)
+                self.assertTrue(producer.is_alive())
+
+                body.set_result(orjson.dumps(dict(n=0)))
+                producer.join(timeout=10)
+                self.assertFalse(producer.is_alive())
+
+                self.assertTrue(f0.done())
+                self.assertEqual(futures[0].wait_id(), '1')
+
+    def test_defer(self):
+        with mock.patch.object(Client, 'create_session',
+                               lambda client: self.create_mock_session(client)):
+            with Client(max_in_flight=2, in_flight_policy='defer',
+                        compress_qpu_problem_data=False, **self.config) as client:
+
+                body = concurrent.futures.Future()
+                f0 = self.submit(client, 0, body)
+                f1 = self.submit(client, 1)
+                f2 = self.submit(client, 2)
+
+                # window is full until f0 resolves
+                self.assertEqual(f1.wait_id(), '1')
+                f1.result()
+                self.assertFalse(f2.done())
+
+                body.set_result(orjson.dumps(dict(n=0)))
+                self.assertEqual(f2.wait_id(), '2')
+
+                for f in (f0, f1, f2):
+                    f.result()
+
+    def test_window(self):
+        window = Client._InFlightWindow(max_count=2, max_bytes=10)
+
+        t1 = window.acquire()
+        window.add_bytes(t1, 5)
+        t2 = window.acquire()
+        self.assertEqual((window.count, window.nbytes), (2, 5))
+
+        # count limit
+        self.assertIsNone(window.acquire(blocking=False))
+
+        # deferred admission on release, in order
+        admitted = []
+        window.defer(lambda t: admitted.append(('a', t)))
+        window.defer(lambda t: admitted.append(('b', t)))
+        window.release(t2)
+        self.assertEqual([name for name, _ in admitted], ['a'])
+
+        # bytes limit
+        ta = admitted[0][1]
+        window.add_bytes(ta, 10)
+        window.release(t1)
+        self.assertEqual((window.count, window.nbytes), (1, 10))
+        self.assertEqual([name for name, _ in admitted], ['a'])
+        window.release(ta)
+        self.assertEqual([name for name, _ in admitted], ['a', 'b'])
+        self.assertEqual((window.count, window.nbytes), (1, 0))
+
+        # release is idempotent, and bytes added after release are ignored
+        tb = admitted[1][1]
+        window.release(tb)
+        window.release(tb)
+        window.add_bytes(tb, 5)
+        self.assertEqual((window.count, window.nbytes), (0, 0))
+
+    def test_window_size_limit(self):
+        window = Client._InFlightWindow(max_bytes=10)
+
+        t1 = window.acquire()
+        t2 = window.acquire()
+        window.add_bytes(t1, 7)
+        window.add_bytes(t2, 7)
+
+        # soft limit exceeded
+        self.assertIsNone(window.acquire(blocking=False))
+        window.release(t1)
+        self.assertIsNotNone(window.acquire(blocking=False))
+
+    def test_window_close(self):
+        window = Client._InFlightWindow(max_count=1)
+        window.acquire()
+
+        deferred = []
+        window.defer(deferred.append)
+        window.close()
+        self.assertEqual(deferred, [None])
+
+        with self.assertRaises(UseAfterCloseError):
+            window.acquire()
+
+    def test_deferred_failed_on_close(self):
+        with mock.patch.object(Client, 'create_session',
+                               lambda client: self.create_mock_session(client)):
+            client = Client(max_in_flight=1, in_flight_policy='defer', **self.config)
+
+            body = concurrent.futures.Future()
+            f0 = self.submit(client, 0, body)
+            f1 = self.submit(client, 1)
+
+            client.close(wait=False)
+
+            with self.assertRaises(UseAfterCloseError):
+                f1.result()
+
+
+class TestRetrieveAnswers(MockSubmissionBase, unittest.TestCase):
+    """Bulk answer retrieval over a load pool that scales with backlog."""
+
+    class ScalingClient(Client):
+        _LOAD_THREAD_COUNT = 1
+        _LOAD_THREAD_MAX_COUNT = 4
+        _LOAD_THREAD_IDLE_TIMEOUT = 0.1
+
+    def test_retrieve_answers(self):
+        ids = [str(n) for n in range(12)]
+        active = []
+        concurrency = []
+        lock = threading.Lock()
+
+        def create_mock_session(client):
+            def get(path, **kwargs):
+                with lock:
+                    active.append(path)
+                    concurrency.append(len(active))
+                time.sleep(0.05)
+                with lock:
+                    active.remove(path)
+                return choose_reply(path, {
+                    f'problems/{id_}/': self.sapi.complete_reply(id=id_)
+                    for id_ in ids})
+
+            session = mock.Mock()
+            session.get = get
+            return session
+
+        with mock.patch.multiple(Client, create_session=create_mock_session,
+                                 get_solver=lambda client, **kw: Solver(client, self.sapi.solver.data)):
+            with self.ScalingClient(**self.config) as client:
+                futures = client.retrieve_answers(ids + ids[:2])
+
+                self.assertEqual(len(futures), len(ids) + 2)
+                self.assertIs(futures[0], futures[-2])
+                self.assertIs(futures[1], futures[-1])
+
+                for id_, future in zip(ids, futures):
+                    future.result()
+                    self.assertEqual(future.id, id_)
+
+                # one request per (unique) problem, fetched concurrently
+                self.assertEqual(len(concurrency), len(ids))
+                self.assertGreater(max(concurrency), 1)
+                self.assertLessEqual(max(concurrency), 4)
+
+                # idle workers exit
+                time.sleep(0.5)
+                self.assertEqual(len(client._load_workers), 1)
+
+
+class TestJournal(MockSubmissionBase, unittest.TestCase):
+    """Problems unresolved in one client can be resumed in another."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.journal_path = os.path.join(self.tmpdir.name, 'journal.sqlite')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def create_mock_session(self, client, poll_released):
+        def get(path, **kwargs):
+            if path.startswith('problems/?id=123'):
+                poll_released.wait()
+                return choose_reply('problems/?id=123', {
+                    'problems/?id=123': [self.sapi.complete_no_answer_reply(id='123')]})
+            return choose_reply(path, {
+                'problems/123/': self.sapi.complete_reply(id='123')})
+
+        session = mock.Mock()
+        session.post = lambda path, **kwargs: choose_reply(path, {
+            'problems/': [self.sapi.continue_reply(id='123')]})
+        session.get = get
+        return session
+
+    def test_resume(self):
+        poll_released = threading.Event()
+        config = dict(journal=True, journal_path=self.journal_path, **self.config)
+
+        with mock.patch.multiple(
+                Client,
+                create_session=lambda client: self.create_mock_session(client, poll_released),
+                get_solver=lambda client, **kw: Solver(client, self.sapi.solver.data)):
+
+            # first client submits a problem, then "crashes" while polling
+            crashed = Client(**config)
+            solver = Solver(crashed, self.sapi.solver.data)
+            future = solver.sample_qubo({})
+            self.assertEqual(future.wait_id(), '123')
+
+            self.assertEqual(
+                [e.problem_id for e in crashed.journal.pending()], ['123'])
+
+            with Client(**config) as client:
+                # problem is not resumed while handled by a live client
+                self.assertEqual(client.resume_from_journal(), [])
+
+                # second client picks it up once the first one's lease lapses
+                crashed.journal._release_lease()
+                futures = client.resume_from_journal()
+                self.assertEqual(len(futures), 1)
+                futures[0].result()
+                self.assertEqual(futures[0].id, '123')
+
+                # resumed problem is marked resolved
+                self.assertEqual(client.resume_from_journal(), [])
+
+            poll_released.set()
+            crashed.close()
+
+    def test_resume_disabled(self):
+        with Client(**self.config) as client:
+            self.assertIsNone(client.journal)
+            with self.assertRaises(ValueError):
+                client.resume_from_journal()
+
+
+class TestThrottling(MockSubmissionBase, unittest.TestCase):
+    """Throttled (429/503) requests are retried after `Retry-After`."""
+
+    def create_mock_session(self, post_statuses, get_statuses, retry_after='0.1'):
+        headers = {'Retry-After': retry_after}
+
+        def post(path, **kwargs):
+            status = next(post_statuses, 200)
+            return choose_reply(
+                path, {'problems/': [self.sapi.continue_reply(id='123')]}
+                      if status == 200 else {'problems/': 'busy'},
+                statuses={'problems/': iter([status])}, headers=headers)
+
+        def get(path, **kwargs):
+            status = next(get_statuses, 200)
+            path = path.split('&')[0]       # drop long-polling params
+            return choose_reply(
+                path, {'problems/?id=123': [self.sapi.complete_no_answer_reply(id='123')],
+                       'problems/123/': self.sapi.complete_reply(id='123')},
+                statuses={'problems/?id=123': iter([status]),
+                          'problems/123/': iter([200])},
+                headers=headers)
+
+        session = mock.Mock()
+        session.post = post
+        session.get = get
+        return session
+
+    def test_submit_and_poll_throttled(self):
+        session = self.create_mock_session(
+            post_statuses=iter([429, 503]), get_statuses=iter([429]))
+
+        with mock.patch.object(Client, 'create_session', lambda client: session):
+            with Client(**self.config) as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                t = time.monotonic()
+                future = solver.sample_qubo({})
+                future.result()
+                dt = time.monotonic() - t
+
+                self.assertEqual(future.id, '123')
+
+                # all requests waited for the server-requested retry time
+                self.assertGreaterEqual(dt, 3 * 0.1 - 0.01)
+
+                stats = client.rate_limiter.stats
+                self.assertEqual(stats['problems']['pauses'], 3)
+
+    def test_throttle_retries_exhausted(self):
+        session = self.create_mock_session(
+            post_statuses=itertools.repeat(429), get_statuses=iter([]),
+            retry_after='0.01')
+
+        with mock.patch.object(Client, 'create_session', lambda client: session):
+            with mock.patch.object(Client, '_THROTTLE_MAX_RETRIES', 2):
+                with Client(**self.config) as client:
+                    solver = Solver(client, self.sapi.solver.data)
+
+                    future = solver.sample_qubo({})
+                    with self.assertRaises(SolverThrottledError):
+                        future.result()
+
+                    # initial request, plus two retries
+                    self.assertEqual(future._throttle_retries, 3)
+                    stats = client.rate_limiter.stats
+                    self.assertEqual(stats['problems']['pauses'], 3)
+
+    def test_default_retry_after(self):
+        response = choose_reply(
+            'problems/', {'problems/': 'slow down'},
+            statuses={'problems/': iter([503])})
+        limiter = mock.Mock()
+
+        with self.assertRaises(SolverThrottledError) as ctx:
+            Client._sapi_request(lambda path: response, 'problems/',
+                                 limiter=limiter, default_retry_after=0.5)
+
+        self.assertEqual(ctx.exception.retry_after, 0.5)
+        limiter.pause.assert_called_once_with('problems', 0.5)
+
+    def test_throttled_error(self):
+        response = choose_reply(
+            'problems/', {'problems/': 'slow down'},
+            statuses={'problems/': iter([429])}, headers={'Retry-After': '5'})
+        limiter = mock.Mock()
+
+        with self.assertRaises(SolverThrottledError) as ctx:
+            Client._sapi_request(lambda path: response, 'problems/', limiter=limiter)
+
+        self.assertIsInstance(ctx.exception, SolverError)
+        self.assertEqual(ctx.exception.error_code, 429)
+        self.assertEqual(ctx.exception.retry_after, 5)
+        limiter.acquire.assert_called_once_with('problems')
+        limiter.pause.assert_called_once_with('problems', 5)
+
+
 class MockSubmissionWithShortPolling(MockSubmissionBaseTests,
                                      unittest.TestCase):
 
@@ -1202,6 +1908,291 @@ class TestComputationSamplesetCaching(unittest.TestCase):
                 self.assertIsNone(response._sampleset())
 
 
+class TestLazyDecoding(unittest.TestCase):
+    """Future properties decode only their own field of a qp answer."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sapi = StructuredSapiMockResponses()
+
+    def get_future(self, return_matrix=True):
+        solver = Solver(None, self.sapi.solver.data)
+        solver.return_matrix = return_matrix
+        future = Future(solver=solver, id_='123', return_matrix=return_matrix)
+        future._offset = 1.5
+        future._set_message(self.sapi.complete_reply(id='123'))
+        return future
+
+    @parameterized.expand([(True, ), (False, )])
+    def test_fields_match_full_decode(self, return_matrix):
+        expected = self.get_future(return_matrix=return_matrix)
+        expected.result()
+
+        future = self.get_future(return_matrix=return_matrix)
+        with mock.patch.object(Solver, 'decode_response') as decode_response:
+            with mock.patch.object(Solver, '_decode_qp_field',
+                                   autospec=True,
+                                   side_effect=Solver._decode_qp_field) as decode_field:
+                numpy.testing.assert_array_equal(future.energies, expected.energies)
+                numpy.testing.assert_array_equal(future.energies, expected.energies)
+                self.assertEqual(future.timing, expected.timing)
+                self.assertEqual(future.problem_type, expected.problem_type)
+
+                # samples not decoded, and energies decoded only once
+                decode_field.assert_called_once()
+                self.assertEqual(decode_field.call_args.args[2], 'energies')
+
+                numpy.testing.assert_array_equal(future.samples, expected.samples)
+                numpy.testing.assert_array_equal(future.variables, expected.variables)
+                numpy.testing.assert_array_equal(
+                    future.num_occurrences, expected.num_occurrences)
+
+            decode_response.assert_not_called()
+
+        self.assertIsNone(future._result)
+        self.assertIsInstance(future.parse_time, float)
+
+        # full result still available
+        numpy.testing.assert_array_equal(
+            future.result()['energies'], expected.result()['energies'])
+
+    def test_fields_released_on_full_decode(self):
+        from dwave.cloud import coders
+
+        future = self.get_future()
+        samples = future.samples
+        self.assertIn('solutions', future._result_fields)
+        solutions = future._result_fields['solutions']
+
+        # fields decoded individually are reused in the full result
+        with mock.patch.object(coders, 'decode_qp_field',
+                               side_effect=coders.decode_qp_field) as decode_field:
+            result = future.result()
+
+        self.assertIs(result['solutions'], solutions)
+        decoded = [c.args[1] for c in decode_field.call_args_list]
+        self.assertNotIn('solutions', decoded)
+        self.assertIn('energies', decoded)
+
+        # full result supersedes fields decoded individually
+        self.assertEqual(future._result_fields, {})
+        numpy.testing.assert_array_equal(future.samples, samples)
+
+    def test_solutions_field_reuses_active_variables(self):
+        from dwave.cloud import coders
+
+        future = self.get_future()
+        active_variables = future.variables
+
+        with mock.patch('dwave.cloud.solver.decode_qp_field',
+                        side_effect=coders.decode_qp_field) as decode_field:
+            samples = future.samples
+
+        decode_field.assert_called_once()
+        self.assertEqual(decode_field.call_args.args[1], 'solutions')
+        self.assertIs(decode_field.call_args.kwargs['active_variables'], active_variables)
+        numpy.testing.assert_array_equal(
+            samples, self.get_future().result()['solutions'])
+
+    def test_missing_num_occurrences(self):
+        future = self.get_future()
+        del future._message['answer']['num_occurrences']
+
+        numpy.testing.assert_array_equal(future.num_occurrences, [1])
+        self.assertIsNone(future._result)
+
+    def test_non_qp_answer_decoded_fully(self):
+        future = self.get_future()
+        future._message['answer']['format'] = 'unknown'
+
+        with self.assertRaisesRegex(ValueError, 'Unhandled answer encoding'):
+            future.energies
+
+
+class TestPackedSamples(unittest.TestCase):
+
+    def setUp(self):
+        rng = numpy.random.default_rng(0)
+        self.num_variables = 20
+        self.active_variables = numpy.array([0, 1, 2, 4, 5, 8, 9, 10, 11, 15, 19])
+        self.h = {v: rng.normal() for v in self.active_variables}
+        self.J = {(u, v): rng.normal()
+                  for u, v in zip(self.active_variables[:-1], self.active_variables[1:])}
+
+        spins = rng.choice([-1, 1], size=(50, len(self.active_variables)))
+        self.dense = numpy.zeros((50, self.num_variables), dtype=numpy.int8)
+        self.dense[:, self.active_variables] = spins
+
+    def test_pack_unpack(self):
+        samples = PackedSamples.from_dense(self.dense, self.active_variables, 'ising')
+
+        self.assertEqual(len(samples), 50)
+        self.assertEqual(samples.shape, self.dense.shape)
+        self.assertEqual(samples.nbytes, 50 * 2)
+
+        numpy.testing.assert_array_equal(samples.to_array(), self.dense)
+        numpy.testing.assert_array_equal(numpy.asarray(samples), self.dense)
+        numpy.testing.assert_array_equal(
+            samples.to_array(active_only=True), self.dense[:, self.active_variables])
+        numpy.testing.assert_array_equal(list(samples), list(self.dense))
+
+        with mock.patch.object(PackedSamples, '_BLOCK_SIZE', 30):
+            numpy.testing.assert_array_equal(samples.to_array(), self.dense)
+            numpy.testing.assert_array_equal(list(samples), list(self.dense))
+
+    def test_indexing(self):
+        samples = PackedSamples.from_dense(self.dense, self.active_variables, 'ising')
+
+        numpy.testing.assert_array_equal(samples[3], self.dense[3])
+        numpy.testing.assert_array_equal(samples[-1], self.dense[-1])
+        with self.assertRaises(IndexError):
+            samples[50]
+
+        subset = samples[10:20:2]
+        self.assertIsInstance(subset, PackedSamples)
+        numpy.testing.assert_array_equal(subset.to_array(), self.dense[10:20:2])
+
+        subset = samples[numpy.array([5, 1])]
+        numpy.testing.assert_array_equal(subset.to_array(), self.dense[[5, 1]])
+
+    @parameterized.expand([('ising', ), ('qubo', )])
+    def test_energies(self, problem_type):
+        dense = self.dense
+        if problem_type == 'qubo':
+            dense = numpy.full_like(self.dense, 3)
+            dense[:, self.active_variables] = self.dense[:, self.active_variables] > 0
+
+        samples = PackedSamples.from_dense(dense, self.active_variables, problem_type)
+        expected = [evaluate_ising(self.h, self.J, sample, offset=1.5) for sample in dense]
+
+        numpy.testing.assert_array_almost_equal(
+            samples.energies(self.h, self.J, offset=1.5), expected)
+
+        with mock.patch.object(PackedSamples, '_BLOCK_SIZE', 30):
+            numpy.testing.assert_array_almost_equal(
+                samples.energies(self.h, self.J, offset=1.5), expected)
+
+    def test_energies_inactive_variables(self):
+        samples = PackedSamples.from_dense(self.dense, self.active_variables, 'ising')
+
+        # zero biases on inactive variables are ignored
+        energies = samples.energies({**self.h, 3: 0}, {**self.J, (3, 6): 0})
+        numpy.testing.assert_array_almost_equal(energies, samples.energies(self.h, self.J))
+
+        with self.assertRaises(ValueError):
+            samples.energies({3: 1}, {})
+
+    def test_future_packed_samples(self):
+        sapi = StructuredSapiMockResponses()
+        solver = Solver(None, sapi.solver.data)
+        future = Future(solver=solver, id_='123', return_matrix=True)
+        future._set_message(sapi.complete_reply(id='123'))
+
+        # constructed from the raw answer
+        samples = future.packed_samples
+        self.assertIsNone(future._result)
+
+        numpy.testing.assert_array_equal(samples.to_array(), future.samples)
+        self.assertIsNotNone(future.result())
+
+        # repacked from the decoded answer
+        numpy.testing.assert_array_equal(
+            future.packed_samples.packed, samples.packed)
+
+
+class TestGather(unittest.TestCase):
+    """Results of multiple futures are gathered into one batch."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sapi = StructuredSapiMockResponses()
+        cls.solver = Solver(None, cls.sapi.solver.data)
+
+    def make_future(self, id_, spins, energies, num_occurrences, active=(0, 1, 2, 4)):
+        def b64(array):
+            return base64.b64encode(array.tobytes()).decode()
+
+        bits = numpy.array(spins) > 0
+        answer = dict(
+            energies=b64(numpy.array(energies, dtype='<f8')),
+            num_occurrences=b64(numpy.array(num_occurrences, dtype='<i4')),
+            active_variables=b64(numpy.array(active, dtype='<i4')),
+            solutions=b64(numpy.packbits(bits, axis=1)))
+
+        future = Future(solver=self.solver, id_=id_, return_matrix=True)
+        future._set_message(self.sapi.complete_reply(id=id_, answer_patch=answer))
+        return future
+
+    def make_futures(self):
+        return [
+            self.make_future('a', [[1, 1, -1, 1], [-1, -1, -1, -1], [1, 1, -1, 1]],
+                             [-2, 0, -2], [1, 2, 3]),
+            self.make_future('b', [[1, 1, -1, 1], [1, -1, 1, -1]], [-2, 3], [4, 5]),
+        ]
+
+    def test_gather(self):
+        futures = self.make_futures()
+        expected = self.make_futures()
+
+        batch = Future.gather(futures)
+
+        self.assertEqual(len(batch), 5)
+        numpy.testing.assert_array_equal(
+            batch.samples, numpy.vstack([f.samples for f in expected]))
+        numpy.testing.assert_array_equal(
+            batch.energies, numpy.concatenate([f.energies for f in expected]))
+        numpy.testing.assert_array_equal(batch.num_occurrences, [1, 2, 3, 4, 5])
+        numpy.testing.assert_array_equal(batch.problem_index, [0, 0, 0, 1, 1])
+        self.assertEqual(list(batch.row_problem_ids), ['a', 'a', 'a', 'b', 'b'])
+        self.assertIsNone(batch.variables)
+
+        # samples decoded directly into the batch
+        self.assertTrue(all(f._result is None for f in futures))
+        self.assertTrue(all('solutions' not in f._result_fields for f in futures))
+
+    def test_gather_decoded(self):
+        futures = self.make_futures()
+        for future in futures:
+            future.result()
+
+        batch = Future.gather(futures)
+        numpy.testing.assert_array_equal(
+            batch.samples, numpy.vstack([f.samples for f in futures]))
+
+    def test_dedup(self):
+        batch = Future.gather(self.make_futures(), dedup=True)
+
+        # rows are merged within a problem only, so the sample shared by
+        # problems 'a' and 'b' keeps a row (and occurrences) for each
+        self.assertEqual(len(batch), 4)
+        numpy.testing.assert_array_equal(
+            batch.samples[:, [0, 1, 2, 4]],
+            [[1, 1, -1, 1], [-1, -1, -1, -1], [1, 1, -1, 1], [1, -1, 1, -1]])
+        numpy.testing.assert_array_equal(batch.energies, [-2, 0, -2, 3])
+        numpy.testing.assert_array_equal(batch.num_occurrences, [4, 2, 4, 5])
+        self.assertEqual(list(batch.row_problem_ids), ['a', 'a', 'b', 'b'])
+
+    def test_failed_future(self):
+        futures = self.make_futures()
+        failed = Future(solver=self.solver, id_='c')
+        failed._set_exception(ProblemStructureError('failed'))
+
+        with self.assertRaises(ProblemStructureError):
+            Future.gather(futures + [failed])
+
+    def test_timeout(self):
+        pending = Future(solver=self.solver, id_='c')
+        with self.assertRaises(TimeoutError):
+            Future.gather(self.make_futures() + [pending], timeout=0.01)
+
+    def test_different_solvers(self):
+        futures = self.make_futures()
+        futures[1]._message['answer']['num_variables'] = 7
+
+        with self.assertRaises(ValueError):
+            Future.gather(futures)
+
+
 @mock.patch.object(Client, 'create_session', lambda _: mock.Mock())
 class TestClientClose(MockSubmissionBase, unittest.TestCase):
     # exception is raised when client is used after it's been closed
@@ -1434,8 +2425,10 @@ class TestThreadSafety(unittest.TestCase):
                     response = solver.sample_ising(*sapi.problem)
 
                     # run `response.result()` in parallel:
-                    timing = executor.submit(lambda: response.timing)
-                    problem_type = executor.submit(lambda: response.problem_type)
+                    # (note: properties like `timing` decode lazily, bypassing
+                    # `decode_response`)
+                    timing = executor.submit(lambda: response.result()['timing'])
+                    problem_type = executor.submit(lambda: response['problem_type'])
 
                     gate.set()
 
@@ -1523,3 +2516,116 @@ class TestSerialization(unittest.TestCase):
 
                         with self.assertRaises(self.AssertionSatisfied):
                             sample(*problem_args, **user_params).result()
+
+
+class TestAsyncio(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.sapi = StructuredSapiMockResponses()
+
+        def create_mock_session(client):
+            session = mock.Mock()
+            session.post = lambda path, **kwargs: choose_reply(path, {
+                'problems/': [cls.sapi.complete_no_answer_reply(id='123')]})
+            session.get = lambda path, **kwargs: choose_reply(path, {
+                'problems/123/': cls.sapi.complete_reply(id='123')})
+            return session
+
+        cls.create_mock_session = staticmethod(create_mock_session)
+
+    def test_done_callback(self):
+        future = Future(solver=None, id_=None)
+        called = []
+
+        future.add_done_callback(called.append)
+        self.assertEqual(called, [])
+
+        future._result = {}
+        future._signal_ready()
+        self.assertEqual(called, [future])
+
+        # callback added to resolved future is called immediately
+        future.add_done_callback(called.append)
+        self.assertEqual(called, [future, future])
+
+    def test_done_callback_error_is_suppressed(self):
+        future = Future(solver=None, id_=None)
+        called = []
+
+        future.add_done_callback(lambda f: 1/0)
+        future.add_done_callback(called.append)
+
+        future._exception = ValueError()
+        future._signal_ready()
+
+        self.assertEqual(called, [future])
+
+    def test_await_future(self):
+        with mock.patch.object(Client, 'create_session', self.create_mock_session):
+            with Client(endpoint='endpoint', token='token') as client:
+                solver = Solver(client, self.sapi.solver.data)
+
+                linear, quadratic = self.sapi.problem
+                params = dict(num_reads=100)
+
+                async def main():
+                    future = solver.sample_ising(linear, quadratic, **params)
+                    # multiple coroutines can await the same future
+                    return future, await asyncio.gather(future, future)
+
+                future, results = asyncio.run(main())
+
+                for result in results:
+                    self.assertIs(result, future.result())
+                self._check(future, linear, quadratic, **params)
+
+    def test_await_failed_future(self):
+        future = Future(solver=None, id_=None)
+
+        async def main():
+            asyncio.get_running_loop().call_later(
+                0.01, threading.Thread(target=fail).start)
+            return await future
+
+        def fail():
+            future._exception = ValueError('fail')
+            future._signal_ready()
+
+        with self.assertRaisesRegex(ValueError, 'fail'):
+            asyncio.run(main())
+
+    def test_async_client(self):
+        from dwave.cloud.client import AsyncClient
+
+        def get_solver(client, *args, **kwargs):
+            return Solver(client, self.sapi.solver.data)
+
+        with mock.patch.multiple(Client, create_session=self.create_mock_session,
+                                 get_solver=get_solver):
+
+            async def main():
+                async with AsyncClient(endpoint='endpoint', token='token') as client:
+                    self.assertIsInstance(client.client, Client)
+
+                    solver = await client.get_solver()
+
+                    future = solver.sample_ising(*self.sapi.problem, num_reads=100)
+                    result = await future
+                    self.assertEqual(result, future.result())
+
+                    answer = client.retrieve_answer('123')
+                    await answer
+                    self.assertEqual(answer.id, '123')
+
+                    answers = client.retrieve_answers(['123'])
+                    await asyncio.gather(*answers)
+                    self.assertEqual(answers[0].id, '123')
+
+                return client
+
+            client = asyncio.run(main())
+            self.assertTrue(client.client._closed)
+
+    def _check(self, results, linear, quad, num_reads):
+        _QueryTest._check(self, results, linear, quad, num_reads=num_reads)
@@ -327,6 +327,69 @@ class TestUnstructuredSolver(unittest.TestCase):
                             fut.result()
 
 
+    def test_sample_sweep(self):
+        """Problem is uploaded once, and submitted by reference for each
+        parameter set."""
+
+        bqm = dimod.BQM.from_ising({}, {'ab': 1})
+        ss = dimod.ExactSolver().sample(bqm)
+        mock_problem_data_id = 'mock-data-id'
+
+        uploads = []
+        def mock_upload(self, bqm_file):
+            uploads.append(bqm_file)
+            bqm_file.close()
+            return Present(result=mock_problem_data_id)
+
+        submitted = []
+        def post(path, data, **kwargs):
+            problems = orjson.loads(data)
+            submitted.extend(problems)
+            return choose_reply(path, {'problems/': orjson.dumps([
+                orjson.loads(complete_reply_bq(ss, id_=str(p['params']['time_limit'])))[0]
+                for p in problems])})
+
+        session = mock.Mock()
+        session.post = post
+
+        with mock.patch.multiple(Client, create_session=lambda self: session,
+                                 upload_problem_encoded=mock_upload):
+            with Client(endpoint='endpoint', token='token',
+                        compress_qpu_problem_data=False) as client:
+                solver = BQMSolver(client, unstructured_solver_data())
+
+                futs = solver.sample_sweep(bqm, dict(time_limit=[5, 10, 3]))
+
+                self.assertEqual([fut.wait_id() for fut in futs], ['5', '10', '3'])
+                self.assertEqual(len(uploads), 1)
+                self.assertEqual(len(submitted), 3)
+                for problem in submitted:
+                    self.assertEqual(problem['data']['data'], mock_problem_data_id)
+
+                # pre-uploaded problem
+                futs = solver.sample_sweep(mock_problem_data_id, [dict(time_limit=7)])
+                self.assertEqual(futs[0].wait_id(), '7')
+                self.assertEqual(len(uploads), 1)
+
+    def test_sample_sweep_upload_failure(self):
+        bqm = dimod.BQM.from_ising({}, {'ab': 1})
+
+        mock_upload_exc = ValueError('error')
+        def mock_upload(self, bqm_file):
+            return Present(exception=mock_upload_exc)
+
+        with mock.patch.object(Client, 'create_session', lambda self: mock.Mock()):
+            with Client(endpoint='endpoint', token='token') as client:
+                with mock.patch.object(BaseUnstructuredSolver, 'upload_problem', mock_upload):
+                    solver = BQMSolver(client, unstructured_solver_data())
+
+                    futs = solver.sample_sweep(bqm, dict(time_limit=[5, 10]))
+
+                    for fut in futs:
+                        with self.assertRaises(type(mock_upload_exc)):
+                            fut.result()
+
+
 class TestNLSolver(unittest.TestCase):
 
     def setUp(self):
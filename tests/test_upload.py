@@ -24,9 +24,10 @@ from unittest import mock
 from parameterized import parameterized
 
 from dwave.cloud.client import Client
+from dwave.cloud.concurrency import TokenBucket
 from dwave.cloud.exceptions import SAPIError, ProblemUploadError
 from dwave.cloud.upload import (
-    Gettable, GettableFile, GettableMemory, FileView, ChunkedData)
+    Gettable, GettableFile, GettableMemory, FileView, ChunkedData, ThrottledStream)
 from dwave.cloud.utils.time import tictoc
 
 from tests import config
@@ -310,6 +311,76 @@ class TestFileView(unittest.TestCase):
         self.assertEqual(fv[-2:].read(), data[-2:])
 
 
+class TestThrottledStream(unittest.TestCase):
+    data = b'0123456789' * 10
+
+    def test_file_interface(self):
+        data = self.data
+        fv = FileView(GettableMemory(data))
+        ts = ThrottledStream(fv, TokenBucket())
+
+        self.assertEqual(len(ts), len(data))
+        self.assertEqual(ts.read(5), data[:5])
+        self.assertEqual(ts.tell(), 5)
+        self.assertEqual(ts.read(), data[5:])
+
+        self.assertEqual(ts.seek(2), 2)
+        self.assertEqual(fv.tell(), 2)
+        self.assertEqual(ts.read(3), data[2:5])
+
+    def test_reads_limited_to_capacity(self):
+        data = self.data
+        bucket = TokenBucket(rate=1e6, capacity=16)
+        ts = ThrottledStream(FileView(GettableMemory(data)), bucket)
+
+        buf = bytearray(64)
+        self.assertEqual(ts.readinto(buf), 16)
+        self.assertEqual(buf[:16], data[:16])
+
+        # reading all still returns all data
+        self.assertEqual(ts.read(), data[16:])
+
+    def test_tokens_for_bytes_read_only(self):
+        data = self.data
+        bucket = TokenBucket(rate=1e-3, capacity=1000)
+        ts = ThrottledStream(FileView(GettableMemory(data)), bucket)
+
+        # short read takes tokens for the bytes left only
+        ts.seek(90)
+        self.assertEqual(ts.readinto(bytearray(64)), 10)
+        self.assertAlmostEqual(bucket.stats['tokens'], 990, places=0)
+
+        # read at the end of stream takes none
+        self.assertEqual(ts.readinto(bytearray(64)), 0)
+        self.assertEqual(ts.read(), b'')
+        self.assertAlmostEqual(bucket.stats['tokens'], 990, places=0)
+
+    def test_rate(self):
+        bucket = TokenBucket(rate=1000, capacity=50)
+        ts = ThrottledStream(FileView(GettableMemory(self.data)), bucket)
+
+        t = time.monotonic()
+        self.assertEqual(ts.read(), self.data)
+        dt = time.monotonic() - t
+
+        # first 50 bytes are available immediately, then 1000 bytes/sec
+        self.assertGreaterEqual(dt, 0.05 - 0.01)
+
+    def test_part_upload_throttled(self):
+        data = self.data
+        part_generator = lambda: FileView(GettableMemory(data))
+        bandwidth = TokenBucket(rate=1e6)
+
+        session = mock.Mock()
+        with mock.patch.object(Client, '_sapi_request') as sapi_request:
+            Client._upload_multipart_part(
+                session, 'problem-id', 1, part_generator, bandwidth=bandwidth)
+
+            stream = sapi_request.call_args.kwargs['data']
+            self.assertIsInstance(stream, ThrottledStream)
+            self.assertEqual(stream.read(), data)
+
+
 class TestChunkedData(unittest.TestCase):
     data = b'0123456789'
 
@@ -498,6 +569,55 @@ class TestMockedMultipartUpload(unittest.TestCase):
 
                 self.assertEqual(returned_problem_id, upload_problem_id)
 
+                # sessions for problem and part uploads are checked out from
+                # the client's session pool
+                stats = client._session_pool.stats
+                self.assertEqual(stats['created'] + stats['reused'], 1 + len(parts))
+
+    @mock.patch.multiple(Client, _UPLOAD_PART_SIZE_BYTES=2)
+    def test_concurrent_problems_share_part_executor(self):
+        """Parts of problems uploaded concurrently are scheduled by problem."""
+
+        problems = {'id-1': b'12345', 'id-2': b'123'}
+        uploaded = {pid: {} for pid in problems}
+
+        def initiate(session, size):
+            return next(pid for pid, data in problems.items() if len(data) == size)
+
+        def upload_status(session, problem_id):
+            parts = [{'part_number': part_id, 'checksum': checksum}
+                     for part_id, checksum in sorted(uploaded[problem_id].items())]
+            return {'status': 'UPLOAD_IN_PROGRESS', 'parts': parts}
+
+        def upload_part(session, problem_id, part_id, part_generator,
+                        uploaded_part_checksum=None, part_digest=None,
+                        bandwidth=None):
+            checksum = Client._checksum_hex(Client._digest(part_generator().read()))
+            uploaded[problem_id][part_id] = checksum
+            return checksum
+
+        with mock.patch.multiple(
+                Client,
+                create_session=mock.MagicMock(),
+                _initiate_multipart_upload=staticmethod(initiate),
+                _failsafe_get_multipart_upload_status=staticmethod(upload_status),
+                _upload_multipart_part=staticmethod(upload_part),
+                _combine_uploaded_parts=mock.Mock()):
+            with Client(endpoint='endpoint', token='token',
+                        upload_concurrency=2) as client:
+
+                submit = mock.Mock(wraps=client._upload_part_executor.submit)
+                with mock.patch.object(client._upload_part_executor, 'submit', submit):
+                    futures = [client.upload_problem_encoded(data)
+                               for data in problems.values()]
+                    self.assertEqual([f.result() for f in futures], list(problems))
+
+        # parts are grouped by problem, and sized for smallest remaining first
+        scheduled = sorted((c.kwargs['group'], c.args[2], c.kwargs['size'])
+                           for c in submit.call_args_list)
+        self.assertEqual(scheduled, [('id-1', 1, 2), ('id-1', 2, 2), ('id-1', 3, 1),
+                                     ('id-2', 1, 2), ('id-2', 2, 1)])
+
     @mock.patch.multiple(Client, _UPLOAD_PART_SIZE_BYTES=1)
     def test_partial_upload(self):
         """Verify only missing parts are uploaded."""
@@ -768,6 +888,99 @@ class TestMockedMultipartUpload(unittest.TestCase):
                 self.assertEqual(returned_problem_id, upload_problem_id)
 
 
+class TestPartDigest(unittest.TestCase):
+
+    class ReadSpy(FileView):
+        """FileView that records the size of each read."""
+
+        def __init__(self, raw, reads):
+            super().__init__(raw)
+            self.reads = reads
+
+        def readinto(self, b):
+            n = super().readinto(b)
+            self.reads.append(n)
+            return n
+
+    def test_stream_digest(self):
+        data = os.urandom(1000)
+        expected = Client._digest(data)
+
+        with self.subTest("readinto"):
+            reads = []
+            stream = self.ReadSpy(GettableMemory(data), reads)
+            self.assertEqual(Client._stream_digest(stream, buffer_size=64), expected)
+            self.assertLessEqual(max(reads), 64)
+
+        with self.subTest("read"):
+            stream = mock.Mock(spec=['read'])
+            stream.read = io.BytesIO(data).read
+            self.assertEqual(Client._stream_digest(stream, buffer_size=64), expected)
+
+        with self.subTest("empty"):
+            self.assertEqual(Client._stream_digest(io.BytesIO()), Client._digest(b''))
+
+    def test_part_read_in_fixed_buffer(self):
+        data = os.urandom(10000)
+        reads = []
+        part_generator = lambda: self.ReadSpy(GettableMemory(data), reads)
+
+        session = mock.Mock()
+        with mock.patch.object(Client, '_sapi_request') as sapi_request, \
+                mock.patch.object(Client, '_UPLOAD_DIGEST_BUFFER_SIZE_BYTES', 128):
+            checksum = Client._upload_multipart_part(
+                session, 'problem-id', 1, part_generator)
+
+            self.assertEqual(checksum, Client._checksum_hex(Client._digest(data)))
+            self.assertLessEqual(max(reads), 128)
+
+            # part data is passed to the http client as a stream
+            sapi_request.assert_called_once()
+            self.assertIsInstance(sapi_request.call_args.kwargs['data'], FileView)
+
+    def test_precomputed_digest(self):
+        data = b'123'
+        digest = Client._digest(data)
+        part_generator = mock.Mock(side_effect=lambda: io.BytesIO(data))
+
+        session = mock.Mock()
+        with mock.patch.object(Client, '_sapi_request') as sapi_request:
+            with self.subTest("checksum match"):
+                checksum = Client._upload_multipart_part(
+                    session, 'problem-id', 1, part_generator,
+                    uploaded_part_checksum=Client._checksum_hex(digest),
+                    part_digest=digest)
+
+                self.assertEqual(checksum, Client._checksum_hex(digest))
+                part_generator.assert_not_called()
+                sapi_request.assert_not_called()
+
+            with self.subTest("upload"):
+                Client._upload_multipart_part(
+                    session, 'problem-id', 1, part_generator, part_digest=digest)
+
+                # part stream is generated only for upload
+                part_generator.assert_called_once()
+                headers = sapi_request.call_args.kwargs['headers']
+                self.assertEqual(headers['Content-MD5'], Client._checksum_b64(digest))
+
+    @mock.patch('time.sleep', lambda *args: None)
+    def test_digest_not_recomputed_on_retry(self):
+        data = b'123'
+        part_generator = mock.Mock(side_effect=lambda: io.BytesIO(data))
+
+        session = mock.Mock()
+        failures = [ValueError] * Client._UPLOAD_PART_RETRIES + [{}]
+        with mock.patch.object(Client, '_sapi_request', side_effect=failures), \
+                mock.patch.object(Client, '_stream_digest',
+                                  wraps=Client._stream_digest) as stream_digest:
+            Client._upload_multipart_part(session, 'problem-id', 1, part_generator)
+
+        stream_digest.assert_called_once()
+        # one stream for digest, and a fresh one for each upload attempt
+        self.assertEqual(part_generator.call_count, Client._UPLOAD_PART_RETRIES + 2)
+
+
 @unittest.skipUnless(config, "No live server configuration available.")
 class TestMultipartUpload(unittest.TestCase):
     _100gb = 100 * 2**30
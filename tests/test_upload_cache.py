@@ -0,0 +1,183 @@
+# Copyright 2025 D-Wave Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from dwave.cloud.client import Client
+from dwave.cloud.upload_cache import UploadCache
+
+
+class TestUploadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'uploads.sqlite')
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_default_path(self):
+        with mock.patch('dwave.cloud.upload_cache.get_cache_dir',
+                        lambda create: self.tmpdir.name):
+            cache = UploadCache()
+            self.assertEqual(cache.path, self.path)
+            cache.close()
+
+    def test_get_put(self):
+        cache = UploadCache(self.path)
+
+        self.assertIsNone(cache.get('x', 'key'))
+
+        cache.put('x', 'key', 'id-1')
+        self.assertEqual(cache.get('x', 'key'), 'id-1')
+
+        # entries are scoped by endpoint
+        self.assertIsNone(cache.get('y', 'key'))
+
+        # replaced on put
+        cache.put('x', 'key', 'id-2')
+        self.assertEqual(cache.get('x', 'key'), 'id-2')
+
+        cache.discard('x', 'key')
+        self.assertIsNone(cache.get('x', 'key'))
+
+        cache.close()
+
+    def test_expiry(self):
+        cache = UploadCache(self.path, maxage=10)
+
+        with mock.patch('dwave.cloud.upload_cache.time.time', lambda: 1000):
+            cache.put('x', 'key', 'id')
+        with mock.patch('dwave.cloud.upload_cache.time.time', lambda: 1009):
+            self.assertEqual(cache.get('x', 'key'), 'id')
+        with mock.patch('dwave.cloud.upload_cache.time.time', lambda: 1010):
+            self.assertIsNone(cache.get('x', 'key'))
+
+        cache.close()
+
+    def test_persistence(self):
+        cache = UploadCache(self.path)
+        cache.put('x', 'key', 'id')
+        cache.close()
+
+        cache = UploadCache(self.path)
+        self.assertEqual(cache.get('x', 'key'), 'id')
+        cache.close()
+
+    def test_closed(self):
+        cache = UploadCache(self.path)
+        cache.put('x', 'key', 'id')
+        cache.close()
+
+        self.assertIsNone(cache.get('x', 'key'))
+        cache.put('x', 'other', 'id')
+        cache.discard('x', 'key')
+
+
+class TestClientUploadCache(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'uploads.sqlite')
+        self.config = dict(endpoint='endpoint', token='token',
+                           upload_cache=True, upload_cache_path=self.path)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def upload(self, data, status='UPLOAD_COMPLETED', problem_id='problem-id'):
+        """Upload ``data`` with mocked SAPI requests, returning the problem ID,
+        and the mocks of multipart upload initiate and part upload.
+
+        Status of problem data looked up in the cache is ``status``.
+        """
+        initiate = mock.Mock(return_value=problem_id)
+
+        def upload_status(session, pid):
+            if not initiate.called:
+                return {'status': status, 'parts': []}
+            checksum = Client._checksum_hex(Client._digest(data))
+            return {'status': 'UPLOAD_IN_PROGRESS',
+                    'parts': [{'part_number': 1, 'checksum': checksum}]}
+
+        def upload_part(session, problem_id, part_id, part_generator,
+                        uploaded_part_checksum=None, part_digest=None,
+                        bandwidth=None):
+            return Client._checksum_hex(part_digest)
+
+        upload_part = mock.Mock(side_effect=upload_part)
+
+        with mock.patch.multiple(
+                Client,
+                create_session=mock.MagicMock(),
+                _initiate_multipart_upload=initiate,
+                _failsafe_get_multipart_upload_status=staticmethod(upload_status),
+                _upload_multipart_part=upload_part,
+                _combine_uploaded_parts=mock.Mock()):
+            with Client(**self.config) as client:
+                pid = client.upload_problem_encoded(data).result()
+
+        return pid, initiate, upload_part
+
+    def test_hit(self):
+        data = b'problem data'
+
+        # first upload: miss
+        pid, initiate, upload_part = self.upload(data, problem_id='id-1')
+        self.assertEqual(pid, 'id-1')
+        initiate.assert_called_once()
+        upload_part.assert_called_once()
+
+        # precomputed part digest is used for upload
+        part_digest = upload_part.call_args.kwargs['part_digest']
+        self.assertEqual(part_digest, Client._digest(data))
+
+        # second upload: hit
+        pid, initiate, upload_part = self.upload(data, problem_id='id-1')
+        self.assertEqual(pid, 'id-1')
+        initiate.assert_not_called()
+        upload_part.assert_not_called()
+
+        # different content: miss
+        pid, initiate, upload_part = self.upload(b'other data', problem_id='id-2')
+        self.assertEqual(pid, 'id-2')
+        initiate.assert_called_once()
+
+    def test_stale_entry(self):
+        data = b'problem data'
+
+        cache = UploadCache(self.path)
+        key = Client._upload_cache_key(len(data), {1: Client._digest(data)})
+        cache.put('endpoint', key, 'stale-id')
+        cache.close()
+
+        # cached problem data not available => uploaded again, and cached
+        pid, initiate, _ = self.upload(data, status='FAILED', problem_id='new-id')
+        self.assertEqual(pid, 'new-id')
+        initiate.assert_called_once()
+
+        cache = UploadCache(self.path)
+        self.assertEqual(cache.get('endpoint', key), 'new-id')
+        cache.close()
+
+    def test_disabled(self):
+        with Client(endpoint='endpoint', token='token') as client:
+            self.assertIsNone(client.upload_cache)
+
+        with Client(**self.config) as client:
+            self.assertIsInstance(client.upload_cache, UploadCache)
+            self.assertEqual(client.upload_cache.path, self.path)
@@ -24,6 +24,7 @@ import sqlite3
 import subprocess
 import tempfile
 import textwrap
+import threading
 import time
 import unittest
 import uuid
@@ -49,7 +50,8 @@ from dwave.cloud.utils.dist import (
     get_contrib_packages, get_distribution, PackageNotFoundError, VersionNotFoundError)
 from dwave.cloud.utils.exception import hasinstance, exception_chain, is_caused_by
 from dwave.cloud.utils.http import (
-    user_agent, default_user_agent, platform_tags, BaseUrlSessionMixin)
+    user_agent, default_user_agent, platform_tags, BaseUrlSessionMixin, SessionPool,
+    parse_retry_after)
 from dwave.cloud.utils.logging import (
     FilteredSecretsFormatter, configure_logging, parse_loglevel,
     fast_stack, get_caller_name)
@@ -233,6 +235,110 @@ class TestSimpleUtils(unittest.TestCase):
             self.assertEqual(s._request_kwargs.get('test_request'), 'extra')
 
 
+class TestSessionPool(unittest.TestCase):
+
+    def test_reuse(self):
+        pool = SessionPool(factory=mock.Mock, maxsize=2)
+
+        with pool.session() as s1:
+            pass
+        with pool.session() as s2:
+            self.assertIs(s1, s2)
+
+        self.assertEqual(pool.stats, dict(created=1, reused=1))
+
+    def test_concurrent_checkout(self):
+        pool = SessionPool(factory=mock.Mock, maxsize=2)
+
+        with pool.session() as s1:
+            with pool.session() as s2:
+                self.assertIsNot(s1, s2)
+
+        # most recently returned session is reused first
+        with pool.session() as s3:
+            self.assertIs(s3, s1)
+
+        self.assertEqual(pool.stats, dict(created=2, reused=1))
+
+    def test_maxsize(self):
+        pool = SessionPool(factory=mock.Mock, maxsize=1)
+
+        s1, s2 = pool.acquire(), pool.acquire()
+        pool.release(s1)
+        pool.release(s2)
+
+        # excess session is closed
+        s1.close.assert_not_called()
+        s2.close.assert_called_once()
+
+    def test_close(self):
+        pool = SessionPool(factory=mock.Mock, maxsize=2)
+
+        s1, s2 = pool.acquire(), pool.acquire()
+        pool.release(s1)
+
+        pool.close()
+        s1.close.assert_called_once()
+
+        # session returned after close is closed
+        pool.release(s2)
+        s2.close.assert_called_once()
+
+        # new sessions are not created after close
+        with self.assertRaises(RuntimeError):
+            pool.acquire()
+        self.assertEqual(pool.stats, dict(created=2, reused=0))
+
+    def test_release_while_closing(self):
+        pool = SessionPool(factory=mock.Mock)
+        sessions = [pool.acquire() for _ in range(200)]
+
+        def release():
+            for session in sessions:
+                pool.release(session)
+
+        releaser = threading.Thread(target=release)
+        releaser.start()
+        pool.close()
+        releaser.join()
+
+        # every session is closed, either on close or on release
+        for session in sessions:
+            session.close.assert_called_once()
+
+
+class TestParseRetryAfter(unittest.TestCase):
+
+    def test_seconds(self):
+        self.assertEqual(parse_retry_after('120'), 120)
+        self.assertEqual(parse_retry_after(' 1.5 '), 1.5)
+        self.assertEqual(parse_retry_after('-1'), 0)
+
+    def test_date(self):
+        self.assertEqual(parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT'), 0)
+
+        future = time.strftime(
+            '%a, %d %b %Y %H:%M:%S GMT', time.gmtime(time.time() + 60))
+        self.assertAlmostEqual(parse_retry_after(future), 60, delta=2)
+
+        # dates without timezone (e.g. `-0000` zone) are in GMT, not local time
+        naive = time.strftime(
+            '%a, %d %b %Y %H:%M:%S -0000', time.gmtime(time.time() + 60))
+        if not hasattr(time, 'tzset'):
+            return
+        try:
+            with mock.patch.dict(os.environ, TZ='America/Los_Angeles'):
+                time.tzset()
+                self.assertAlmostEqual(parse_retry_after(naive), 60, delta=2)
+        finally:
+            time.tzset()
+
+    def test_invalid(self):
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(''))
+        self.assertIsNone(parse_retry_after('soon'))
+
+
 # initially copied from dwave-hybrid/NumpyEncoder tests, but expanded to cover
 # `coerce_numpy_to_python`
 class TestNumpyTypesEncoding(unittest.TestCase):